@@ -0,0 +1,46 @@
+"""Command line tools.
+
+    python -m chillapi validate-spec [--config api.yaml] [--var var]
+"""
+import argparse
+import sys
+
+from .api import _CONFIG_FILE, ChillApi, CWD
+from .swagger.spec import dumps_spec, get_spec_errors, SPEC_VALIDATION_NEVER
+
+
+def validate_spec_command(config_file: str, export_path: str) -> int:
+    """Validates the OpenAPI document of the api, with all its endpoints, against the OpenAPI 3.0 meta-schema
+
+    :param config_file: str:
+    :param export_path: str:
+
+    """
+    chill_api = ChillApi(config_file=config_file, export_path=export_path, spec_validation=SPEC_VALIDATION_NEVER)
+    errors = get_spec_errors(dumps_spec(chill_api.api.get_swagger_doc()))
+    for error in errors:
+        print(error, end="\n\n", file=sys.stderr)
+    print(f"{len(errors)} errors found in the OpenAPI document" if errors else "The OpenAPI document is valid")
+    return 1 if errors else 0
+
+
+def main(argv: list = None) -> int:
+    """
+
+    :param argv: list:  (Default value = None)
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m chillapi")
+    commands = parser.add_subparsers(dest="command", required=True)
+    validate_spec = commands.add_parser("validate-spec", help="validate the OpenAPI document against the OpenAPI 3.0 meta-schema")
+    validate_spec.add_argument("--config", default=_CONFIG_FILE, help="api config file (default: ./api.yaml)")
+    validate_spec.add_argument("--var", default=f"{CWD}/var", help="directory the api writes to (default: ./var)")
+    args = parser.parse_args(argv)
+
+    if args.command == "validate-spec":
+        return validate_spec_command(args.config, args.var)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
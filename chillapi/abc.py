@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import ContextManager, Iterator, List
 
 from sqlalchemy.engine import CursorResult, Inspector
 from sqlalchemy.orm.scoping import ScopedSession
@@ -28,6 +28,22 @@ class Repository(ABC):
         """
         pass
 
+    @abstractmethod
+    def execute_stream(self, sql, params=None, chunk_size: int = 1000) -> Iterator[List]:
+        """
+
+        :param sql:
+        :param params:  (Default value = None)
+        :param chunk_size: int:  (Default value = 1000)
+
+        """
+        pass
+
+    @abstractmethod
+    def transaction(self) -> ContextManager:
+        """Statements executed inside run in one transaction, committed at the end and rolled back on any error"""
+        pass
+
     @abstractmethod
     def execute_insert(self, sql, params=None) -> CursorResult:
         """
@@ -247,6 +263,50 @@ class AuditLogHandler(Extension):
         self.log(getattr(args, "log"))
 
 
+class CacheBackend(ABC):
+    """Storage of the cached responses, entries are grouped by table so a write can evict all of them at once"""
+
+    @abstractmethod
+    def get(self, table: str, key: str):
+        """
+
+        :param table: str:
+        :param key: str:
+
+        """
+        pass
+
+    @abstractmethod
+    def set(self, table: str, key: str, value, ttl: int, max_entries: int = None):
+        """
+
+        :param table: str:
+        :param key: str:
+        :param value:
+        :param ttl: int:
+        :param max_entries: int:  (Default value = None)
+
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self, table: str):
+        """
+
+        :param table: str:
+
+        """
+        pass
+
+    def stats(self, table: str) -> dict:
+        """
+
+        :param table: str:
+
+        """
+        return {}
+
+
 class AttributeDict(dict):
     """ """
 
@@ -7,27 +7,28 @@ from flask import Flask
 from flask_cors import CORS
 from flask_request_id_header.middleware import RequestID
 from jsonschema import validate, ValidationError
-from openapi_spec_validator import default_handlers, JSONSpecValidatorFactory, SpecValidator
-from openapi_spec_validator.readers import read_from_filename
-from openapi_spec_validator.schemas import read_yaml_file
-from six.moves.urllib import parse, request
 
 from .abc import AttributeDict
 from .app.config import ApiConfig, ChillApiExtensions, ChillApiModuleLoader, CWD
 from .app.error_handlers import register_error_handlers
 from .app.file_utils import read_yaml
 from .app.sitemap import register_routes as register_routes_sitemap
+from .app.startup import StartupReport
 from .app.swagger_schema import Api, swagger
-from .app.swagger_ui import api as api_doc
 from .exceptions.api_manager import ConfigError
+from .http.compression import register_compression
+from .http.json_encoder import set_json_encoder
 from .logger.app_loggers import logger
 from .logger.formatter import CustomEncoder
 from .manager import FlaskApiManager
+from .swagger.spec import dumps_spec, validate_spec
 
 _CONFIG_FILE = f"{CWD}/api.yaml"
 
 
-def ChillApi(app: Flask = None, config_file: str = _CONFIG_FILE, export_path: str = f"{CWD}/var"):
+def ChillApi(
+    app: Flask = None, config_file: str = _CONFIG_FILE, export_path: str = f"{CWD}/var", spec_validation: str = None, startup_profile: bool = None
+):
     """ChillApi Loader.
 
     :param app: param config_file:
@@ -35,18 +36,47 @@ def ChillApi(app: Flask = None, config_file: str = _CONFIG_FILE, export_path: st
     :param app: Flask:  (Default value = None)
     :param config_file: str:  (Default value = _CONFIG_FILE)
     :param export_path: str:  (Default value = f"{CWD}/var")
+    :param spec_validation: str: overrides app.spec_validation  (Default value = None)
+    :param startup_profile: bool: runs the startup under cProfile, if None only when __CHILLAPI_STARTUP_PROFILE__ is set  (Default value = None)
+
+    """
+    if startup_profile is None:
+        startup_profile = os.environ.get("__CHILLAPI_STARTUP_PROFILE__", "") not in ("", "0", "false")
+
+    startup_report = StartupReport(profile=startup_profile)
+    try:
+        chill_api = _create_chill_api(startup_report, app, config_file, export_path, spec_validation)
+    finally:
+        startup_report.finish()
+
+    startup_report.write(f"{export_path}/{chill_api.api_config['app']['name']}_startup")
+    logger.info("Startup", extra={"startup": startup_report.to_dict()})
+
+    return chill_api
+
+
+def _create_chill_api(startup_report: StartupReport, app: Flask, config_file: str, export_path: str, spec_validation: str):
+    """
+
+    :param startup_report: StartupReport:
+    :param app: Flask:
+    :param config_file: str:
+    :param export_path: str:
+    :param spec_validation: str:
 
     """
     if not os.path.exists(export_path):
         os.makedirs(export_path)
     SCHEMA_CONFIG_FILE = os.path.realpath(f"{pathlib.Path(__file__).parent.absolute()}/api.schema.json")
-    api_config = read_yaml(config_file)
-    api_schema = json.load(open(SCHEMA_CONFIG_FILE))
+    with startup_report.phase("read_config"):
+        api_config = read_yaml(config_file)
+        api_schema = json.load(open(SCHEMA_CONFIG_FILE))
 
-    try:
-        validate(instance=api_config, schema=api_schema)
-    except ValidationError as e:
-        raise ConfigError(e)
+    with startup_report.phase("validate_config"):
+        try:
+            validate(instance=api_config, schema=api_schema)
+        except ValidationError as e:
+            raise ConfigError(e)
 
     _app_name = api_config["app"]["name"]
 
@@ -59,13 +89,18 @@ def ChillApi(app: Flask = None, config_file: str = _CONFIG_FILE, export_path: st
     set_api_security(api_config, module_loader)
 
     extensions = ChillApiExtensions(module_loader)
-    config = ApiConfig(**{**api_config, **{"extensions": extensions}})
+    with startup_report.phase("config"):
+        config = ApiConfig(
+            **{**api_config, **{"extensions": extensions, "reflection_path": f"{export_path}/reflection", "startup_report": startup_report}}
+        )
     db = config.db
     data_repository = config.repository
 
-    api_manager = FlaskApiManager(config)
+    api_manager = FlaskApiManager(config, create_cache_backend(api_config, module_loader), f"{export_path}/cache")
 
     register_error_handlers(app)
+    set_json_encoder(config.app["json_encoder"])
+    compression = register_compression(app, config.app["compression"])
     app.config["BASE_DIR"] = CWD
     # app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("__CHILLAPI_DB_DSN__")
     app.config["SECRET_KEY"] = os.environ.get("__CHILLAPI_APP_SECRET_KEY__")
@@ -86,47 +121,39 @@ def ChillApi(app: Flask = None, config_file: str = _CONFIG_FILE, export_path: st
         contact=api_config["app"]["contact"] if "contact" in api_config["app"] else None,
         externalDocs=api_config["app"]["externalDocs"] if "externalDocs" in api_config["app"] else None,
         components={"securitySchemes": api_config["app"]["securitySchemes"] if "securitySchemes" in api_config["app"] else None},
+        swagger_compression=compression if compression is not None and config.app["compression"]["precompress_swagger"] else None,
     )
 
-    api_doc.SwaggerUI(app, title=_app_name, doc=api_config["app"]["swagger_ui_url"], config={"app_name": _app_name})  # Swagger UI config overrides
-
-    api_spec_file = f"{export_path}/api_spec.json"
-
-    if not os.path.exists(api_spec_file):
-        import requests
-
-        url = "https://raw.githubusercontent.com/OAI/OpenAPI-Specification/main/schemas/v3.1/schema.yaml"  # noqa E501
-        r = requests.get(url, allow_redirects=True)
-        open(api_spec_file, "wb").write(r.content)
-
-    path_full = api_spec_file
-    schema_v3 = read_yaml_file(path_full)
-    schema_v3_url = parse.urljoin("file:", request.pathname2url(path_full))
+    if api_config["app"]["swagger_ui_url"]:
+        # flask_restplus is only imported by the nodes serving the Swagger UI
+        from .app.swagger_ui import api as api_doc
 
-    openapi_v3_validator_factory = JSONSpecValidatorFactory(
-        schema_v3,
-        schema_v3_url,
-        resolver_handlers=default_handlers,
-    )
+        # Swagger UI config overrides
+        api_doc.SwaggerUI(app, title=_app_name, doc=api_config["app"]["swagger_ui_url"], config={"app_name": _app_name})
 
-    openapi_v3_spec_validator = SpecValidator(
-        openapi_v3_validator_factory,
-        resolver_handlers=default_handlers,
-    )
+    with startup_report.phase("spec"):
+        swagger_json = dumps_spec(api.get_swagger_doc())
+        with open(f"{export_path}/{_app_name}_swagger.json", "w") as swagger_file:
+            swagger_file.write(swagger_json)
 
-    simplejson.dump(api.get_swagger_doc(), open(f"{export_path}/{_app_name}_swagger.json", "w"), indent=2, cls=CustomEncoder, for_json=True)
+        # do not stop the execution but show a critical
+        spec_validation = config.app["spec_validation"] if spec_validation is None else spec_validation
+        for err in validate_spec(swagger_json, f"{export_path}/{_app_name}_swagger.validation.json", spec_validation):
+            logger.critical(err)
 
-    spec_dict, spec_url = read_from_filename(f"{export_path}/{_app_name}_swagger.json")
+    simplejson.dump(config.to_dict(), open(f"{export_path}/{_app_name}_api.config.json", "w"), indent=2, cls=CustomEncoder, for_json=True)
 
-    # If no exception is raised by validate_spec(), the spec is valid.
-    # do not stop the execution but show a critical
-    errors_iterator = openapi_v3_spec_validator.iter_errors(spec_dict)
-    for _ie, err in enumerate(errors_iterator):
-        logger.critical(err)
+    with startup_report.phase("create_api"):
+        api_manager.create_api(api)
 
-    simplejson.dump(config.to_dict(), open(f"{export_path}/{_app_name}_api.config.json", "w"), indent=2, cls=CustomEncoder, for_json=True)
+    if not config.app["lazy_endpoints"]["enable"]:
+        # lazy endpoints are loaded, and the document serialized, on the first request asking for it
+        with startup_report.phase("swagger_doc"), app.app_context():
+            api.swagger_doc_cache.prepare()
 
-    api_manager.create_api(api)
+    startup_report.count("tables", sum(len(config.database[source_key]["tables"]) for source_key in config.database))
+    startup_report.count("endpoints", len(api.endpoints))
+    startup_report.count("schemas", len(api.get_created_schemas()))
     # register_audit_handler(app, extensions.get_extension("audit"))
 
     if api_config["app"]["debug"]:
@@ -159,10 +186,31 @@ def ChillApi(app: Flask = None, config_file: str = _CONFIG_FILE, export_path: st
             "data_repository": data_repository,
             "module_loader": module_loader,
             "table_extensions": extensions,
+            "response_cache": api_manager.response_cache,
         }
     )
 
 
+def create_cache_backend(api_config, module_loader):
+    """
+
+    :param api_config:
+    :param module_loader:
+
+    """
+    if "cache_backend" not in api_config["app"]:
+        return None
+
+    backend_config = api_config["app"]["cache_backend"]
+    module_loader.add_module(backend_config["package"])
+
+    return module_loader.get_module_attr(
+        backend_config["package"],
+        backend_config["handler"],
+        backend_config["handler_args"] if "handler_args" in backend_config else {},
+    )
+
+
 def set_api_security(api_config, module_loader):
     """
 
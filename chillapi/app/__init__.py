@@ -6,6 +6,18 @@ _app_defaults = {
     "host": "0.0.0.0",
     "port": 8000,
     "debug": True,
+    "single_flight": {"enable": False, "timeout": 10},
+    "lazy_endpoints": {"enable": False, "warm_up": False},
+    "reflection_workers": 4,
+    "json_encoder": "auto",
+    "spec_validation": "cached",
+    "compression": {
+        "enable": False,
+        "encodings": ["br", "zstd", "gzip"],
+        "min_size": 1024,
+        "level": {"gzip": 6, "br": 4, "zstd": 3},
+        "precompress_swagger": False,
+    },
 }
 
 _environment_defaults = {
@@ -30,11 +42,18 @@ _logger_defaults = {
         "output": "stdout",
         "level": 10,
     },
+    "queue": {
+        "enable": False,
+        "max_size": 10000,
+        "drop": "newest",
+        "flush_timeout": 5,
+    },
 }
 
 _database_defaults = {
     "name": None,
     "schema": "public",
+    "reflection": {"snapshot": False, "fingerprint": "auto"},
     "defaults": {
         "tables": {
             "id_field": "id",
@@ -92,6 +111,25 @@ _tables_default_config = {
         "POST": ["SINGLE", "LIST"],
         "DELETE": ["SINGLE", "LIST"],
     },
+    "cache": {
+        "enable": False,
+        "ttl": 60,
+        "max_entries": 1000,
+    },
+    "export": {
+        "enable": False,
+        "format": "text/csv",
+        "chunk_size": 1000,
+    },
+    "stream_body": {
+        "enable": False,
+        "chunk_size": 1000,
+    },
+    "limits": {
+        "max_body_size": None,
+        "max_items": None,
+    },
+    "debug_sample_rate": 1.0,
     "extensions": {
         "audit_logger": {
             "package": "chillapi.extensions.audit",
@@ -126,6 +164,25 @@ _table_default_config = {
         "POST": ["SINGLE", "LIST"],
         "DELETE": ["SINGLE", "LIST"],
     },
+    "cache": {
+        "enable": False,
+        "ttl": 60,
+        "max_entries": 1000,
+    },
+    "export": {
+        "enable": False,
+        "format": "text/csv",
+        "chunk_size": 1000,
+    },
+    "stream_body": {
+        "enable": False,
+        "chunk_size": 1000,
+    },
+    "limits": {
+        "max_body_size": None,
+        "max_items": None,
+    },
+    "debug_sample_rate": 1.0,
     "extensions": {
         "soft_delete": {"enable": False},
         "on_update_timestamp": {"enable": False},
@@ -156,6 +213,9 @@ _sql_default_config = {
     "query_parameters": None,
     "response_schema": None,
     "request_schema": None,
+    "cache": {"enable": False, "ttl": 60, "max_entries": 1000, "invalidated_by": [], "persist": False},
+    "invalidates": [],
+    "debug_sample_rate": 1.0,
 }
 
 _sql_template_default_config = {
@@ -166,4 +226,7 @@ _sql_template_default_config = {
     "query_parameters": None,
     "response_schema": None,
     "request_schema": None,
+    "cache": {"enable": False, "ttl": 60, "max_entries": 1000, "invalidated_by": [], "persist": False},
+    "invalidates": [],
+    "debug_sample_rate": 1.0,
 }
@@ -7,6 +7,7 @@ import slug
 from mergedeep import merge as dict_deepmerge
 from sqlalchemy.engine import Inspector
 from sqlalchemy.orm.scoping import ScopedSession
+from sqlalchemy.pool import SingletonThreadPool
 
 from ..abc import Repository, TableExtension
 from ..app import (
@@ -20,11 +21,13 @@ from ..app import (
     _tables_default_config,
 )
 from ..database.connection import create_db_toolbox, TYPE_RELATIONAL
+from ..database.reflection import map_in_order, SnapshotInspector
 from ..database.repository import DataRepository
 from ..exceptions.api_manager import ColumnNotExist, ConfigError, TableNotExist
 from ..extensions import LIVECYCLE_EXTENSIONS, REQUEST_EXTENSIONS
 from ..extensions.record_livecycle import INTERNAL_EXTENSION_DEFAULTS
 from ..logger.app_loggers import set_logger_config
+from .startup import StartupReport
 
 CWD = os.getcwd()
 
@@ -142,11 +145,8 @@ class ChillApiExtensions(dict):
         )
         extension.validate()
 
-        if source_key not in self.tables.keys():
-            self.tables[source_key] = {}
-        if table_name not in self.tables[source_key].keys():
-            self.tables[source_key][table_name] = {}
-        self.tables[source_key][table_name][extension_name] = extension
+        # tables are loaded in parallel, setdefault never replaces the dict set by another thread
+        self.tables.setdefault(source_key, {}).setdefault(table_name, {})[extension_name] = extension
 
     def set_request_table_extension(self, extension_name: str, extension_config: dict, table_name: str, source_key: str):
         """
@@ -164,12 +164,7 @@ class ChillApiExtensions(dict):
             extension_config["handler_args"],
         )
 
-        if source_key not in self.tables.keys():
-            self.tables[source_key] = {}
-
-        if table_name not in self.tables[source_key].keys():
-            self.tables[source_key][table_name] = {}
-        self.tables[source_key][table_name][extension_name] = extension
+        self.tables.setdefault(source_key, {}).setdefault(table_name, {})[extension_name] = extension
 
     def set_validator_column_table_extension(self, column_name: str, extension_config: dict, table_name: str, source_key: str):
         """
@@ -187,15 +182,8 @@ class ChillApiExtensions(dict):
             extension_config["handler_args"],
         )
 
-        if source_key not in self.tables.keys():
-            self.tables[source_key] = {}
-        if table_name not in self.tables[source_key].keys():
-            self.tables[source_key][table_name] = {}
-        if "validators" not in self.tables[source_key][table_name].keys():
-            self.tables[source_key][table_name]["validators"] = {}
-        if column_name not in self.tables[source_key][table_name]["validators"].keys():
-            self.tables[source_key][table_name]["validators"][column_name] = []
-        self.tables[source_key][table_name]["validators"][column_name].append(extension)
+        table_validators = self.tables.setdefault(source_key, {}).setdefault(table_name, {}).setdefault("validators", {})
+        table_validators.setdefault(column_name, []).append(extension)
 
     def is_extension_enabled(self, extension_name: str, type: str = "app") -> bool:
         """
@@ -252,8 +240,18 @@ class ApiConfig:
     db: Dict[str, ScopedSession] = {}
     db_inspector: Dict[str, Inspector] = {}
 
-    def __init__(self, extensions: ChillApiExtensions, app: dict, environment: dict = None, logger: dict = None, database: dict = None):
+    def __init__(
+        self,
+        extensions: ChillApiExtensions,
+        app: dict,
+        environment: dict = None,
+        logger: dict = None,
+        database: dict = None,
+        reflection_path: str = None,
+        startup_report: StartupReport = None,
+    ):
         self.extensions = extensions
+        self.startup_report = StartupReport() if startup_report is None else startup_report
         app = {} if app is None else app
         environment = {} if environment is None else environment
         logger = {} if logger is None else logger
@@ -273,6 +271,7 @@ class ApiConfig:
         for _env_key in self.environment.keys():
             os.environ.setdefault(_env_key, self.environment[_env_key])
 
+        relational_sources = []
         for source_key in database.keys():
             self.database[source_key] = dict(dict_deepmerge({}, _database_defaults, database[source_key]))
             if "defaults" in self.database[source_key] and "tables" in self.database[source_key]["defaults"]:
@@ -287,7 +286,7 @@ class ApiConfig:
             if "sql" in self.database[source_key] and len(self.database[source_key]["sql"]) > 0:
                 self.database[source_key]["sql"] = [dict(dict_deepmerge({}, _sql_default_config, t)) for t in self.database[source_key]["sql"]]
 
-            if "templates" in self.database and len(self.database["templates"]) > 0:
+            if "templates" in self.database[source_key] and len(self.database[source_key]["templates"]) > 0:
                 self.database[source_key]["templates"] = [
                     dict(dict_deepmerge({}, _sql_template_default_config, t)) for t in self.database[source_key]["templates"]
                 ]
@@ -298,17 +297,55 @@ class ApiConfig:
             self.db_inspector[source_key] = db_tools["inspector"]
             type = db_tools["type"]
 
+            reflection = self.database[source_key]["reflection"]
+            if type == TYPE_RELATIONAL and reflection["snapshot"] and reflection_path is not None:
+                self.db_inspector[source_key] = SnapshotInspector(
+                    db_tools["inspector"],
+                    self.database[source_key]["dsn"],
+                    self.database[source_key]["schema"],
+                    reflection_path,
+                    reflection["fingerprint"],
+                )
+
             self.repository[source_key] = DataRepository(self.db[source_key])
 
             if type == TYPE_RELATIONAL:
-                _db_tables = self.db_inspector[source_key].get_table_names()
+                relational_sources.append(source_key)
+
+        self.reflect(relational_sources)
+
+    def reflect(self, source_keys: List[str]):
+        """Reads the tables and columns of the relational sources and loads their table extensions, on up to
+        `app.reflection_workers` threads, each one with its own connection
+
+        :param source_keys: List[str]:
+
+        """
+        workers = self.app["reflection_workers"]
+        # in memory sqlite databases are not shared between threads
+        if any(isinstance(self.db_inspector[source_key].bind.pool, SingletonThreadPool) for source_key in source_keys):
+            workers = 1
+
+        with self.startup_report.phase("reflection"):
+            db_tables = map_in_order(lambda source_key: self.db_inspector[source_key].get_table_names(), source_keys, workers)
+            for source_key, _db_tables in zip(source_keys, db_tables):
                 for key, _table in enumerate(self.database[source_key]["tables"]):
                     _table_name = _table["name"]
                     if _table_name not in _db_tables:
                         raise TableNotExist(f"Table {_table_name} do not exist!")
 
-                self.load_table_columns(source_key)
-                self.load_extensions(source_key)
+            tables = [(source_key, table) for source_key in source_keys for table in self.database[source_key]["tables"]]
+            columns = map_in_order(lambda source_table: self.get_table_columns(source_table[1]["name"], source_table[0]), tables, workers)
+            for (source_key, table), _table_columns in zip(tables, columns):
+                table["columns"] = _table_columns
+
+        with self.startup_report.phase("extensions"):
+            map_in_order(lambda source_table: self.load_table_extensions(source_table[1], source_table[0]), tables, workers)
+
+        with self.startup_report.phase("reflection"):
+            for source_key in source_keys:
+                if isinstance(self.db_inspector[source_key], SnapshotInspector):
+                    self.db_inspector[source_key].save()
 
     def _init_tables(self, source_key):
         """ """
@@ -442,8 +479,17 @@ class ApiConfig:
         #     self.extensions.set_extension("audit", self.database[source_key]["defaults"]["tables"]["extensions"]["audit_logger"])
 
         for _it, table in enumerate(self.database[source_key]["tables"]):
-            for _extension_name in table["extensions"].keys():
-                self.load_extension(table, _extension_name, source_key)
+            self.load_table_extensions(table, source_key)
+
+    def load_table_extensions(self, table_config: dict, source_key: str):
+        """
+
+        :param table_config: dict:
+        :param source_key: str:
+
+        """
+        for _extension_name in table_config["extensions"].keys():
+            self.load_extension(table_config, _extension_name, source_key)
 
     def to_dict(self):
         """ """
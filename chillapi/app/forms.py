@@ -1,8 +1,11 @@
 import json
+from typing import Callable, List, Tuple
 
 import wtforms_json
 from wtforms import BooleanField, DateTimeField, Field, fields, FloatField, Form, IntegerField, StringField
-from wtforms.validators import DataRequired, ValidationError
+from wtforms import validators as wtforms_validators
+from wtforms.utils import unset_value
+from wtforms.validators import DataRequired, Length, ValidationError
 
 from ..app.swagger_schema import Schema as SwaggerSchema
 from ..swagger.jsonschema import WTFormToJSONSchema
@@ -86,7 +89,8 @@ def column_to_flask_form_property(column_name: str, column_info: dict, extension
     """
     validators = []
     if "validators" in extensions and column_name in extensions["validators"]:
-        validators = extensions["validators"][column_name]
+        # a copy, the extension list is shared by the forms of all the table endpoints
+        validators = list(extensions["validators"][column_name])
 
     if column_info["nullable"] is False:
         validators.append(DataRequired())
@@ -131,3 +135,210 @@ def create_form_class(class_name: str, method: str, columns_map: dict, extension
     FormResource.__name__ = f'{class_name}{method.replace("_", " ").title().replace(" ", "")}Form'
 
     return FormResource
+
+
+# validators only looking at the data of their field, they can run on a field reused for all the rows
+_FIELD_VALIDATORS = tuple(
+    getattr(wtforms_validators, name)
+    for name in [
+        "DataRequired",
+        "InputRequired",
+        "Optional",
+        "Length",
+        "NumberRange",
+        "AnyOf",
+        "NoneOf",
+        "Regexp",
+        "Email",
+        "URL",
+        "UUID",
+        "IPAddress",
+        "MacAddress",
+    ]
+)
+_KERNEL_FIELDS = (StringField, IntegerField, FloatField, DateTimeField, BooleanField)
+
+
+class BatchFormValidator:
+    """Validates the items of a list body with a form class, column by column on a single set of bound fields instead of a form per item.
+
+    The errors and the data are the ones of `form_class(data=item).validate()`. Types, nullability (DataRequired) and lengths of the plain
+    fields are checked inline, any other field runs its own WTForms process and validation. Forms with validators that can look at
+    other fields (custom ones, EqualTo, `validate_<field>` methods) are validated a form per item as always.
+    """
+
+    def __init__(self, form_class):
+        self.form_class = form_class
+        self.form = form_class()
+        self.fallback = any(
+            getattr(form_class, f"validate_{name}", None) is not None
+            or not all(isinstance(validator, _FIELD_VALIDATORS) for validator in field.validators)
+            for name, field in self.form._fields.items()
+        )
+        self.columns = [self._compile_column(field) for field in self.form._fields.values()]
+
+    def validate(self, items: List) -> Tuple[List[dict], dict]:
+        """Data of every item and the errors of the invalid ones by index
+
+        :param items: List:
+
+        """
+        if self.fallback or not all(isinstance(item, dict) for item in items):
+            return self._validate_forms(items)
+
+        rows = [{} for _ in items]
+        errors = {}
+        for column in self.columns:
+            column(items, rows, errors)
+
+        return rows, {i: errors[i] for i in sorted(errors.keys())}
+
+    def _validate_forms(self, items: List) -> Tuple[List[dict], dict]:
+        """
+
+        :param items: List:
+
+        """
+        rows = []
+        errors = {}
+        for i, item in enumerate(items):
+            form = self.form_class(data=item)
+            if not form.validate():
+                errors[i] = form.errors
+            rows.append(form.data)
+        return rows, errors
+
+    def _compile_column(self, field: Field) -> Callable:
+        """
+
+        :param field: Field: bound field of the form, reused for all the rows when the column runs through WTForms
+
+        """
+        required = [validator for validator in field.validators if type(validator) is DataRequired]
+        lengths = [validator for validator in field.validators if type(validator) is Length]
+        if (
+            type(field) not in _KERNEL_FIELDS
+            or field.default is not None
+            or field.filters
+            or len(required) + len(lengths) < len(field.validators)
+            or (lengths and type(field) is not StringField)
+        ):
+            return self._compile_field(field)
+
+        return self._compile_kernel(field, required, lengths)
+
+    def _compile_field(self, field: Field) -> Callable:
+        """The column through the WTForms process and validation of the field
+
+        :param field: Field:
+
+        """
+        name = field.name
+        form = self.form
+
+        def run_field(items: List, rows: List[dict], errors: dict):
+            """
+
+            :param items: List:
+            :param rows: List[dict]:
+            :param errors: dict:
+
+            """
+            for i, item in enumerate(items):
+                field.process(None, item.get(name, unset_value))
+                field.validate(form)
+                rows[i][name] = field.data
+                if field.errors:
+                    errors.setdefault(i, {})[name] = field.errors
+
+        return run_field
+
+    def _compile_kernel(self, field: Field, required: List[DataRequired], lengths: List[Length]) -> Callable:
+        """The column converted and checked inline, for plain fields only validated by DataRequired and Length
+
+        :param field: Field:
+        :param required: List[DataRequired]:
+        :param lengths: List[Length]:
+
+        """
+        name = field.name
+        form = self.form
+
+        # DataRequired drops any other error, wherever it is in the chain
+        required_message = None
+        if required:
+            required_message = required[0].message if required[0].message is not None else field.gettext("This field is required.")
+        convert = _KERNEL_CONVERTERS[type(field)]
+        convert_error = field.gettext(_KERNEL_CONVERT_ERRORS.get(type(field), ""))
+
+        def check_lengths(data, field_errors):
+            """
+
+            :param data:
+            :param field_errors:
+
+            """
+            for validator in lengths:
+                length = len(data) if data else 0
+                if length < validator.min or validator.max != -1 and length > validator.max:
+                    field.data = data
+                    try:
+                        validator(form, field)
+                    except ValueError as e:
+                        field_errors = (field_errors or []) + [e.args[0]]
+            return field_errors
+
+        def run_kernel(items: List, rows: List[dict], errors: dict):
+            """
+
+            :param items: List:
+            :param rows: List[dict]:
+            :param errors: dict:
+
+            """
+            for i, item in enumerate(items):
+                try:
+                    data = convert(item.get(name))
+                    process_errors = None
+                except (ValueError, TypeError):
+                    data = None
+                    process_errors = [convert_error]
+
+                if required_message is not None and (not data or isinstance(data, str) and not data.strip()):
+                    field_errors = [required_message]
+                else:
+                    field_errors = check_lengths(data, process_errors)
+
+                rows[i][name] = data
+                if field_errors:
+                    errors.setdefault(i, {})[name] = field_errors
+
+        return run_kernel
+
+
+def _to_string(value):
+    """StringField data as wtforms_json leaves it
+
+    :param value:
+
+    """
+    return str(value) if value else None
+
+
+def _to_integer(value):
+    """
+
+    :param value:
+
+    """
+    return None if value is None else int(value)
+
+
+_KERNEL_CONVERTERS = {
+    StringField: _to_string,
+    IntegerField: _to_integer,
+    FloatField: lambda value: value,
+    DateTimeField: lambda value: value,
+    BooleanField: bool,
+}
+_KERNEL_CONVERT_ERRORS = {IntegerField: "Not a valid integer value"}
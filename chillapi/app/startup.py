@@ -0,0 +1,82 @@
+"""Time spent in every phase of the api startup.
+
+ChillApi() measures its phases (config read and validation, reflection, extensions, endpoints, spec...) and the counts
+of tables, endpoints and schemas created, logs them as one record and writes them to `var/<app>_startup.json`. With a
+profile the whole startup also runs under cProfile, dumped to `var/<app>_startup.prof`.
+"""
+import cProfile
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import simplejson
+
+
+class StartupReport:
+    """ """
+
+    def __init__(self, profile: bool = False):
+        self.started = time.perf_counter()
+        self.total = None
+        self.phases = {}
+        self.counts = {}
+        self.profiler = cProfile.Profile() if profile else None
+        self._nested = []
+        if self.profiler is not None:
+            self.profiler.enable()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Adds the time spent in the block to the phase. The time of the phases nested in it is only counted in them
+
+        :param name: str:
+
+        """
+        started = time.perf_counter()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            nested = self._nested.pop()
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed - nested
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def count(self, name: str, value: int):
+        """
+
+        :param name: str:
+        :param value: int:
+
+        """
+        self.counts[name] = value
+
+    def finish(self):
+        """Stops the clock, and the profiler"""
+        if self.total is None:
+            self.total = time.perf_counter() - self.started
+        if self.profiler is not None:
+            self.profiler.disable()
+
+    def to_dict(self) -> dict:
+        """Seconds per phase, `other` being the time out of any of them"""
+        total = self.total if self.total is not None else time.perf_counter() - self.started
+        phases = {name: round(elapsed, 6) for name, elapsed in self.phases.items()}
+        phases["other"] = round(max(total - sum(self.phases.values()), 0.0), 6)
+        return {"total": round(total, 6), "phases": phases, "counts": dict(self.counts)}
+
+    def write(self, path: str):
+        """Writes the report to `<path>.json` and the profile, if any, to `<path>.prof`
+
+        :param path: str: without extension
+
+        """
+        # written aside and renamed, workers starting at the same time never read half written reports
+        tmp_path = f"{path}.json.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as report_file:
+            simplejson.dump(self.to_dict(), report_file, indent=2)
+        os.replace(tmp_path, f"{path}.json")
+        if self.profiler is not None:
+            self.profiler.dump_stats(f"{path}.prof")
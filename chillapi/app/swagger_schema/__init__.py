@@ -1,5 +1,7 @@
 import copy
 import inspect
+import threading
+from typing import Callable, List
 
 from flask import Blueprint, request
 from flask_restful import abort as flask_abort, Api as restful_Api, Resource as flask_Resource
@@ -52,6 +54,7 @@ def auth_required(f):
         :param **kwargs:
 
         """
+        # extract_swagger_path is cached and filled as the rules are registered, see Api._register_view
         if not auth(request, extract_swagger_path(request.url_rule.rule), request.method):
             abort(401)
         return f(*args, **kwargs)
@@ -101,6 +104,10 @@ class Api(restful_Api):
         add_api_spec_resource = kwargs.pop("add_api_spec_resource", True)
         api_version = kwargs.pop("version", None)
         servers = kwargs.pop("servers", None)
+        swagger_compression = kwargs.pop("swagger_compression", None)
+        self.swagger_doc_cache = None
+        self._lazy_resources = []
+        self._lazy_lock = threading.RLock()
 
         super().__init__(*args, **kwargs)
 
@@ -120,9 +127,11 @@ class Api(restful_Api):
                 f"{api_spec_url}.html",
             ]
 
-            self.add_resource(
-                create_swagger_endpoint(self.get_swagger_doc(), _security_level=self._security_level), *api_spec_urls, endpoint="swagger"
+            swagger_endpoint = create_swagger_endpoint(
+                self._swagger_object, _security_level=self._security_level, load=self.load_lazy_resources, compression=swagger_compression
             )
+            self.swagger_doc_cache = swagger_endpoint.swagger_doc_cache
+            self.add_resource(swagger_endpoint, *api_spec_urls, endpoint="swagger")
 
     def add_resource(self, resource: Resource, *urls, **kwargs):
         """
@@ -132,6 +141,51 @@ class Api(restful_Api):
         :param *urls:
         :param **kwargs:
 
+        """
+        self._add_path_item(resource, urls)
+        super().add_resource(resource, *urls, **kwargs)
+
+    def add_lazy_resource(self, load: Callable[[], type], methods: List[str], *urls, **kwargs):
+        """
+        Adds a Flask Resource to the API without creating it. The resource class is loaded, and its docs added to the
+        swagger document, on the first request to it or when the swagger document is asked for
+
+        :param load: Callable[[], type]: returns the resource class
+        :param methods: List[str]: HTTP methods of the resource
+        :param *urls:
+        :param **kwargs:
+
+        """
+        lazy_resource = _LazyResource(self, load, urls)
+        self._lazy_resources.append(lazy_resource)
+        super().add_resource(create_lazy_resource_class(lazy_resource, methods), *urls, **kwargs)
+
+    def _register_view(self, app, resource, *urls, **kwargs):
+        """
+        Registers the resource rules, converting each to its swagger path for auth_required
+
+        :param app:
+        :param resource:
+        :param *urls:
+        :param **kwargs:
+
+        """
+        super()._register_view(app, resource, *urls, **kwargs)
+        if not self.blueprint:
+            for url in urls:
+                extract_swagger_path(self._complete_url(url, ""))
+
+    def load_lazy_resources(self):
+        """Loads every lazy resource not loaded yet"""
+        for lazy_resource in self._lazy_resources:
+            lazy_resource.load()
+
+    def _add_path_item(self, resource: Resource, urls):
+        """
+
+        :param resource: Resource:
+        :param urls:
+
         """
         path_item = {}
         # definitions = {}
@@ -169,13 +223,68 @@ class Api(restful_Api):
                     url = self.blueprint.url_prefix + url
                 self._swagger_object["paths"][extract_swagger_path(url)] = path_item
 
-        super().add_resource(resource, *urls, **kwargs)
+        if self.swagger_doc_cache is not None:
+            self.swagger_doc_cache.clear()
+
+    def get_created_schemas(self) -> dict:
+        """Schemas of the resources created so far, the lazy ones not loaded yet are not there"""
+        return self._swagger_object["components"].get("schemas") or {}
 
     def get_swagger_doc(self):
         """Returns the swagger document object."""
+        self.load_lazy_resources()
         return self._swagger_object
 
 
+class _LazyResource:
+    """Resource class loaded once, by the first thread asking for it"""
+
+    def __init__(self, api: Api, load: Callable[[], type], urls):
+        self.api = api
+        self._load = load
+        self.urls = urls
+        self.resource = None
+
+    def load(self) -> type:
+        """ """
+        if self.resource is None:
+            with self.api._lazy_lock:
+                if self.resource is None:
+                    resource = self._load()
+                    self.api._add_path_item(resource, self.urls)
+                    self.resource = resource
+        return self.resource
+
+
+def create_lazy_resource_class(lazy_resource: _LazyResource, methods: List[str]):
+    """Resource standing for a lazy resource, the requests are dispatched to the resource class once it is loaded
+
+    :param lazy_resource: _LazyResource:
+    :param methods: List[str]:
+
+    """
+
+    class LazyResource(Resource):
+        """ """
+
+        def __init__(self, *args, **kwargs):
+            self.resource_args = args
+            self.resource_kwargs = kwargs
+
+        def dispatch_request(self, *args, **kwargs):
+            """
+
+            :param *args:
+            :param **kwargs:
+
+            """
+            resource = lazy_resource.load()(*self.resource_args, **self.resource_kwargs)
+            return resource.dispatch_request(*args, **kwargs)
+
+    LazyResource.methods = {method.upper() for method in methods}
+    return LazyResource
+
+
 class Extractor:
     """Extracts swagger.doc object to proper swagger representation by extractor implementation"""
 
@@ -1,11 +1,18 @@
 import collections
 import copy
+import hashlib
 import inspect
 import re
-from functools import wraps
+import threading
+from functools import lru_cache, wraps
+from typing import Callable
 
-from flask import request
+from flask import current_app, request
 from flask_restful import inputs, reqparse, Resource
+from werkzeug.http import is_resource_modified
+
+from ...http.compression import compress, ResponseCompression
+from ...http.json_encoder import make_json_response
 
 
 class ValidationError(ValueError):
@@ -37,54 +44,161 @@ def _auth(*args, **kwargs):
     return auth(*args, **kwargs)
 
 
-def create_swagger_endpoint(swagger_object, _security_level: str = "STANDARD"):
+def filter_swagger_doc(swagger_object: dict, allowed_operations: frozenset = None) -> dict:
+    """Swagger document without empty values, and only with the allowed operations
+
+    :param swagger_object: dict:
+    :param allowed_operations: frozenset: (path, method) pairs, all of them if None  (Default value = None)
+
+    """
+    swagger_doc = {}
+    # filter keys with empty values
+    for k, v in swagger_object.items():
+        if v or k == "paths":
+            if k == "paths":
+                paths = {}
+                for endpoint, view in v.items():
+                    views = {}
+                    for method, docs in view.items():
+                        if allowed_operations is None or (endpoint, method) in allowed_operations:
+                            views[method] = docs
+                    if views:
+                        paths[endpoint] = views
+                swagger_doc["paths"] = collections.OrderedDict(sorted(paths.items()))
+            else:
+                swagger_doc[k] = v
+
+        if k == "servers":
+            if isinstance(v, list):
+                for server in v:
+                    validate_server_object(server)
+                    continue
+            else:
+                raise ValidationError(
+                    "Invalid servers. must a list. See {url}".format(field=k, url="http://swagger.io/specification/#infoObject")  # noqa F522
+                )
+
+        if k == "info":
+            validate_info_object(v)
+            continue
+
+    return swagger_doc
+
+
+class _SerializedSwaggerDoc:
+    """Swagger document encoded once, and compressed once with every encoding when `compression` is given"""
+
+    def __init__(self, swagger_doc: dict, compression: ResponseCompression = None):
+        self.body = make_json_response(swagger_doc).get_data()
+        self.etag = hashlib.sha256(self.body).hexdigest()
+        self.compression = compression
+        self.encoded = {}
+        if compression is not None:
+            self.encoded = {encoding: compress(encoding, compression.level[encoding], self.body) for encoding in compression.encodings}
+
+    def make_response(self):
+        """Encoded document with a strong ETag per encoding, a 304 when the client copy matches it"""
+        body, etag, encoding = self.body, self.etag, None
+        if self.compression is not None:
+            encoding = self.compression.negotiate()
+            if encoding is not None:
+                body, etag = self.encoded[encoding], f"{self.etag}-{encoding}"
+
+        if not is_resource_modified(request.environ, etag=etag):
+            response = current_app.response_class(status=304)
+        else:
+            response = current_app.response_class(body, mimetype=current_app.config["JSONIFY_MIMETYPE"])
+            if encoding is not None:
+                response.headers["Content-Encoding"] = encoding
+        if self.compression is not None:
+            response.vary.add("Accept-Encoding")
+        response.set_etag(etag)
+        return response
+
+
+class SwaggerDocCache:
+    """Filtered swagger documents, serialized once per security level. With the STRICT level every set of operations a
+    client is allowed to see is a different document, the last `max_entries` of them are kept
+    """
+
+    max_entries = 32
+
+    def __init__(self, swagger_object: dict, security_level: str = "STANDARD", compression: ResponseCompression = None):
+        self.swagger_object = swagger_object
+        self.security_level = security_level
+        self.compression = compression
+        self._docs = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Forgets the serialized documents, the swagger object changed"""
+        with self._lock:
+            self._docs.clear()
+
+    def _get_allowed_operations(self) -> frozenset:
+        """(path, method) pairs the request is allowed to see, None if it can see all of them"""
+        if self.security_level == "STANDARD":
+            return None
+        # check permissions. If a user has not access to an api, do not show the docs of it
+        return frozenset(
+            (endpoint, method)
+            for endpoint, view in self.swagger_object["paths"].items()
+            for method in view.keys()
+            if self.security_level == "STRICT" and auth(request_obj=request, endpoint=endpoint, method=method)
+        )
+
+    def get(self, allowed_operations: frozenset = None) -> _SerializedSwaggerDoc:
+        """
+
+        :param allowed_operations: frozenset:  (Default value = None)
+
+        """
+        with self._lock:
+            doc = self._docs.get(allowed_operations)
+            if doc is not None:
+                self._docs.move_to_end(allowed_operations)
+                return doc
+
+        doc = _SerializedSwaggerDoc(filter_swagger_doc(self.swagger_object, allowed_operations), self.compression)
+        with self._lock:
+            self._docs[allowed_operations] = doc
+            while len(self._docs) > self.max_entries:
+                self._docs.popitem(last=False)
+        return doc
+
+    def prepare(self):
+        """Serializes the document every client sees. Needs an app context"""
+        if self.security_level == "STANDARD":
+            self.get()
+
+    def make_response(self):
+        """ """
+        return self.get(self._get_allowed_operations()).make_response()
+
+
+def create_swagger_endpoint(
+    swagger_object, _security_level: str = "STANDARD", load: Callable[[], None] = None, compression: ResponseCompression = None
+):
     """Creates a flask_restful api endpoint for the swagger spec
 
     :param swagger_object:
     :param _security_level: str:  (Default value = "STANDARD")
+    :param load: Callable[[], None]: completes `swagger_object` before it is served  (Default value = None)
+    :param compression: ResponseCompression: pre-compresses the document with its encodings  (Default value = None)
 
     """
+    doc_cache = SwaggerDocCache(swagger_object, _security_level, compression)
 
     class SwaggerEndpoint(Resource):
         """ """
 
+        swagger_doc_cache = doc_cache
+
         def get(self):
             """ """
-            swagger_doc = {}
-            # filter keys with empty values
-            for k, v in swagger_object.items():
-                if v or k == "paths":
-                    if k == "paths":
-                        paths = {}
-                        for endpoint, view in v.items():
-                            views = {}
-                            for method, docs in view.items():
-                                # check permissions. If a user has not access to an api, do not show the docs of it
-                                if _security_level == "STRICT" and auth(request_obj=request, endpoint=endpoint, method=method):
-                                    views[method] = docs
-                                if _security_level == "STANDARD":
-                                    views[method] = docs
-                            if views:
-                                paths[endpoint] = views
-                        swagger_doc["paths"] = collections.OrderedDict(sorted(paths.items()))
-                    else:
-                        swagger_doc[k] = v
-
-                if k == "servers":
-                    if isinstance(v, list):
-                        for server in v:
-                            validate_server_object(server)
-                            continue
-                    else:
-                        raise ValidationError(
-                            "Invalid servers. must a list. See {url}".format(field=k, url="http://swagger.io/specification/#infoObject")  # noqa F522
-                        )
-
-                if k == "info":
-                    validate_info_object(v)
-                    continue
-
-            return swagger_doc
+            if load is not None:
+                load()
+            return doc_cache.make_response()
 
     return SwaggerEndpoint
 
@@ -268,6 +382,14 @@ def doc(operation_object):
         """
         f.__swagger_operation_object = copy.deepcopy(operation_object)
 
+        # Get names of resource function arguments, once: they are the same on every request
+        func_args = inspect.getfullargspec(f).args
+        # without the special argument '_parser' there is nothing to add, the method is called as it is
+        if "_parser" not in func_args:
+            return f
+
+        parsers = []
+
         @wraps(f)
         def inner(self, *args, **kwargs):
             """
@@ -276,15 +398,11 @@ def doc(operation_object):
             :param **kwargs:
 
             """
-            # Get names of resource function arguments
-
-            func_args = inspect.getfullargspec(f).args
-            # You can also use
-            # func_args = list(inspect.signature(f).parameters.keys())
-
-            # Add a parser for query arguments if the special argument '_parser' is present
-            if "parameters" in f.__swagger_operation_object and "_parser" in func_args:
-                kwargs.update({"_parser": get_parser(f.__swagger_operation_object["parameters"])})
+            # Add a parser for query arguments, built on the first request from the parameters documented by then
+            if "parameters" in f.__swagger_operation_object:
+                if not parsers:
+                    parsers.append(get_parser(f.__swagger_operation_object["parameters"]))
+                kwargs.update({"_parser": parsers[0]})
 
             return f(self, *args, **kwargs)
 
@@ -798,6 +916,7 @@ def validate_example_object(example_object):
     pass
 
 
+@lru_cache(maxsize=None)
 def extract_swagger_path(path):
     """Extracts a swagger type path from the given flask style path.
     This /path/<parameter> turns into this /path/{parameter}
@@ -0,0 +1,463 @@
+import hashlib
+import hmac
+import os
+import pickle
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterator, Tuple
+
+from ..abc import CacheBackend
+from ..cache.resp import parse_redis_url, RespConnection, RespError
+from ..logger.app_loggers import logger
+
+_DEFAULT_MAX_ENTRIES = 1000
+
+# the keys of a table and its index deleted at once, a set landing meanwhile can not leave an entry out of the index
+_INVALIDATE_SCRIPT = """
+local keys = redis.call('SMEMBERS', KEYS[1])
+for i = 1, #keys, 1000 do
+    redis.call('DEL', unpack(keys, i, math.min(i + 999, #keys)))
+end
+redis.call('DEL', KEYS[1])
+return #keys
+"""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Per process storage, one LRU bounded by `max_entries` for each table"""
+
+    def __init__(self):
+        self._tables: Dict[str, OrderedDict] = {}
+        self._evictions: Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+    def get(self, table: str, key: str):
+        """
+
+        :param table: str:
+        :param key: str:
+
+        """
+        with self._lock:
+            entries = self._tables.get(table)
+            entry = entries.get(key) if entries is not None else None
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del entries[key]
+                return None
+
+            entries.move_to_end(key)
+            return value
+
+    def set(self, table: str, key: str, value, ttl: int, max_entries: int = None):
+        """
+
+        :param table: str:
+        :param key: str:
+        :param value:
+        :param ttl: int:
+        :param max_entries: int:  (Default value = None)
+
+        """
+        max_entries = _DEFAULT_MAX_ENTRIES if max_entries is None else max_entries
+        with self._lock:
+            entries = self._tables.setdefault(table, OrderedDict())
+            entries[key] = (time.monotonic() + ttl, value)
+            entries.move_to_end(key)
+            while len(entries) > max_entries:
+                entries.popitem(last=False)
+                self._evictions[table] = self._evictions.get(table, 0) + 1
+
+    def invalidate(self, table: str):
+        """
+
+        :param table: str:
+
+        """
+        with self._lock:
+            self._tables.pop(table, None)
+
+    def clear(self):
+        """ """
+        with self._lock:
+            self._tables.clear()
+
+    def stats(self, table: str) -> dict:
+        """
+
+        :param table: str:
+
+        """
+        with self._lock:
+            return {
+                "entries": len(self._tables.get(table, {})),
+                "evictions": self._evictions.get(table, 0),
+            }
+
+
+class RedisCacheBackend(CacheBackend):
+    """Storage shared by all the workers and nodes through a Redis protocol server.
+
+    Each table keeps the set of its keys so a write deletes all of them, then the table name is published in
+    `<prefix>:invalidations` to evict the near cache of every process. The near cache is a small per process
+    copy of the last values read (disabled with `near_cache_ttl: 0`) that saves the network round trip on hot keys.
+    `max_entries` only bounds the near cache: the server relies on the entries TTL and its own `maxmemory` policy.
+    If the server is unreachable the backend fails open, reads are misses and writes are ignored.
+    The values are pickled and signed with `secret_key` (the app secret key by default), values read without a valid
+    signature are misses: whoever can write into the server can not make the workers unpickle their own data.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "chillapi",
+        near_cache_ttl: int = 5,
+        timeout: float = 1.0,
+        secret_key: str = None,
+    ):
+        self.connection_args = {**parse_redis_url(url), **{"timeout": timeout}}
+        self.secret_key = secret_key
+        self.prefix = prefix
+        self.channel = f"{prefix}:invalidations"
+        self.near_cache_ttl = near_cache_ttl
+        self.near_cache = MemoryCacheBackend() if near_cache_ttl > 0 else None
+        self._local = threading.local()
+        self._subscriber_pid = None
+        self._subscriber_lock = threading.Lock()
+
+    def _key(self, table: str, key: str) -> str:
+        """
+
+        :param table: str:
+        :param key: str:
+
+        """
+        return f"{self.prefix}:{table}:{key}"
+
+    def _index_key(self, table: str) -> str:
+        """
+
+        :param table: str:
+
+        """
+        return f"{self.prefix}:{table}:__keys__"
+
+    def _sign(self, payload: bytes) -> bytes:
+        """
+
+        :param payload: bytes:
+
+        """
+        secret_key = self.secret_key if self.secret_key is not None else os.environ.get("__CHILLAPI_APP_SECRET_KEY__", "")
+        return hmac.new(secret_key.encode(), payload, hashlib.sha256).digest()
+
+    def _dumps(self, value) -> bytes:
+        """
+
+        :param value:
+
+        """
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        return self._sign(payload) + payload
+
+    def _loads(self, data: bytes):
+        """The value, or None if its signature is not valid
+
+        :param data: bytes:
+
+        """
+        signature_size = hashlib.sha256().digest_size
+        signature, payload = data[:signature_size], data[signature_size:]
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            logger.warning("Redis cache entry with an invalid signature discarded")
+            return None
+        return pickle.loads(payload)
+
+    def _connection(self) -> RespConnection:
+        """One connection per thread, workers forked after the app load open their own"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = RespConnection(**self.connection_args)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _pipeline(self, *commands):
+        """
+
+        :param *commands:
+
+        """
+        connection = self._connection()
+        try:
+            return connection.pipeline(*commands)
+        except (OSError, RespError) as e:
+            connection.close()
+            logger.warning("Redis cache backend unavailable", extra={"error": str(e)})
+            return None
+
+    def _ensure_subscriber(self):
+        """Starts the invalidations listener in the current process"""
+        if self.near_cache is None or self._subscriber_pid == os.getpid():
+            return
+        with self._subscriber_lock:
+            if self._subscriber_pid == os.getpid():
+                return
+            self._subscriber_pid = os.getpid()
+            self.near_cache.clear()
+            thread = threading.Thread(target=self._listen_invalidations, name="chillapi-cache-invalidations", daemon=True)
+            thread.start()
+
+    def _listen_invalidations(self):
+        """ """
+        while True:
+            connection = RespConnection(**{**self.connection_args, **{"timeout": None}})
+            try:
+                connection.command("SUBSCRIBE", self.channel)
+                while True:
+                    message = connection.read_reply()
+                    if isinstance(message, list) and len(message) == 3 and message[0] == b"message":
+                        self.near_cache.invalidate(message[2].decode())
+            except (OSError, RespError) as e:
+                logger.warning("Redis cache invalidations listener disconnected", extra={"error": str(e)})
+            finally:
+                connection.close()
+            # messages published while disconnected are lost
+            self.near_cache.clear()
+            time.sleep(1)
+
+    def get(self, table: str, key: str):
+        """
+
+        :param table: str:
+        :param key: str:
+
+        """
+        self._ensure_subscriber()
+        if self.near_cache is not None:
+            value = self.near_cache.get(table, key)
+            if value is not None:
+                return value
+
+        replies = self._pipeline(("GET", self._key(table, key)))
+        if replies is None or replies[0] is None:
+            return None
+
+        value = self._loads(replies[0])
+        if value is not None and self.near_cache is not None:
+            self.near_cache.set(table, key, value, self.near_cache_ttl)
+        return value
+
+    def set(self, table: str, key: str, value, ttl: int, max_entries: int = None):
+        """
+
+        :param table: str:
+        :param key: str:
+        :param value:
+        :param ttl: int:
+        :param max_entries: int:  (Default value = None)
+
+        """
+        self._ensure_subscriber()
+        ttl_ms = int(ttl * 1000)
+        entry_key = self._key(table, key)
+        self._pipeline(
+            ("SET", entry_key, self._dumps(value), "PX", ttl_ms),
+            ("SADD", self._index_key(table), entry_key),
+            ("PEXPIRE", self._index_key(table), ttl_ms),
+        )
+        if self.near_cache is not None:
+            self.near_cache.set(table, key, value, min(ttl, self.near_cache_ttl), max_entries)
+
+    def invalidate(self, table: str):
+        """
+
+        :param table: str:
+
+        """
+        if self.near_cache is not None:
+            self.near_cache.invalidate(table)
+
+        replies = self._pipeline(
+            ("EVAL", _INVALIDATE_SCRIPT, 1, self._index_key(table)),
+            ("PUBLISH", self.channel, table),
+        )
+        if replies is None:
+            logger.error("Redis cache backend could not invalidate table", extra={"table": table})
+
+    def stats(self, table: str) -> dict:
+        """
+
+        :param table: str:
+
+        """
+        replies = self._pipeline(("SCARD", self._index_key(table)))
+        return {
+            "entries": replies[0] if replies is not None else None,
+            "near_cache": self.near_cache.stats(table) if self.near_cache is not None else None,
+        }
+
+
+class DiskCacheBackend(CacheBackend):
+    """Entries pickled one per file under `<path>/<table>/`, they survive restarts and are shared by the workers of the host.
+    Expiration uses the wall clock, so entries written before a restart keep their remaining TTL.
+    Each process counts the entries it adds, the oldest files are pruned once a table goes a tenth over `max_entries`.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._counts: Dict[str, int] = {}
+        self._counts_lock = threading.Lock()
+
+    def _table_path(self, table: str) -> str:
+        """
+
+        :param table: str:
+
+        """
+        return os.path.join(self.path, re.sub(r"[^\w.-]", "_", table.strip("/")))
+
+    def _entry_path(self, table: str, key: str) -> str:
+        """
+
+        :param table: str:
+        :param key: str:
+
+        """
+        return os.path.join(self._table_path(table), f"{hashlib.sha1(key.encode()).hexdigest()}.pickle")
+
+    def _entry_files(self, table: str) -> list:
+        """
+
+        :param table: str:
+
+        """
+        table_path = self._table_path(table)
+        if not os.path.isdir(table_path):
+            return []
+        return [os.path.join(table_path, f) for f in os.listdir(table_path) if f.endswith(".pickle")]
+
+    def _read(self, entry_path: str):
+        """Returns (key, expires_at, value) or None if the entry is missing, expired or corrupted
+
+        :param entry_path: str:
+
+        """
+        try:
+            with open(entry_path, "rb") as entry_file:
+                key, expires_at, value = pickle.load(entry_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Disk cache entry discarded", extra={"path": entry_path, "error": str(e)})
+            self._remove(entry_path)
+            return None
+
+        if expires_at < time.time():
+            self._remove(entry_path)
+            return None
+
+        return key, expires_at, value
+
+    def _remove(self, entry_path: str):
+        """
+
+        :param entry_path: str:
+
+        """
+        try:
+            os.remove(entry_path)
+        except FileNotFoundError:
+            pass
+
+    def get(self, table: str, key: str):
+        """
+
+        :param table: str:
+        :param key: str:
+
+        """
+        entry = self._read(self._entry_path(table, key))
+        return entry[2] if entry is not None else None
+
+    def set(self, table: str, key: str, value, ttl: int, max_entries: int = None):
+        """
+
+        :param table: str:
+        :param key: str:
+        :param value:
+        :param ttl: int:
+        :param max_entries: int:  (Default value = None)
+
+        """
+        entry_path = self._entry_path(table, key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        new_entry = not os.path.exists(entry_path)
+        # written aside and renamed, readers never see half written entries
+        tmp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as entry_file:
+            pickle.dump((key, time.time() + ttl, value), entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, entry_path)
+
+        max_entries = _DEFAULT_MAX_ENTRIES if max_entries is None else max_entries
+        with self._counts_lock:
+            count = self._counts.get(table)
+            if count is None:
+                # listed once per table and process, then counted
+                count = len(self._entry_files(table))
+            elif new_entry:
+                count += 1
+            self._counts[table] = count
+        if count > max_entries + max(1, max_entries // 10):
+            self._prune(table, max_entries)
+
+    def _prune(self, table: str, max_entries: int):
+        """Removes the oldest entries over `max_entries`
+
+        :param table: str:
+        :param max_entries: int:
+
+        """
+        entry_files = self._entry_files(table)
+        if len(entry_files) > max_entries:
+            entry_files.sort(key=lambda f: os.stat(f).st_mtime if os.path.exists(f) else 0)
+            for entry_file in entry_files[: len(entry_files) - max_entries]:
+                self._remove(entry_file)
+        with self._counts_lock:
+            self._counts[table] = min(len(entry_files), max_entries)
+
+    def invalidate(self, table: str):
+        """
+
+        :param table: str:
+
+        """
+        for entry_file in self._entry_files(table):
+            self._remove(entry_file)
+        with self._counts_lock:
+            self._counts[table] = 0
+
+    def items(self, table: str) -> Iterator[Tuple[str, object, float]]:
+        """Not expired entries as (key, value, remaining ttl)
+
+        :param table: str:
+
+        """
+        for entry_file in self._entry_files(table):
+            entry = self._read(entry_file)
+            if entry is not None:
+                key, expires_at, value = entry
+                yield key, value, expires_at - time.time()
+
+    def stats(self, table: str) -> dict:
+        """
+
+        :param table: str:
+
+        """
+        return {"entries": len(self._entry_files(table))}
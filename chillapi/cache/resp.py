@@ -0,0 +1,146 @@
+import socket
+from typing import List
+from urllib.parse import unquote, urlparse
+
+
+class RespError(Exception):
+    """Error reply sent by the server"""
+
+    pass
+
+
+def parse_redis_url(url: str) -> dict:
+    """
+
+    :param url: str: redis://[:password@]host[:port][/db]
+
+    """
+    parsed = urlparse(url)
+    if parsed.scheme != "redis":
+        raise ValueError(f"{url} is not a redis:// url")
+    db = parsed.path.lstrip("/")
+
+    return {
+        "host": parsed.hostname or "localhost",
+        "port": parsed.port or 6379,
+        "password": unquote(parsed.password) if parsed.password else None,
+        "db": int(db) if db else 0,
+    }
+
+
+def _encode(value) -> bytes:
+    """
+
+    :param value:
+
+    """
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
+
+
+class RespConnection:
+    """Minimal blocking client of the Redis serialization protocol (RESP2)"""
+
+    def __init__(self, host: str = "localhost", port: int = 6379, password: str = None, db: int = 0, timeout: float = 1.0):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.db = db
+        self.timeout = timeout
+        self._sock = None
+        self._reader = None
+
+    def connect(self):
+        """ """
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._reader = self._sock.makefile("rb")
+        if self.password:
+            self.command("AUTH", self.password)
+        if self.db:
+            self.command("SELECT", self.db)
+
+    def close(self):
+        """ """
+        if self._sock is not None:
+            try:
+                self._reader.close()
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._reader = None
+
+    @property
+    def connected(self) -> bool:
+        """ """
+        return self._sock is not None
+
+    def send(self, *args):
+        """
+
+        :param *args:
+
+        """
+        self.send_many([args])
+
+    def send_many(self, commands: List):
+        """
+
+        :param commands: List:
+
+        """
+        if not self.connected:
+            self.connect()
+        payload = []
+        for args in commands:
+            payload.append(b"*%d\r\n" % len(args))
+            for arg in args:
+                arg = _encode(arg)
+                payload.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        self._sock.sendall(b"".join(payload))
+
+    def command(self, *args):
+        """
+
+        :param *args:
+
+        """
+        self.send(*args)
+        return self.read_reply()
+
+    def pipeline(self, *commands):
+        """Sends all the commands at once and returns their replies in the same order
+
+        :param *commands:
+
+        """
+        self.send_many(commands)
+        return [self.read_reply() for _ in commands]
+
+    def read_reply(self):
+        """ """
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by the server")
+
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b"+":
+            return payload.decode()
+        if prefix == b"-":
+            raise RespError(payload.decode())
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            if length == -1:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(payload)
+            if length == -1:
+                return None
+            return [self.read_reply() for _ in range(length)]
+
+        raise RespError(f"Unknown reply type: {line!r}")
@@ -0,0 +1,133 @@
+import threading
+from typing import Dict, List, Optional
+
+from ..abc import CacheBackend
+from ..cache.backends import DiskCacheBackend, MemoryCacheBackend
+
+
+class ResponseCache:
+    """Cached responses of a table or a SQL endpoint, every entry expires after `ttl` seconds.
+    With `persistence` the entries are also written to disk and loaded back by `warm_up` after a restart.
+    """
+
+    def __init__(self, table: str, ttl: int = 60, max_entries: int = 1000, backend: CacheBackend = None, persistence: DiskCacheBackend = None):
+        self.table = table
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.backend = MemoryCacheBackend() if backend is None else backend
+        self.persistence = persistence
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """
+
+        :param key: str:
+
+        """
+        value = self.backend.get(self.table, key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value):
+        """
+
+        :param key: str:
+        :param value:
+
+        """
+        self.backend.set(self.table, key, value, self.ttl, self.max_entries)
+        if self.persistence is not None:
+            self.persistence.set(self.table, key, value, self.ttl, self.max_entries)
+
+    def warm_up(self) -> int:
+        """Loads the persisted entries not expired yet, returns how many"""
+        if self.persistence is None:
+            return 0
+        loaded = 0
+        for key, value, ttl in self.persistence.items(self.table):
+            self.backend.set(self.table, key, value, ttl, self.max_entries)
+            loaded += 1
+        return loaded
+
+    def invalidate(self):
+        """ """
+        self.backend.invalidate(self.table)
+        if self.persistence is not None:
+            self.persistence.invalidate(self.table)
+        with self._lock:
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        """ """
+        return {
+            **{
+                "ttl": self.ttl,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            },
+            **self.backend.stats(self.table),
+        }
+
+
+class ResponseCacheRegistry:
+    """Response caches of the tables and SQL endpoints with the `cache` setting enabled, indexed by name.
+    A cache is invalidated by the writes in the table with its name and in the tables it is `invalidated_by`
+    """
+
+    def __init__(self, backend: CacheBackend = None):
+        self.backend = MemoryCacheBackend() if backend is None else backend
+        self._caches: Dict[str, ResponseCache] = {}
+        self._dependents: Dict[str, List[str]] = {}
+
+    def register(
+        self, table_name: str, ttl: int, max_entries: int, invalidated_by: List[str] = None, persistence: DiskCacheBackend = None
+    ) -> ResponseCache:
+        """
+
+        :param table_name: str:
+        :param ttl: int:
+        :param max_entries: int:
+        :param invalidated_by: List[str]:  (Default value = None)
+        :param persistence: DiskCacheBackend:  (Default value = None)
+
+        """
+        self._caches[table_name] = ResponseCache(table_name, ttl=ttl, max_entries=max_entries, backend=self.backend, persistence=persistence)
+        for table in invalidated_by or []:
+            self._dependents.setdefault(table, []).append(table_name)
+        return self._caches[table_name]
+
+    def get(self, table_name: str) -> Optional[ResponseCache]:
+        """
+
+        :param table_name: str:
+
+        """
+        return self._caches.get(table_name)
+
+    def invalidate(self, tables: List[str]):
+        """
+
+        :param tables: List[str]:
+
+        """
+        names = set()
+        for table_name in tables:
+            names.add(table_name)
+            names.update(self._dependents.get(table_name, []))
+
+        for name in names:
+            if name in self._caches:
+                self._caches[name].invalidate()
+
+    def stats(self) -> dict:
+        """ """
+        return {table_name: cache.stats() for table_name, cache in self._caches.items()}
@@ -0,0 +1,102 @@
+import threading
+from typing import Callable, Dict, Tuple
+
+from ..logger.app_loggers import logger
+
+
+class _Flight:
+    """A call in progress"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.failed = False
+        self.shareable = False
+        self.result = None
+
+
+class SingleFlight:
+    """Runs only once the calls made at the same time with the same key, the callers arriving meanwhile wait and share the result.
+    A waiter runs the call on its own if the leader call fails, its result is not `shareable` or it does not finish in `timeout` seconds.
+    """
+
+    def __init__(self, timeout: float = 10.0, copy: Callable = None, shareable: Callable = None):
+        self.timeout = timeout
+        self.copy = copy if copy is not None else (lambda result: result)
+        self.shareable = shareable if shareable is not None else (lambda result: True)
+        self.leaders = 0
+        self.shared = 0
+        self.fallbacks = 0
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable) -> Tuple[object, bool]:
+        """Returns the call result and whether it was shared with other callers
+
+        :param key: str:
+        :param fn: Callable:
+
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = _Flight()
+                self._flights[key] = flight
+                self.leaders += 1
+                leader = True
+            else:
+                flight.waiters += 1
+                leader = False
+
+        if leader:
+            return self._lead(key, flight, fn)
+
+        if flight.done.wait(self.timeout) and flight.shareable:
+            with self._lock:
+                self.shared += 1
+            return self.copy(flight.result), True
+
+        with self._lock:
+            self.fallbacks += 1
+        if not flight.done.is_set():
+            reason = "timeout"
+        else:
+            reason = "failed" if flight.failed else "not shareable"
+        logger.warning("Single flight fallback", extra={"key": key, "reason": reason})
+        return fn(), False
+
+    def _lead(self, key: str, flight: _Flight, fn: Callable) -> Tuple[object, bool]:
+        """
+
+        :param key: str:
+        :param flight: _Flight:
+        :param fn: Callable:
+
+        """
+        try:
+            result = fn()
+        except BaseException:
+            flight.failed = True
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                shared = flight.waiters > 0
+            if not flight.failed:
+                flight.result = result
+                flight.shareable = self.shareable(result)
+            flight.done.set()
+
+        # the waiters copy the result, the leader must not change it meanwhile
+        shared = shared and flight.shareable
+        return (self.copy(result) if shared else result), shared
+
+    def stats(self) -> dict:
+        """ """
+        with self._lock:
+            return {
+                "in_flight": len(self._flights),
+                "leaders": self.leaders,
+                "shared": self.shared,
+                "fallbacks": self.fallbacks,
+            }
@@ -63,16 +63,36 @@ def create_select_filtered_paginated_ordered_query(table, columns: List[str], fi
     return query.get_sql()
 
 
-def create_select_filtered_paginated_query_count(table, filters: dict, id_field_where: str):
+def create_select_filtered_ordered_query(table, columns: List[str], filters: dict):
+    """
+
+    :param table:
+    :param columns: List[str]:
+    :param filters: dict:
+
+    """
+    table = Table(table)
+    table_columns = [table[c] for c in columns]
+    query = Query.from_(table).select(*table_columns).orderby(*filters["order"]["field"], order=Order[filters["order"]["direction"]])
+
+    query = set_query_filters(filters, query, table)
+
+    return query.get_sql()
+
+
+def create_select_filtered_paginated_query_count(table, filters: dict, id_field_where: str, last_modified_field: str = None):
     """
 
     :param table:
     :param filters: dict:
     :param id_field_where: str:
+    :param last_modified_field: str: selects its max as "last_modified" too (Default value = None)
 
     """
     table = Table(table)
     query = Query.from_(table).select(fn.Count(id_field_where, alias="count"))
+    if last_modified_field is not None:
+        query = query.select(fn.Max(table[last_modified_field], alias="last_modified"))
 
     query = set_query_filters(filters, query, table)
 
@@ -0,0 +1,158 @@
+"""Reflection snapshot of a database, so warm starts do not inspect every table again.
+
+The tables and columns read from the inspector are pickled under `<path>/<hash of dsn and schema>.pickle` with the
+fingerprint of the schema they were read from: the Alembic revision, or a checksum of the catalog. While the fingerprint
+does not change the snapshot answers instead of the inspector, when it changes the snapshot is read again from scratch.
+"""
+import hashlib
+import os
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Inspector
+
+from ..exceptions.api_manager import ConfigError
+from ..logger.app_loggers import logger
+
+FINGERPRINT_AUTO = "auto"
+FINGERPRINT_ALEMBIC = "alembic"
+FINGERPRINT_CATALOG = "catalog"
+FINGERPRINTS = [FINGERPRINT_AUTO, FINGERPRINT_ALEMBIC, FINGERPRINT_CATALOG]
+
+_ALEMBIC_TABLE = "alembic_version"
+_ALEMBIC_REVISION = f"SELECT version_num FROM {_ALEMBIC_TABLE} ORDER BY version_num"
+_CATALOG_CHECKSUM = {
+    "postgresql": """
+        SELECT string_agg(
+            concat_ws(
+                ':', table_name, column_name, data_type, is_nullable, column_default, character_maximum_length, numeric_precision, numeric_scale
+            ),
+            ',' ORDER BY table_name, ordinal_position
+        )
+        FROM information_schema.columns
+        WHERE table_schema = :schema
+    """,
+    "sqlite": "SELECT group_concat(type || ':' || name || ':' || coalesce(sql, ''), ';') FROM (SELECT * FROM sqlite_master ORDER BY type, name)",
+}
+
+
+def map_in_order(fn: Callable, items: Iterable, workers: int = 1) -> List:
+    """`fn` applied to the items on up to `workers` threads. The results keep the order of the items and, as a loop would,
+    the error raised is the one of the first failing item in that order
+
+    :param fn: Callable:
+    :param items: Iterable:
+    :param workers: int:  (Default value = 1)
+
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(items)), thread_name_prefix="chillapi-reflection") as executor:
+        futures = [executor.submit(fn, item) for item in items]
+        return [future.result() for future in futures]
+
+
+def _empty_snapshot() -> dict:
+    """ """
+    return {"table_names": None, "has_table": {}, "columns": {}}
+
+
+class SnapshotInspector:
+    """Inspector answering `get_table_names`, `has_table` and `get_columns` from the snapshot, anything else is asked to
+    the database inspector. Call `save` once the tables are loaded to persist what was read
+    """
+
+    def __init__(self, inspector: Inspector, dsn: str, schema: str, path: str, fingerprint: str = FINGERPRINT_AUTO):
+        if fingerprint not in FINGERPRINTS:
+            raise ConfigError(f"reflection fingerprint must be one of {', '.join(FINGERPRINTS)}, {fingerprint} given")
+        self.inspector = inspector
+        self.schema = schema
+        self.path = os.path.join(path, f"{hashlib.sha1(f'{dsn}|{schema}'.encode()).hexdigest()}.pickle")
+        self.fingerprint = self._read_fingerprint(fingerprint)
+        self.snapshot = self._load()
+        self.changed = False
+
+    def __getattr__(self, name):
+        return getattr(self.inspector, name)
+
+    def _read_fingerprint(self, fingerprint: str) -> str:
+        """
+
+        :param fingerprint: str: FINGERPRINT_AUTO, FINGERPRINT_ALEMBIC or FINGERPRINT_CATALOG
+
+        """
+        with self.inspector.bind.connect() as connection:
+            if fingerprint != FINGERPRINT_CATALOG and self.inspector.has_table(_ALEMBIC_TABLE):
+                revisions = [row[0] for row in connection.execute(text(_ALEMBIC_REVISION))]
+                return f"{FINGERPRINT_ALEMBIC}:{','.join(revisions)}"
+            if fingerprint == FINGERPRINT_ALEMBIC:
+                raise ConfigError(f"reflection fingerprint is {FINGERPRINT_ALEMBIC} but {_ALEMBIC_TABLE} does not exist")
+
+            dialect = self.inspector.bind.dialect.name
+            if dialect not in _CATALOG_CHECKSUM:
+                raise ConfigError(f"reflection snapshots are not available for {dialect}")
+            catalog = connection.execute(text(_CATALOG_CHECKSUM[dialect]), {"schema": self.schema}).scalar()
+        return f"{FINGERPRINT_CATALOG}:{hashlib.sha1((catalog or '').encode()).hexdigest()}"
+
+    def _load(self) -> dict:
+        """Snapshot stored for the current fingerprint, an empty one if there is none"""
+        try:
+            with open(self.path, "rb") as snapshot_file:
+                fingerprint, snapshot = pickle.load(snapshot_file)
+        except FileNotFoundError:
+            return _empty_snapshot()
+        except Exception as e:
+            logger.warning("Reflection snapshot discarded", extra={"path": self.path, "error": str(e)})
+            return _empty_snapshot()
+
+        if fingerprint != self.fingerprint:
+            logger.info("Reflection snapshot outdated", extra={"path": self.path, "fingerprint": self.fingerprint})
+            return _empty_snapshot()
+
+        return snapshot
+
+    def save(self):
+        """Persists the snapshot when something was read from the database inspector"""
+        if not self.changed:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # written aside and renamed, workers starting at the same time never read half written snapshots
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as snapshot_file:
+            pickle.dump((self.fingerprint, self.snapshot), snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+        self.changed = False
+
+    def get_table_names(self) -> list:
+        """ """
+        if self.snapshot["table_names"] is None:
+            self.snapshot["table_names"] = self.inspector.get_table_names()
+            self.changed = True
+        return list(self.snapshot["table_names"])
+
+    def has_table(self, table_name: str) -> bool:
+        """
+
+        :param table_name: str:
+
+        """
+        if table_name not in self.snapshot["has_table"]:
+            self.snapshot["has_table"][table_name] = self.inspector.has_table(table_name)
+            self.changed = True
+        return self.snapshot["has_table"][table_name]
+
+    def get_columns(self, table_name: str) -> list:
+        """
+
+        :param table_name: str:
+
+        """
+        if table_name not in self.snapshot["columns"]:
+            self.snapshot["columns"][table_name] = self.inspector.get_columns(table_name)
+            self.changed = True
+        return [dict(column) for column in self.snapshot["columns"][table_name]]
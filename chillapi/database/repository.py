@@ -1,4 +1,5 @@
-from typing import List
+from contextlib import contextmanager
+from typing import Iterator, List
 
 import simplejson
 import sqlalchemy
@@ -36,6 +37,20 @@ where i.{x['id_field']} is null;
 }
 
 
+def _iter_partitions(result: CursorResult, chunk_size: int) -> Iterator[List]:
+    """
+
+    :param result: CursorResult:
+    :param chunk_size: int:
+
+    """
+    try:
+        for partition in result.partitions(chunk_size):
+            yield partition
+    finally:
+        result.close()
+
+
 class DataRepository(Repository):
     """ """
 
@@ -69,6 +84,28 @@ class DataRepository(Repository):
             raise e
         return r
 
+    def execute_stream(self, sql, params=None, chunk_size: int = 1000) -> Iterator[List]:
+        """Rows of the query in lists of `chunk_size`, fetched through a server side cursor when the driver has them
+        so the whole result is never held in memory. The query runs right away, the rows are read while iterating
+
+        :param sql:
+        :param params:  (Default value = None)
+        :param chunk_size: int:  (Default value = 1000)
+
+        """
+        try:
+            r = self.db.execute(text(sql), params, execution_options={"stream_results": True, "max_row_buffer": chunk_size})
+        except Exception as e:
+            logger.critical(e)
+            raise e
+        return _iter_partitions(r, chunk_size)
+
+    @contextmanager
+    def transaction(self):
+        """Statements executed inside run in one transaction, committed at the end and rolled back on any error"""
+        with self.db.begin():
+            yield self
+
     def execute_insert(self, sql, params=None) -> CursorResult:
         """
 
@@ -0,0 +1,196 @@
+import csv
+import importlib.util
+import io
+import uuid
+from datetime import date
+from typing import Callable, Iterable, Iterator, List
+
+import simplejson
+
+from ..http.json_encoder import dumps_lines, to_http_date
+
+# pyarrow takes longer to import than the rest of the api, it is only imported by the first Arrow body
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+def _import_pyarrow():
+    """ """
+    import pyarrow
+    import pyarrow.ipc  # noqa F401
+
+    return pyarrow
+
+
+def _get_python_type(column: dict):
+    """Python type of the reflected column, None if SQLAlchemy does not tell
+
+    :param column: dict:
+
+    """
+    try:
+        return column["type"].python_type
+    except (NotImplementedError, KeyError, AttributeError):
+        return None
+
+
+def _get_converter(column: dict) -> Callable:
+    """Conversion applied to the column values before encoding them, None if the encoder takes them as they come
+
+    :param column: dict:
+
+    """
+    python_type = _get_python_type(column)
+    if python_type is not None and issubclass(python_type, date):
+        return to_http_date
+    return None
+
+
+def _to_json_text(value):
+    """
+
+    :param value:
+
+    """
+    return value if value is None or isinstance(value, str) else simplejson.dumps(value)
+
+
+def _get_text_converter(column: dict) -> Callable:
+    """Conversion of the column values into CSV cells, None if `str()` is enough
+
+    :param column: dict:
+
+    """
+    python_type = _get_python_type(column)
+    if python_type is not None and issubclass(python_type, (dict, list)):
+        return _to_json_text
+    return _get_converter(column)
+
+
+def _get_arrow_converter(column: dict) -> Callable:
+    """Conversion of the column values Arrow has not a type for, None if Arrow takes them as they come
+
+    :param column: dict:
+
+    """
+    python_type = _get_python_type(column)
+    if python_type is not None and issubclass(python_type, (dict, list)):
+        return _to_json_text
+    if python_type is not None and issubclass(python_type, uuid.UUID):
+        return lambda value: value if value is None else str(value)
+    return None
+
+
+def _to_arrow_array(values: list, converter: Callable):
+    """
+
+    :param values: list:
+    :param converter: Callable:
+
+    """
+    pyarrow = _import_pyarrow()
+    if converter is not None:
+        values = [converter(value) for value in values]
+    try:
+        return pyarrow.array(values)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, pyarrow.ArrowNotImplementedError):
+        # types without Arrow counterpart or mixed in the same column
+        return pyarrow.array([None if value is None else str(value) for value in values], type=pyarrow.string())
+
+
+class RowSerializer:
+    """Converts the rows selected by a table endpoint, in the `columns_map` order, into JSON ready values.
+
+    The conversion of each row is a function compiled once from the reflected column types: it reads the row by
+    position and only converts the columns whose type needs it, without `_asdict()` or per value type checks.
+    """
+
+    def __init__(self, columns_map: dict):
+        self.columns = list(columns_map.keys())
+        self.converters = [_get_converter(column) for column in columns_map.values()]
+        self.arrow_converters = [_get_arrow_converter(column) for column in columns_map.values()]
+        self.to_dict = self._compile("{%s}", lambda i, column, value: f"{column!r}: {value}")
+        self.to_list = self._compile("[%s]", lambda i, column, value: value)
+        self.to_text_list = self._compile("[%s]", lambda i, column, value: value, [_get_text_converter(column) for column in columns_map.values()])
+
+    def _compile(self, template: str, item: Callable, converters: List[Callable] = None) -> Callable:
+        """
+
+        :param template: str: the row expression with a %s placeholder for the items
+        :param item: Callable: item expression from the column position, name and value expression
+        :param converters: List[Callable]: per column conversions (Default value = None, the JSON ones)
+
+        """
+        namespace = {}
+        items = []
+        for i, (column, converter) in enumerate(zip(self.columns, converters if converters is not None else self.converters)):
+            value = f"row[{i}]"
+            if converter is not None:
+                namespace[f"convert_{i}"] = converter
+                value = f"convert_{i}({value})"
+            items.append(item(i, column, value))
+
+        exec(f"def serialize(row):\n    return {template % ', '.join(items)}\n", namespace)
+        return namespace["serialize"]
+
+    def dicts(self, rows: Iterable) -> List[dict]:
+        """
+
+        :param rows: Iterable:
+
+        """
+        to_dict = self.to_dict
+        return [to_dict(row) for row in rows]
+
+    def lists(self, rows: Iterable) -> List[list]:
+        """
+
+        :param rows: Iterable:
+
+        """
+        to_list = self.to_list
+        return [to_list(row) for row in rows]
+
+    def arrow_ipc(self, rows: Iterable, metadata: dict = None) -> bytes:
+        """Arrow IPC stream with a record batch built column by column from the rows, requires pyarrow
+
+        :param rows: Iterable:
+        :param metadata: dict: stored as JSON in the schema `chillapi` metadata (Default value = None)
+
+        """
+        pyarrow = _import_pyarrow()
+        columns = list(zip(*rows)) or [() for _ in self.columns]
+        arrays = [_to_arrow_array(list(values), converter) for values, converter in zip(columns, self.arrow_converters)]
+        schema_metadata = {"chillapi": simplejson.dumps(metadata)} if metadata is not None else None
+        table = pyarrow.Table.from_arrays(arrays, names=self.columns, metadata=schema_metadata)
+
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def ndjson(self, chunks: Iterable[List]) -> Iterator[bytes]:
+        """Newline delimited JSON objects, a piece of body per chunk of rows
+
+        :param chunks: Iterable[List]:
+
+        """
+        for rows in chunks:
+            yield dumps_lines(self.dicts(rows))
+
+    def csv(self, chunks: Iterable[List]) -> Iterator[bytes]:
+        """CSV with a header row, a piece of body per chunk of rows
+
+        :param chunks: Iterable[List]:
+
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.columns)
+        yield buffer.getvalue().encode()
+
+        to_text_list = self.to_text_list
+        for rows in chunks:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([to_text_list(row) for row in rows])
+            yield buffer.getvalue().encode()
@@ -1,6 +1,6 @@
 from typing import List
 
-import inflect
+import simplejson
 from flask import request
 
 from ..app.swagger_schema import swagger
@@ -12,8 +12,6 @@ from ..swagger.utils import get_error_swagger_schema, get_not_found_swagger_sche
 error_swagger_schema = get_error_swagger_schema()
 not_found_swagger_schema = get_not_found_swagger_schema()
 
-inflector = inflect.engine()
-
 
 def create_sql_endpoint_class(
     name: str,
@@ -27,6 +25,8 @@ def create_sql_endpoint_class(
     response_schema: dict = None,
     description: str = None,
     is_from_template: bool = False,
+    cached: bool = False,
+    invalidates: List = None,
 ):
     """
 
@@ -41,6 +41,8 @@ def create_sql_endpoint_class(
     :param response_schema: dict:  (Default value = None)
     :param description: str:  (Default value = None)
     :param is_from_template: bool:  (Default value = False)
+    :param cached: bool: results of GET requests cached under the endpoint name (Default value = False)
+    :param invalidates: List: tables written by the endpoint, their caches are invalidated after each request (Default value = None)
 
     """
     schema = get_query_endpoint_schema(name, tags, query_parameters, description, request_schema, response_schema)
@@ -50,9 +52,18 @@ def create_sql_endpoint_class(
 
         route = f'/{url.lstrip("/")}'
         endpoint = f'/{name}{"Template" if is_from_template else ""}QueryEndpoint'
+        cache_name = endpoint if cached else None
 
         # representations = schema
 
+        def cache_key(self, **args) -> str:
+            """
+
+            :param **args:
+
+            """
+            return simplejson.dumps(args["query"], sort_keys=True)
+
         def request(self, **args) -> ResourceResponse:
             """
 
@@ -117,4 +128,5 @@ def create_sql_endpoint_class(
                 return self.process_request(query=query)
 
     QueryEndpoint.__name__ = QueryEndpoint.endpoint
+    QueryEndpoint.invalidates = [] if invalidates is None else invalidates
     return QueryEndpoint
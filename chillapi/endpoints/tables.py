@@ -1,33 +1,45 @@
-from typing import List
+from functools import lru_cache
+from typing import Callable, Iterator, List
 
-import inflect
-import psycopg2
 import simplejson
 import sqlalchemy
 from flask import request
 from jsonschema.exceptions import ValidationError as JsonSchemaValidationError
-from openapi_schema_validator import validate as json_swagger_schema_validator
 from simplejson.errors import JSONDecodeError
 from wtforms.validators import ValidationError
 
 from ..abc import Repository
-from ..app.forms import create_form_class, generate_form_swagger_schema_from_form
+from ..app.forms import BatchFormValidator, create_form_class, generate_form_swagger_schema_from_form
 from ..app.swagger_schema import swagger
 from ..database import DB_DIALECT_POSTGRES
 from ..database.query_builder import (
+    create_select_filtered_ordered_query,
     create_select_filtered_paginated_ordered_query,
     create_select_filtered_paginated_query_count,
 )
 from ..database.repository import _MAGIC_QUERIES
+from ..database.serializer import RowSerializer
 from ..exceptions.api_manager import ConfigError
 from ..exceptions.http import NotFoundException, RequestInvalidFieldSchemaError, RequestSchemaError
 from ..extensions.audit import AuditLog
+from ..http.binary_encoder import get_request_data
+from ..http.limits import BodyLimits
+from ..http.negotiation import (
+    MIMETYPE_ARROW_STREAM,
+    MIMETYPE_COLUMNAR_JSON,
+    MIMETYPE_CSV,
+    MIMETYPE_NDJSON,
+    negotiate_export_mimetype,
+    negotiate_list_mimetype,
+)
+from ..http.streaming import can_stream_request, iter_request_chunks
 from ..logger.app_loggers import logger
 from ..swagger.http import AutomaticResource, ResourceResponse
 from ..swagger.schemas import (
     create_swagger_type_from_dict,
     get_delete_list_endpoint_schema,
     get_delete_single_endpoint_schema,
+    get_export_list_endpoint_schema,
     get_get_list_endpoint_schema,
     get_get_single_endpoint_schema,
     get_post_list_endpoint_schema,
@@ -38,6 +50,7 @@ from ..swagger.schemas import (
 from ..swagger.utils import (
     get_error_swagger_schema,
     get_filter_schema,
+    get_list_columnar_response_swagger_schema,
     get_list_filtered_request_swagger_schema,
     get_list_filtered_response_swagger_schema,
     get_not_found_swagger_schema,
@@ -47,12 +60,41 @@ from ..swagger.utils import (
     get_size_schema,
     python_to_swagger_types,
 )
+from ..swagger.validators import SchemaValidator
 
 revisable_response = get_revisable_response_swagger_schema()
 error_response = get_error_swagger_schema()
 not_found = get_not_found_swagger_schema()
 
-inflector = inflect.engine()
+# SQLSTATE of the Postgres integrity errors, psycopg2 sets it on its errors so its error classes are never imported
+_PG_UNIQUE_VIOLATION = "23505"
+_PG_FOREIGN_KEY_VIOLATION = "23503"
+
+
+@lru_cache(maxsize=None)
+def _get_inflector():
+    """inflect engine, imported and created by the first table endpoint"""
+    import inflect
+
+    return inflect.engine()
+
+
+def _is_unique_violation(e: sqlalchemy.exc.IntegrityError) -> bool:
+    """
+
+    :param e: sqlalchemy.exc.IntegrityError:
+
+    """
+    return getattr(e.orig, "pgcode", None) == _PG_UNIQUE_VIOLATION
+
+
+def _is_foreign_key_violation(e: sqlalchemy.exc.IntegrityError) -> bool:
+    """
+
+    :param e: sqlalchemy.exc.IntegrityError:
+
+    """
+    return getattr(e.orig, "pgcode", None) == _PG_FOREIGN_KEY_VIOLATION
 
 
 def _get_extension_default_field(table_extensions, extension):
@@ -75,6 +117,19 @@ def _get_extension_default_field(table_extensions, extension):
     return _enable, default_field
 
 
+def _get_last_modified_field(table: dict, extensions: dict):
+    """Column holding the update timestamp of the records, None if the table has not on_update_timestamp enabled
+
+    :param table: dict:
+    :param extensions: dict:
+
+    """
+    update_extension = extensions["on_update_timestamp"]
+    if not update_extension.enabled or update_extension.config["default_field"] not in table["columns"]:
+        return None
+    return update_extension.config["default_field"]
+
+
 def _get_form(class_name: str, columns_map: dict, method: str, extensions: dict, as_array=False):
     """
 
@@ -91,6 +146,39 @@ def _get_form(class_name: str, columns_map: dict, method: str, extensions: dict,
     return form_class, form_schema_json
 
 
+def _read_list_body(body_limits: BodyLimits, stream_body: dict) -> dict:
+    """Arguments of `process_request` with the body of a list endpoint, the body chunks when it is streamed
+
+    :param body_limits: BodyLimits:
+    :param stream_body: dict: table stream_body config
+
+    """
+    body_limits.check_request()
+    if stream_body["enable"] and can_stream_request():
+        return {"data": None, "chunks": iter_request_chunks(stream_body["chunk_size"], body_limits)}
+
+    data = get_request_data()
+    if isinstance(data, list):
+        body_limits.check_items(len(data))
+    return {"data": data}
+
+
+def _write_chunks(repository: Repository, chunks: Iterator[List], write_chunk: Callable) -> int:
+    """Validates and writes the chunks of a streamed list body in one transaction, rolled back when any chunk fails
+
+    :param repository: Repository:
+    :param chunks: Iterator[List]:
+    :param write_chunk: Callable: validates and writes a chunk, given the chunk and the index of its first item in the body
+
+    """
+    count = 0
+    with repository.transaction():
+        for chunk in chunks:
+            write_chunk(chunk, count)
+            count += len(chunk)
+    return count
+
+
 def _column_type_to_swagger_type_url(type):
     """
 
@@ -103,6 +191,46 @@ def _column_type_to_swagger_type_url(type):
     return id_field_where_type
 
 
+_TABLE_ENDPOINT_ROUTES = {
+    ("GET", "SINGLE"): "/read/{slug}/<{id_type}id>",
+    ("PUT", "SINGLE"): "/create/{slug}",
+    ("POST", "SINGLE"): "/update/{slug}/<{id_type}id>",
+    ("DELETE", "SINGLE"): "/delete/{slug}/<{id_type}id>",
+    ("GET", "LIST"): "/read/{plural_slug}",
+    ("EXPORT", "LIST"): "/export/{plural_slug}",
+    ("PUT", "LIST"): "/create/{plural_slug}",
+    ("POST", "LIST"): "/update/{plural_slug}",
+    ("DELETE", "LIST"): "/delete/{plural_slug}",
+}
+
+
+def get_table_endpoint_route(table: dict, endpoint: str, action: str) -> str:
+    """Route of a table endpoint, known without creating its class
+
+    :param table: dict:
+    :param endpoint: str: GET, PUT, POST, DELETE or EXPORT
+    :param action: str: SINGLE or LIST
+
+    """
+    route = _TABLE_ENDPOINT_ROUTES[(endpoint, action)]
+    if "{plural_slug}" in route:
+        return route.format(plural_slug=_get_inflector().plural(table["slug"]))
+    if "{id_type}" in route:
+        return route.format(slug=table["slug"], id_type=_column_type_to_swagger_type_url(table["columns"][table["id_field"]]["type"]))
+    return route.format(slug=table["slug"])
+
+
+def get_table_endpoint_name(table: dict, endpoint: str, action: str) -> str:
+    """
+
+    :param table: dict:
+    :param endpoint: str: GET, PUT, POST, DELETE or EXPORT
+    :param action: str: SINGLE or LIST
+
+    """
+    return f"{table['model_name']}{endpoint.capitalize()}{action.capitalize()}Endpoint"
+
+
 def create_get_single_endpoint_class(table: dict, allowed_columns: List, allowed_columns_map: dict, extensions: dict, repository: Repository):
     """
 
@@ -113,7 +241,6 @@ def create_get_single_endpoint_class(table: dict, allowed_columns: List, allowed
     :param repository: Repository:
 
     """
-    table_slug = table["slug"]
     table_name = table["name"]
     model_name = table["model_name"]
     id_field = table["id_field"]
@@ -121,16 +248,28 @@ def create_get_single_endpoint_class(table: dict, allowed_columns: List, allowed
     id_field_where_type = _column_type_to_swagger_type_url(table["columns"][id_field]["type"])
     response_schema = get_response_swagger_schema(allowed_columns_map, f"{model_name}GetSingleEndpoint")
     soft_delete_extension = extensions["soft_delete"]
+    last_modified_field = _get_last_modified_field(table, extensions)
+    select_columns = allowed_columns
+    if last_modified_field is not None and last_modified_field not in allowed_columns:
+        select_columns = [*allowed_columns, last_modified_field]
     swagger_docs = get_get_single_endpoint_schema(model_name, id_field_where_type, response_schema)
 
     class GetSingleEndpoint(AutomaticResource):
         """ """
 
-        route = f"/read/{table_slug}/<{id_field_where_type}id>"
-        endpoint = f"{model_name}GetSingleEndpoint"
+        route = get_table_endpoint_route(table, "GET", "SINGLE")
+        endpoint = get_table_endpoint_name(table, "GET", "SINGLE")
         representations = swagger_docs
         db_table = table
 
+        def cache_key(self, **args) -> str:
+            """
+
+            :param **args:
+
+            """
+            return str(args["id"])
+
         def request(self, **args) -> ResourceResponse:
             """
 
@@ -149,7 +288,7 @@ def create_get_single_endpoint_class(table: dict, allowed_columns: List, allowed
 
                 record = repository.fetch_by(
                     table_name,
-                    allowed_columns,
+                    select_columns,
                     query,
                     query_values,
                 )
@@ -158,6 +297,13 @@ def create_get_single_endpoint_class(table: dict, allowed_columns: List, allowed
             except sqlalchemy.exc.NoResultFound:
                 raise NotFoundException(description=f"{model_name} with id: {id} not found")
 
+            if last_modified_field is None:
+                response.set_body_etag()
+            elif last_modified_field in allowed_columns:
+                response.set_validators(response.response[last_modified_field])
+            else:
+                response.set_validators(response.response.pop(last_modified_field))
+
             response.audit = AuditLog(
                 f"Read {table_name} record",
                 action="READ",
@@ -189,7 +335,6 @@ def create_put_single_endpoint_class(table: dict, allowed_columns: List, allowed
     :param repository: Repository:
 
     """
-    table_slug = table["slug"]
     table_name = table["name"]
     model_name = table["model_name"]
     id_field = table["id_field"]
@@ -202,10 +347,11 @@ def create_put_single_endpoint_class(table: dict, allowed_columns: List, allowed
     class PutSingleEndpoint(AutomaticResource):
         """ """
 
-        route = f"/create/{table_slug}"
-        endpoint = f"{model_name}PutSingleEndpoint"
+        route = get_table_endpoint_route(table, "PUT", "SINGLE")
+        endpoint = get_table_endpoint_name(table, "PUT", "SINGLE")
         representations = request_schema
         db_table = table
+        invalidates = [table_name]
 
         def validate_request(self, **args):
             """
@@ -252,9 +398,9 @@ def create_put_single_endpoint_class(table: dict, allowed_columns: List, allowed
                 )
 
             except sqlalchemy.exc.IntegrityError as e:
-                if isinstance(e.orig, psycopg2.errors.UniqueViolation):
+                if _is_unique_violation(e):
                     raise ValidationError(message=e.orig)
-                if isinstance(e.orig, psycopg2.errors.ForeignKeyViolation):
+                if _is_foreign_key_violation(e):
                     raise ValidationError(message=e.orig)
 
             return response
@@ -284,7 +430,6 @@ def create_post_single_endpoint_class(table: dict, allowed_columns: List, allowe
     :param repository: Repository:
 
     """
-    table_slug = table["slug"]
     table_name = table["name"]
     model_name = table["model_name"]
     id_field = table["id_field"]
@@ -301,10 +446,11 @@ def create_post_single_endpoint_class(table: dict, allowed_columns: List, allowe
     class PostSingleEndpoint(AutomaticResource):
         """ """
 
-        route = f"/update/{table_slug}/<{id_field_where_type}id>"
-        endpoint = f"{model_name}PostSingleEndpoint"
+        route = get_table_endpoint_route(table, "POST", "SINGLE")
+        endpoint = get_table_endpoint_name(table, "POST", "SINGLE")
         representations = request_schema
         db_table = table
+        invalidates = [table_name]
 
         def request(self, **args) -> ResourceResponse:
             """
@@ -329,9 +475,9 @@ def create_post_single_endpoint_class(table: dict, allowed_columns: List, allowe
                 response.response = _data
 
             except sqlalchemy.exc.IntegrityError as e:
-                if isinstance(e.orig, psycopg2.errors.UniqueViolation):
+                if _is_unique_violation(e):
                     raise RequestInvalidFieldSchemaError(message=e.orig)
-                if isinstance(e.orig, psycopg2.errors.ForeignKeyViolation):
+                if _is_foreign_key_violation(e):
                     raise RequestInvalidFieldSchemaError(message=e.orig)
 
             response.audit = AuditLog(
@@ -398,7 +544,6 @@ def create_delete_single_endpoint_class(table: dict, allowed_columns: List, allo
     :param repository: Repository:
 
     """
-    table_slug = table["slug"]
     table_name = table["name"]
     model_name = table["model_name"]
     id_field = table["id_field"]
@@ -411,10 +556,11 @@ def create_delete_single_endpoint_class(table: dict, allowed_columns: List, allo
     class DeleteSingleEndpoint(AutomaticResource):
         """ """
 
-        route = f"/delete/{table_slug}/<{id_field_where_type}id>"
-        endpoint = f"{model_name}DeleteSingleEndpoint"
+        route = get_table_endpoint_route(table, "DELETE", "SINGLE")
+        endpoint = get_table_endpoint_name(table, "DELETE", "SINGLE")
         representations = request_schema
         db_table = table
+        invalidates = [table_name, *soft_delete_extension.get_cascade_tables()]
 
         def request(self, **args) -> ResourceResponse:
             """
@@ -451,7 +597,7 @@ def create_delete_single_endpoint_class(table: dict, allowed_columns: List, allo
                     )
 
             except sqlalchemy.exc.IntegrityError as e:
-                if isinstance(e.orig, psycopg2.errors.ForeignKeyViolation):
+                if _is_foreign_key_violation(e):
                     response.response["errors"].append(f"ForeignKeyViolation : {e.orig}")
                     response.response["code"] = 400
                 else:
@@ -509,7 +655,6 @@ def create_get_list_endpoint_class(  # noqa C901
     :param repository: Repository:
 
     """
-    table_slug = table["slug"]
     table_name = table["name"]
     model_name = table["model_name"]
     id_field = table["id_field"]
@@ -517,20 +662,35 @@ def create_get_list_endpoint_class(  # noqa C901
     request_schema_query_filters = get_list_filtered_request_swagger_schema(model_name, allowed_columns_map)
     response_schema_query_filters = get_list_filtered_request_swagger_schema(model_name, allowed_columns_map)
     response_schema = get_list_filtered_response_swagger_schema(allowed_columns_map, response_schema_query_filters, f"{model_name}GetListEndpoint")
-    swagger_schema = get_get_list_endpoint_schema(model_name, response_schema, request_schema_query_filters)
-    filter_schema = get_filter_schema(model_name).definitions()
-    order_schema = get_order_schema(model_name).definitions()
-    size_schema = get_size_schema(model_name).definitions()
+    columnar_response_schema = get_list_columnar_response_swagger_schema(
+        allowed_columns_map, response_schema_query_filters, f"{model_name}GetListEndpoint"
+    )
+    swagger_schema = get_get_list_endpoint_schema(model_name, response_schema, request_schema_query_filters, columnar_response_schema)
+    filter_validator = SchemaValidator(get_filter_schema(model_name).definitions())
+    order_validator = SchemaValidator(get_order_schema(model_name).definitions())
+    size_validator = SchemaValidator(get_size_schema(model_name).definitions())
+    order_default = order_validator.validated({"field": [id_field], "direction": "asc"})
+    size_default = size_validator.validated({"limit": 100, "offset": 0})
     soft_delete_extension = extensions["soft_delete"]
+    last_modified_field = _get_last_modified_field(table, extensions)
+    row_serializer = RowSerializer({column: allowed_columns_map[column] for column in allowed_columns})
 
     class GetListEndpoint(AutomaticResource):
         """ """
 
-        route = f"/read/{inflector.plural(table_slug)}"
-        endpoint = f"{model_name}GetListEndpoint"
+        route = get_table_endpoint_route(table, "GET", "LIST")
+        endpoint = get_table_endpoint_name(table, "GET", "LIST")
         representations = swagger_schema
         db_table = table
 
+        def cache_key(self, **args) -> str:
+            """
+
+            :param **args:
+
+            """
+            return f'{negotiate_list_mimetype()}:{simplejson.dumps(args["validation_output"], sort_keys=True)}'
+
         def validate_request(self, **args):
             """
 
@@ -539,43 +699,37 @@ def create_get_list_endpoint_class(  # noqa C901
             """
             query = {}
             errors = {}
-            schema = filter_schema
             for parameter_name in allowed_columns_map.keys():
-                self.validate_query_parameter(errors, parameter_name, query, schema)
+                self.validate_query_parameter(errors, parameter_name, query, filter_validator)
 
-            parameter_name = "order"
-            schema = order_schema
-            self.validate_query_parameter(errors, parameter_name, query, schema, default={"field": [id_field], "direction": "asc"})
-
-            parameter_name = "size"
-            schema = size_schema
-            self.validate_query_parameter(errors, parameter_name, query, schema, default={"limit": 100, "offset": 0})
+            self.validate_query_parameter(errors, "order", query, order_validator, default=order_default)
+            self.validate_query_parameter(errors, "size", query, size_validator, default=size_default)
 
             if len(errors.keys()) > 0:
                 raise ValidationError(errors)
 
             return query
 
-        def validate_query_parameter(self, errors, parameter_name, query, schema, default=None):
+        def validate_query_parameter(self, errors, parameter_name, query, validator: SchemaValidator, default=None):
             """
 
             :param errors:
             :param parameter_name:
             :param query:
-            :param schema:
-            :param default:  (Default value = None)
+            :param validator: SchemaValidator:
+            :param default: already validated value when the parameter is not given (Default value = None)
 
             """
-            try:
-                value = request.args.get(parameter_name)
-                if value is not None:
-                    json_value = simplejson.loads(value)
-                    json_swagger_schema_validator(json_value, schema)
-                    query[parameter_name] = json_value
-
-                if value is None and default is not None:
-                    json_swagger_schema_validator(default, schema)
+            value = request.args.get(parameter_name)
+            if value is None:
+                if default is not None:
                     query[parameter_name] = default
+                return
+
+            try:
+                json_value = simplejson.loads(value)
+                validator.validate(json_value)
+                query[parameter_name] = json_value
             except JsonSchemaValidationError as e:
                 error_msg = e.message.replace("\n", " ")
                 if parameter_name not in errors.keys():
@@ -602,30 +756,167 @@ def create_get_list_endpoint_class(  # noqa C901
             query_no_limit = query.copy()
             del query_no_limit["size"]
             query_no_limit_params = {k: v["value"] for k, v in query_no_limit.items() if "op" in v}
-            count_sql = create_select_filtered_paginated_query_count(table_name, query_no_limit, id_field)
-
-            count_record = repository.execute(count_sql, query_no_limit_params).one()._asdict()
-            count = count_record.get("count")
+            count, last_modified = self.count_records(query_no_limit, query_no_limit_params)
+            mimetype = negotiate_list_mimetype()
 
             response = ResourceResponse()
+            response.headers = {"Vary": "Accept"}
+            response.audit = AuditLog(
+                f"Read List {table_name} record",
+                action="READ",
+                current_status={"deleted": "deleted"},
+                prev_status=args["validation_output"],
+                change_parameters={"entity": model_name},
+            )
             data = {}
+            if count > 0 and mimetype in (MIMETYPE_ARROW_STREAM, MIMETYPE_COLUMNAR_JSON):
+                response.mimetype = mimetype
 
+            if count > 0 and last_modified_field is not None:
+                response.set_validators(last_modified, count, simplejson.dumps(args["validation_output"], sort_keys=True), mimetype)
+                if response.is_not_modified(response.get_negotiated_etag()):
+                    # the validators come from the count, the page is neither queried nor serialized
+                    response.http_code = 304
+                    return response
+
+            record = []
             if count > 0:
                 query_params = {k: v["value"] for k, v in query.items() if "op" in v}
                 sql = create_select_filtered_paginated_ordered_query(table_name, allowed_columns, query)
                 record = repository.execute(sql, query_params)
-                data = record.fetchall()
 
             if soft_delete_extension.enabled:
                 query = soft_delete_extension.unset_field_data(query)
-
-            response.response = {"data": data, "_meta": {**query, **{"total_records": count}}}
+            meta = {**query, **{"total_records": count}}
 
             if count == 0:
+                response.response = {"data": data, "_meta": meta}
                 response.http_code = 404
+            elif mimetype == MIMETYPE_ARROW_STREAM:
+                response.response = row_serializer.arrow_ipc(record, meta)
+            elif mimetype == MIMETYPE_COLUMNAR_JSON:
+                response.response = {"columns": row_serializer.columns, "rows": row_serializer.lists(record), "_meta": meta}
+            else:
+                response.response = {"data": row_serializer.dicts(record), "_meta": meta}
+
+            if count > 0 and response.etag is None:
+                response.set_body_etag()
+
+            return response
+
+        def count_records(self, query_no_limit: dict, query_no_limit_params: dict) -> tuple:
+            """Total of records matching the filters and their last update timestamp, shared by all the pages through the table cache
+
+            :param query_no_limit: dict:
+            :param query_no_limit_params: dict:
+
+            """
+            table_cache = self.get_table_cache()
+            count_cache_key = None
+            if table_cache is not None:
+                query_filters = {k: v for k, v in query_no_limit.items() if k != "order"}
+                count_cache_key = f"{self.endpoint}:count:{simplejson.dumps(query_filters, sort_keys=True)}"
+                cached = table_cache.get(count_cache_key)
+                if cached is not None:
+                    return cached
+
+            count_sql = create_select_filtered_paginated_query_count(table_name, query_no_limit, id_field, last_modified_field)
+            count_record = repository.execute(count_sql, query_no_limit_params).one()._asdict()
+            count = (count_record.get("count"), count_record.get("last_modified"))
+
+            if count_cache_key is not None:
+                table_cache.set(count_cache_key, count)
+
+            return count
+
+        @swagger.doc(swagger_schema)
+        def get(self):
+            """ """
+            return self.process_request()
+
+    GetListEndpoint.__name__ = GetListEndpoint.endpoint
+    return GetListEndpoint
+
+
+def create_export_list_endpoint_class(table: dict, allowed_columns: List, allowed_columns_map: dict, extensions: dict, repository: Repository):
+    """Streamed export of the table records, with the filters and order of the GET LIST endpoint
+
+    :param table: dict:
+    :param allowed_columns: List:
+    :param allowed_columns_map: dict:
+    :param extensions: dict:
+    :param repository: Repository:
+
+    """
+    table_slug = table["slug"]
+    table_name = table["name"]
+    model_name = table["model_name"]
+    export_config = table["export"]
+    plural_slug = _get_inflector().plural(table_slug)
+
+    request_schema_query_filters = get_list_filtered_request_swagger_schema(model_name, allowed_columns_map)
+    swagger_schema = get_export_list_endpoint_schema(model_name, request_schema_query_filters)
+    soft_delete_extension = extensions["soft_delete"]
+    row_serializer = RowSerializer({column: allowed_columns_map[column] for column in allowed_columns})
+    file_extensions = {MIMETYPE_CSV: "csv", MIMETYPE_NDJSON: "ndjson"}
+
+    GetListEndpoint = create_get_list_endpoint_class(table, allowed_columns, allowed_columns_map, extensions, repository)
+
+    class ExportListEndpoint(GetListEndpoint):
+        """ """
+
+        route = get_table_endpoint_route(table, "EXPORT", "LIST")
+        endpoint = get_table_endpoint_name(table, "EXPORT", "LIST")
+        representations = swagger_schema
+        db_table = table
+
+        def cache_key(self, **args) -> str:
+            """Streamed responses are never cached
+
+            :param **args:
+
+            """
+            return None
+
+        def validate_request(self, **args):
+            """
+
+            :param **args:
 
+            """
+            query = super().validate_request(**args)
+            if request.args.get("size") is None:
+                del query["size"]
+
+            return query
+
+        def request(self, **args) -> ResourceResponse:
+            """
+
+            :param **args:
+
+            """
+            query = args["validation_output"]
+            if soft_delete_extension.enabled:
+                query, _qv = soft_delete_extension.add_query_filter(query, {})
+            query_params = {k: v["value"] for k, v in query.items() if "op" in v}
+            if "size" in query:
+                sql = create_select_filtered_paginated_ordered_query(table_name, allowed_columns, query)
+            else:
+                sql = create_select_filtered_ordered_query(table_name, allowed_columns, query)
+
+            mimetype = negotiate_export_mimetype(export_config["format"])
+            chunks = repository.execute_stream(sql, query_params, export_config["chunk_size"])
+
+            response = ResourceResponse()
+            response.response = row_serializer.csv(chunks) if mimetype == MIMETYPE_CSV else row_serializer.ndjson(chunks)
+            response.mimetype = mimetype
+            response.headers = {
+                "Vary": "Accept",
+                "Content-Disposition": f'attachment; filename="{plural_slug}.{file_extensions[mimetype]}"',
+            }
             response.audit = AuditLog(
-                f"Read List {table_name} record",
+                f"Export {table_name} records",
                 action="READ",
                 current_status={"deleted": "deleted"},
                 prev_status=args["validation_output"],
@@ -639,8 +930,8 @@ def create_get_list_endpoint_class(  # noqa C901
             """ """
             return self.process_request()
 
-    GetListEndpoint.__name__ = GetListEndpoint.endpoint
-    return GetListEndpoint
+    ExportListEndpoint.__name__ = ExportListEndpoint.endpoint
+    return ExportListEndpoint
 
 
 def create_put_list_endpoint_class(  # noqa C901
@@ -655,14 +946,17 @@ def create_put_list_endpoint_class(  # noqa C901
     :param repository: Repository:
 
     """
-    table_slug = table["slug"]
     table_name = table["name"]
     model_name = table["model_name"]
     id_field = table["id_field"]
 
     create_extension = extensions["on_create_timestamp"]
 
+    stream_body = table["stream_body"]
+    body_limits = BodyLimits(table["limits"]["max_body_size"], table["limits"]["max_items"])
+
     form_class, form_schema_model = _get_form(table["model_name"], allowed_columns_map, "putList", extensions)
+    batch_validator = BatchFormValidator(form_class)
 
     request_schema = get_put_list_endpoint_schema(model_name, form_schema_model)
 
@@ -673,10 +967,11 @@ def create_put_list_endpoint_class(  # noqa C901
     class PutListEndpoint(AutomaticResource):
         """ """
 
-        route = f"/create/{inflector.plural(table_slug)}"
-        endpoint = f"{model_name}PutListEndpoint"
+        route = get_table_endpoint_route(table, "PUT", "LIST")
+        endpoint = get_table_endpoint_name(table, "PUT", "LIST")
         representations = request_schema
         db_table = table
+        invalidates = [table_name]
 
         def validate_request(self, **args):
             """
@@ -684,18 +979,34 @@ def create_put_list_endpoint_class(  # noqa C901
             :param **args:
 
             """
-            if hasattr(form_schema_model, "maxItems") and len(args["data"]) > form_schema_model.maxItems:
-                raise ValidationError(message=f"Body too large, max items: {form_schema_model.maxItems}")
-            if hasattr(form_schema_model, "minItems") and len(args["data"]) < form_schema_model.minItems:
-                raise ValidationError(message=f"Body too small, min items: {form_schema_model.minItems}")
-            forms = args["form"]
-            errors = {}
-            for i, form in enumerate(forms):
-                if not form.validate():
-                    errors[i] = form.errors
+            if args.get("chunks") is not None:
+                # validated chunk by chunk while the body is written
+                return None
+            return self.validate_items(args["data"])
+
+        def validate_items(self, items: List, offset: int = 0) -> List[dict]:
+            """
+
+            :param items: List:
+            :param offset: int: index of the first item in the body  (Default value = 0)
+
+            """
+            form_data, errors = batch_validator.validate(items)
 
             if len(errors.keys()) > 0:
-                raise ValidationError(message=simplejson.dumps(errors))
+                raise ValidationError(message=simplejson.dumps({offset + i: error for i, error in errors.items()}))
+
+            return form_data
+
+        def write(self, form_data: List[dict]) -> int:
+            """
+
+            :param form_data: List[dict]:
+
+            """
+            if create_extension.enabled:
+                form_data = [create_extension.set_field_data(_form_data) for _form_data in form_data]
+            return repository.insert_batch(table_name, columns, form_data, returning_field=id_field)
 
         def request(self, **args) -> ResourceResponse:
             """
@@ -703,27 +1014,25 @@ def create_put_list_endpoint_class(  # noqa C901
             :param **args:
 
             """
-            forms = args["form"]
-            form_data = []
-            for form in forms:
-                _form_data = form.data
-                if create_extension.enabled:
-                    _form_data = create_extension.set_field_data(_form_data)
-                form_data.append(_form_data)
-            # form_data = [form.data for form in forms]
             response = ResourceResponse()
             response.response = {"message": "error", "details": []}
 
             try:
-
-                result = repository.insert_batch(table_name, columns, form_data, returning_field=id_field)
+                if args.get("chunks") is not None:
+                    result = _write_chunks(
+                        repository,
+                        args["chunks"],
+                        lambda chunk, offset: self.write(self.validate_items(chunk, offset)),
+                    )
+                else:
+                    result = self.write(args["validation_output"])
                 response.response["message"] = f"Affected rows: {result}"
                 response.response["code"] = 200
                 response.http_code = 200
             except sqlalchemy.exc.IntegrityError as e:
-                if isinstance(e.orig, psycopg2.errors.UniqueViolation):
+                if _is_unique_violation(e):
                     raise ValidationError(message=e.orig)
-                if isinstance(e.orig, psycopg2.errors.ForeignKeyViolation):
+                if _is_foreign_key_violation(e):
                     raise ValidationError(message=e.orig)
 
             return response
@@ -731,9 +1040,7 @@ def create_put_list_endpoint_class(  # noqa C901
         @swagger.doc(request_schema)
         def put(self):
             """ """
-            data = request.json
-            form = [form_class(data=item) for item in data]
-            return self.process_request(form=form, data=data)
+            return self.process_request(**_read_list_body(body_limits, stream_body))
 
     PutListEndpoint.__name__ = PutListEndpoint.endpoint
 
@@ -752,11 +1059,13 @@ def create_post_list_endpoint_class(  # noqa C901
     :param repository: Repository:
 
     """
-    table_slug = table["slug"]
     table_name = table["name"]
     model_name = table["model_name"]
     id_field = table["id_field"]
+    stream_body = table["stream_body"]
+    body_limits = BodyLimits(table["limits"]["max_body_size"], table["limits"]["max_items"])
     form_class, form_schema_model = _get_form(model_name, allowed_columns_map, "postList", extensions)
+    batch_validator = BatchFormValidator(form_class)
 
     request_schema = get_post_list_endpoint_schema(model_name, form_schema_model)
     extension = extensions["on_update_timestamp"]
@@ -764,10 +1073,11 @@ def create_post_list_endpoint_class(  # noqa C901
     class PostListEndpoint(AutomaticResource):
         """ """
 
-        route = f"/update/{inflector.plural(table_slug)}"
-        endpoint = f"{model_name}PostListEndpoint"
+        route = get_table_endpoint_route(table, "POST", "LIST")
+        endpoint = get_table_endpoint_name(table, "POST", "LIST")
         representations = request_schema
         db_table = table
+        invalidates = [table_name]
 
         def validate_request(self, **args):
             """
@@ -775,19 +1085,21 @@ def create_post_list_endpoint_class(  # noqa C901
             :param **args:
 
             """
-            forms = args["form"]
-            if hasattr(args["data"], "maxItems") and len(args["data"]) > form_schema_model.maxItems:
-                raise ValidationError(message=f"Body too large, max items: {form_schema_model.maxItems}")
-            if hasattr(args["data"], "minItems") and len(args["data"]) < form_schema_model.minItems:
-                raise ValidationError(message=f"Body too small, min items: {form_schema_model.minItems}")
+            if args.get("chunks") is not None:
+                # validated chunk by chunk while the body is written
+                return None
+            return self.validate_items(args["data"])
 
-            errors = {}
-            ids = []
-            for i, form in enumerate(forms):
-                _data = form.data
-                ids.append(_data[id_field])
-                if not form.validate():
-                    errors[i] = form.errors
+        def validate_items(self, items: List, offset: int = 0) -> List[dict]:
+            """
+
+            :param items: List:
+            :param offset: int: index of the first item in the body  (Default value = 0)
+
+            """
+            form_data, errors = batch_validator.validate(items)
+            errors = {offset + i: error for i, error in errors.items()}
+            ids = [_data[id_field] for _data in form_data]
 
             ids_check_sql = _MAGIC_QUERIES[repository.db_dialect]["get_ids_not_in_table_from_list"](
                 {
@@ -806,45 +1118,58 @@ def create_post_list_endpoint_class(  # noqa C901
             if len(errors.keys()) > 0:
                 raise ValidationError(message=simplejson.dumps(errors))
 
+            return form_data
+
         def request(self, **args) -> ResourceResponse:
             """
 
             :param **args:
 
             """
-            forms = args["form"]
-            form_data = []
-            for form in forms:
-                _form_data = form.data
-                if extension.enabled:
-                    _form_data = extension.set_field_data(_form_data)
-
-                form_data.append(_form_data)
             response = ResourceResponse()
             try:
-                repository.update_batch(table_name, form_data, where_field=id_field)
-                response.response = form_data
+                if args.get("chunks") is not None:
+                    # the updated records are not sent back, they are never held all at once
+                    result = _write_chunks(
+                        repository,
+                        args["chunks"],
+                        lambda chunk, offset: self.write(self.validate_items(chunk, offset)),
+                    )
+                    response.response = {"message": f"Affected rows: {result}"}
+                else:
+                    response.response = self.write(args["validation_output"])
             except sqlalchemy.exc.IntegrityError as e:
-                if isinstance(e.orig, psycopg2.errors.UniqueViolation):
+                if _is_unique_violation(e):
                     raise ValidationError(message=e.orig)
-                if isinstance(e.orig, psycopg2.errors.ForeignKeyViolation):
+                if _is_foreign_key_violation(e):
                     raise ValidationError(message=e.orig)
 
             return response
 
+        def write(self, form_data: List[dict]) -> List[dict]:
+            """
+
+            :param form_data: List[dict]:
+
+            """
+            if extension.enabled:
+                form_data = [extension.set_field_data(_form_data) for _form_data in form_data]
+            repository.update_batch(table_name, form_data, where_field=id_field)
+            return form_data
+
         @swagger.doc(request_schema)
         def post(self):
             """ """
-            data = request.json
-            form = [form_class(data=item) for item in data]
-            return self.process_request(form=form, data=data)
+            return self.process_request(**_read_list_body(body_limits, stream_body))
 
     PostListEndpoint.__name__ = PostListEndpoint.endpoint
 
     return PostListEndpoint
 
 
-def create_delete_list_endpoint_class(table: dict, allowed_columns: List, allowed_columns_map: dict, extensions: dict, repository: Repository):
+def create_delete_list_endpoint_class(  # noqa C901
+    table: dict, allowed_columns: List, allowed_columns_map: dict, extensions: dict, repository: Repository
+):
     """
 
     :param table: dict:
@@ -854,7 +1179,6 @@ def create_delete_list_endpoint_class(table: dict, allowed_columns: List, allowe
     :param repository: Repository:
 
     """
-    table_slug = table["slug"]
     table_name = table["name"]
     model_name = table["model_name"]
     id_field = table["id_field"]
@@ -865,16 +1189,20 @@ def create_delete_list_endpoint_class(table: dict, allowed_columns: List, allowe
         f"{model_name}DeleteListRequestSchema", {"type": "array", "description": "Id list", "items": {"type": id_field_where_type}}
     )
     request_schema = get_delete_list_endpoint_schema(model_name, request_body_schema)
+    request_body_validator = SchemaValidator(request_body_schema.definitions())
+    stream_body = table["stream_body"]
+    body_limits = BodyLimits(table["limits"]["max_body_size"], table["limits"]["max_items"])
 
     extension = extensions["soft_delete"]
 
     class DeleteListEndpoint(AutomaticResource):
         """ """
 
-        route = f"/delete/{inflector.plural(table_slug)}"
-        endpoint = f"{model_name}DeleteListEndpoint"
+        route = get_table_endpoint_route(table, "DELETE", "LIST")
+        endpoint = get_table_endpoint_name(table, "DELETE", "LIST")
         representations = request_schema
         db_table = table
+        invalidates = [table_name, *extension.get_cascade_tables()]
 
         def validate_request(self, **args):
             """
@@ -882,10 +1210,21 @@ def create_delete_list_endpoint_class(table: dict, allowed_columns: List, allowe
             :param **args:
 
             """
-            ids = args["data"]
+            if args.get("chunks") is not None:
+                # validated chunk by chunk while the ids are deleted
+                return None
+
+            self.validate_items(args["data"])
+
+        def validate_items(self, ids: List):
+            """
+
+            :param ids: List:
+
+            """
             errors = {}
             try:
-                json_swagger_schema_validator(ids, request_body_schema.definitions())
+                request_body_validator.validate(ids)
             except JsonSchemaValidationError as e:
                 raise ValidationError(message=e)
 
@@ -911,28 +1250,46 @@ def create_delete_list_endpoint_class(table: dict, allowed_columns: List, allowe
             :param **args:
 
             """
-            data = args["data"]
-
             response = ResourceResponse()
             try:
-                if extension.enabled:
-                    extension.soft_delete_batch(table_name, extension.config["default_field"], id_field, data)
+                if args.get("chunks") is not None:
+                    _write_chunks(repository, args["chunks"], self.write_chunk)
                 else:
-                    repository.delete_batch(table_name, data)
+                    self.write(args["data"])
                 response.response = "ok"
             except sqlalchemy.exc.IntegrityError as e:
-                if isinstance(e.orig, psycopg2.errors.UniqueViolation):
+                if _is_unique_violation(e):
                     raise ValidationError(message=e.orig)
-                if isinstance(e.orig, psycopg2.errors.ForeignKeyViolation):
+                if _is_foreign_key_violation(e):
                     raise ValidationError(message=e.orig)
 
             return response
 
+        def write_chunk(self, ids: List, offset: int):
+            """
+
+            :param ids: List:
+            :param offset: int:
+
+            """
+            self.validate_items(ids)
+            self.write(ids)
+
+        def write(self, ids: List):
+            """
+
+            :param ids: List:
+
+            """
+            if extension.enabled:
+                extension.soft_delete_batch(table_name, extension.config["default_field"], id_field, ids)
+            else:
+                repository.delete_batch(table_name, ids)
+
         @swagger.doc(request_schema)
         def delete(self):
             """ """
-            data = request.json
-            return self.process_request(data=data)
+            return self.process_request(**_read_list_body(body_limits, stream_body))
 
     DeleteListEndpoint.__name__ = DeleteListEndpoint.endpoint
 
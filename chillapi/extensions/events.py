@@ -34,6 +34,9 @@ class BeforeRequestEvent(EventDto):
 class BeforeResponseEvent(EventDto):
     """ """
 
+    # the payload of a cached response is copied for events that may change it, otherwise its encoded body is shared
+    changes_response = True
+
     @abc.abstractmethod
     def on_event(
         self, resource: AutomaticResource, response: ResourceResponse, before_request_event: BeforeRequestEvent = None, **args
@@ -78,6 +81,8 @@ class NullBeforeRequestEvent(BeforeRequestEvent):
 class NullBeforeResponseEvent(BeforeResponseEvent):
     """ """
 
+    changes_response = False
+
     def on_event(self, resource: AutomaticResource, **args) -> BeforeRequestEventType:
         """
 
@@ -67,6 +67,23 @@ class SoftDeleteExtension(TableExtension):
                         _extension_field=self.config["default_field"],
                     )
 
+    def get_cascade_tables(self):
+        """Tables updated by the cascade options when a record is soft deleted"""
+        tables = []
+
+        def collect_table(**args):
+            """
+
+            :param **args:
+
+            """
+            tables.append(args["_relation_table"])
+
+        if self.enabled:
+            self._walk_cascade_options(one_to_many=collect_table, many_to_many=collect_table)
+
+        return tables
+
     def validate(self):
         """ """
         super().validate()
@@ -0,0 +1,122 @@
+"""MessagePack and CBOR bodies, offered next to JSON when `msgpack` and `cbor2` are installed.
+
+MessagePack responses are the same documents as the JSON ones: rows as maps, dates as HTTP dates, UUIDs as strings and
+Decimals as floats. CBOR has its own tags for those types and uses them, naive datetimes taken as UTC.
+"""
+import uuid
+from datetime import date, timezone
+from decimal import Decimal
+
+from flask import request
+from werkzeug.exceptions import BadRequest
+
+from .json_encoder import to_http_date
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None
+
+MIMETYPE_MSGPACK = "application/msgpack"
+MIMETYPE_CBOR = "application/cbor"
+# still sent by many MessagePack clients
+MIMETYPE_X_MSGPACK = "application/x-msgpack"
+
+
+def get_binary_mimetypes() -> list:
+    """Binary formats whose library is installed"""
+    mimetypes = []
+    if msgpack is not None:
+        mimetypes.append(MIMETYPE_MSGPACK)
+    if cbor2 is not None:
+        mimetypes.append(MIMETYPE_CBOR)
+    return mimetypes
+
+
+def _msgpack_default(o):
+    """
+
+    :param o:
+
+    """
+    if hasattr(o, "_asdict"):
+        return o._asdict()
+    if isinstance(o, date):
+        return to_http_date(o)
+    if isinstance(o, Decimal):
+        return float(o)
+    if isinstance(o, uuid.UUID):
+        return str(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {o.__class__.__name__} is not MessagePack serializable")
+
+
+def _rows_as_dicts(data):
+    """Rows of `data` as dicts, cbor2 6 encodes the rows as arrays before calling `default` since they are sequences
+
+    :param data:
+
+    """
+    if hasattr(data, "_asdict"):
+        return {key: _rows_as_dicts(value) for key, value in data._asdict().items()}
+    if isinstance(data, dict):
+        return {key: _rows_as_dicts(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_rows_as_dicts(value) for value in data]
+    return data
+
+
+def _cbor_default(encoder, o):
+    """
+
+    :param encoder:
+    :param o:
+
+    """
+    if hasattr(o, "__html__"):
+        encoder.encode(str(o.__html__()))
+        return
+    raise cbor2.CBOREncodeTypeError(f"Object of type {o.__class__.__name__} is not CBOR serializable")
+
+
+def dumps(mimetype: str, data) -> bytes:
+    """
+
+    :param mimetype: str: MIMETYPE_MSGPACK or MIMETYPE_CBOR
+    :param data:
+
+    """
+    if mimetype == MIMETYPE_CBOR:
+        return cbor2.dumps(_rows_as_dicts(data), default=_cbor_default, timezone=timezone.utc, date_as_datetime=True)
+    return msgpack.packb(data, default=_msgpack_default, use_bin_type=True)
+
+
+def loads(mimetype: str, body: bytes):
+    """
+
+    :param mimetype: str: MIMETYPE_MSGPACK, MIMETYPE_X_MSGPACK or MIMETYPE_CBOR
+    :param body: bytes:
+
+    """
+    try:
+        if mimetype == MIMETYPE_CBOR:
+            return cbor2.loads(body)
+        return msgpack.unpackb(body, raw=False, timestamp=3)
+    except Exception as e:
+        raise BadRequest(f"Failed to decode {mimetype} object: {e}")
+
+
+def get_request_data():
+    """Request body decoded as its Content-Type says, `request.json` for anything but MessagePack and CBOR"""
+    mimetype = request.mimetype
+    if mimetype in (MIMETYPE_MSGPACK, MIMETYPE_X_MSGPACK) and msgpack is not None:
+        return loads(mimetype, request.get_data())
+    if mimetype == MIMETYPE_CBOR and cbor2 is not None:
+        return loads(mimetype, request.get_data())
+    return request.json
@@ -0,0 +1,243 @@
+"""Response compression negotiated with the `Accept-Encoding` header.
+
+gzip is always offered, brotli and zstd when the `brotli` and `zstandard` packages are installed. Buffered responses
+are compressed at once if they reach the configured minimum size, streamed responses chunk by chunk, flushing each
+chunk so the client gets the rows as they are read.
+"""
+import zlib
+from typing import Callable, Iterable, Iterator, List
+
+from flask import Flask, request
+
+from ..exceptions.api_manager import ConfigError
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+ENCODING_GZIP = "gzip"
+ENCODING_BROTLI = "br"
+ENCODING_ZSTD = "zstd"
+ENCODINGS = [ENCODING_BROTLI, ENCODING_ZSTD, ENCODING_GZIP]
+
+# already compressed formats, compressing them again only wastes CPU
+_COMPRESSED_MIMETYPE_PREFIXES = ("image/", "video/", "audio/", "font/woff")
+_COMPRESSIBLE_MIMETYPES = ("image/svg+xml",)
+_COMPRESSED_MIMETYPES = (
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "application/zstd",
+    "application/x-bzip2",
+    "application/x-xz",
+    "application/x-7z-compressed",
+    "application/x-rar-compressed",
+    "application/pdf",
+)
+
+
+def get_available_encodings() -> List[str]:
+    """Encodings whose library is installed, in the default preference order"""
+    return [
+        encoding
+        for encoding in ENCODINGS
+        if (encoding != ENCODING_BROTLI or brotli is not None) and (encoding != ENCODING_ZSTD or zstandard is not None)
+    ]
+
+
+def is_compressible(mimetype: str) -> bool:
+    """
+
+    :param mimetype: str:
+
+    """
+    if mimetype is None:
+        return False
+    if mimetype in _COMPRESSIBLE_MIMETYPES:
+        return True
+    return not (mimetype in _COMPRESSED_MIMETYPES or mimetype.startswith(_COMPRESSED_MIMETYPE_PREFIXES))
+
+
+def _gzip_compressor(level: int) -> Callable:
+    """Function compressing a chunk, an empty one to finish the stream
+
+    :param level: int:
+
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress_chunk(chunk: bytes) -> bytes:
+        """
+
+        :param chunk: bytes:
+
+        """
+        if not chunk:
+            return compressor.flush(zlib.Z_FINISH)
+        return compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    return compress_chunk
+
+
+def _brotli_compressor(level: int) -> Callable:
+    """
+
+    :param level: int:
+
+    """
+    compressor = brotli.Compressor(quality=level)
+
+    def compress_chunk(chunk: bytes) -> bytes:
+        """
+
+        :param chunk: bytes:
+
+        """
+        if not chunk:
+            return compressor.finish()
+        return compressor.process(chunk) + compressor.flush()
+
+    return compress_chunk
+
+
+def _zstd_compressor(level: int) -> Callable:
+    """
+
+    :param level: int:
+
+    """
+    compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress_chunk(chunk: bytes) -> bytes:
+        """
+
+        :param chunk: bytes:
+
+        """
+        if not chunk:
+            return compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+        return compressor.compress(chunk) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    return compress_chunk
+
+
+_COMPRESSORS = {
+    ENCODING_GZIP: _gzip_compressor,
+    ENCODING_BROTLI: _brotli_compressor,
+    ENCODING_ZSTD: _zstd_compressor,
+}
+
+
+def compress(encoding: str, level: int, data: bytes) -> bytes:
+    """Whole body compression
+
+    :param encoding: str:
+    :param level: int:
+    :param data: bytes:
+
+    """
+    if encoding == ENCODING_GZIP:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+    if encoding == ENCODING_BROTLI:
+        return brotli.compress(data, quality=level)
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def compress_chunks(encoding: str, level: int, chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compressed stream of the chunks, each one flushed so it can be decoded on arrival
+
+    :param encoding: str:
+    :param level: int:
+    :param chunks: Iterable[bytes]:
+
+    """
+    compress_chunk = _COMPRESSORS[encoding](level)
+    try:
+        for chunk in chunks:
+            if chunk:
+                yield compress_chunk(chunk if isinstance(chunk, bytes) else chunk.encode())
+        yield compress_chunk(b"")
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
+class ResponseCompression:
+    """Compresses the app responses with the best encoding the client accepts"""
+
+    def __init__(self, encodings: List[str], min_size: int = 1024, level: dict = None):
+        unknown = [encoding for encoding in encodings if encoding not in ENCODINGS]
+        if unknown:
+            raise ConfigError(f"compression encodings must be some of {', '.join(ENCODINGS)}, {', '.join(unknown)} given")
+
+        available = get_available_encodings()
+        self.encodings = [encoding for encoding in encodings if encoding in available]
+        self.min_size = min_size
+        self.level = {**{ENCODING_GZIP: 6, ENCODING_BROTLI: 4, ENCODING_ZSTD: 3}, **(level or {})}
+
+    def negotiate(self) -> str:
+        """Encoding for the request `Accept-Encoding`, None to send the response as it is"""
+        return request.accept_encodings.best_match(self.encodings)
+
+    def after_request(self, response):
+        """
+
+        :param response:
+
+        """
+        if (
+            request.method == "HEAD"
+            or response.status_code < 200
+            or response.status_code in (204, 206, 304)
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or not is_compressible(response.mimetype)
+        ):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        encoding = self.negotiate()
+        if encoding is None:
+            return response
+
+        level = self.level[encoding]
+        if response.is_streamed:
+            response.response = compress_chunks(encoding, level, response.response)
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            response.set_data(compress(encoding, level, data))
+
+        response.headers["Content-Encoding"] = encoding
+        # the representation changed, as nginx does the ETag keeps matching If-None-Match but only weakly
+        etag, weak = response.get_etag()
+        if etag is not None and not weak:
+            response.set_etag(etag, weak=True)
+
+        return response
+
+
+def register_compression(app: Flask, compression_config: dict) -> ResponseCompression:
+    """Compression of the app responses, None if not enabled
+
+    :param app: Flask:
+    :param compression_config: dict:
+
+    """
+    if not compression_config["enable"]:
+        return None
+
+    compression = ResponseCompression(compression_config["encodings"], compression_config["min_size"], compression_config["level"])
+    app.after_request(compression.after_request)
+
+    return compression
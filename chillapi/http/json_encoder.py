@@ -0,0 +1,145 @@
+"""JSON encoding of the endpoint responses.
+
+orjson 3.9 or later is used when it is installed, producing the same documents as Flask `jsonify`: SQLAlchemy rows as
+objects, dates as HTTP dates, UUIDs as strings and Decimals as exact numbers. Otherwise, or when `app.json_encoder` is
+`flask`, the responses go through `jsonify` as always.
+"""
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import List
+
+from flask import current_app, json, jsonify, make_response
+
+from ..exceptions.api_manager import ConfigError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if orjson is not None and not hasattr(orjson, "Fragment"):  # pragma: no cover
+    # before 3.9 Decimals could only be written as floats, losing the exact numbers jsonify writes
+    orjson = None
+
+JSON_ENCODER_AUTO = "auto"
+JSON_ENCODER_ORJSON = "orjson"
+JSON_ENCODER_FLASK = "flask"
+JSON_ENCODERS = [JSON_ENCODER_AUTO, JSON_ENCODER_ORJSON, JSON_ENCODER_FLASK]
+
+_use_orjson = orjson is not None
+
+
+def set_json_encoder(name: str):
+    """
+
+    :param name: str: auto, orjson or flask
+
+    """
+    global _use_orjson
+
+    if name not in JSON_ENCODERS:
+        raise ConfigError(f"json_encoder must be one of {', '.join(JSON_ENCODERS)}, {name} given")
+    if name == JSON_ENCODER_ORJSON and orjson is None:
+        raise ConfigError("json_encoder: orjson 3.9 or later is not installed")
+
+    _use_orjson = orjson is not None and name != JSON_ENCODER_FLASK
+
+
+def get_json_encoder() -> str:
+    """ """
+    return JSON_ENCODER_ORJSON if _use_orjson else JSON_ENCODER_FLASK
+
+
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _http_date(d: date, hour: int = 0, minute: int = 0, second: int = 0) -> str:
+    """Same output as werkzeug `http_date` without the time tuple round trip
+
+    :param d: date:
+    :param hour: int:  (Default value = 0)
+    :param minute: int:  (Default value = 0)
+    :param second: int:  (Default value = 0)
+
+    """
+    return f"{_WEEKDAYS[d.weekday()]}, {d.day:02d} {_MONTHS[d.month - 1]} {d.year:04d} {hour:02d}:{minute:02d}:{second:02d} GMT"
+
+
+def to_http_date(value):
+    """Dates and datetimes as Flask JSONEncoder writes them, None and anything else untouched
+
+    :param value:
+
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return _http_date(value, value.hour, value.minute, value.second)
+    if isinstance(value, date):
+        return _http_date(value)
+    return value
+
+
+def _default(o):
+    """Types orjson does not know, converted as Flask JSONEncoder does
+
+    :param o:
+
+    """
+    if hasattr(o, "_asdict"):
+        return o._asdict()
+    if isinstance(o, date):
+        return to_http_date(o)
+    if isinstance(o, Decimal):
+        return orjson.Fragment(str(o)) if o.is_finite() else float(o)
+    if isinstance(o, uuid.UUID):
+        return str(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+
+
+def dumps(data) -> bytes:
+    """Compact JSON document ending with a new line, keys sorted if the app `JSON_SORT_KEYS` says so
+
+    :param data:
+
+    """
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    if current_app.config["JSON_SORT_KEYS"]:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(data, default=_default, option=option)
+
+
+def dumps_lines(items: List) -> bytes:
+    """Newline delimited JSON, a compact document per item
+
+    :param items: List:
+
+    """
+    if _use_orjson:
+        try:
+            return b"".join([dumps(item) for item in items])
+        except orjson.JSONEncodeError:
+            pass
+
+    return "".join([json.dumps(item, separators=(",", ":")) + "\n" for item in items]).encode()
+
+
+def make_json_response(data, http_code: int = 200):
+    """
+
+    :param data:
+    :param http_code: int:  (Default value = 200)
+
+    """
+    if _use_orjson and not (current_app.config["JSONIFY_PRETTYPRINT_REGULAR"] or current_app.debug):
+        try:
+            return current_app.response_class(dumps(data), status=http_code, mimetype=current_app.config["JSONIFY_MIMETYPE"])
+        except orjson.JSONEncodeError:
+            # integers over 64 bits, circular references... simplejson copes with some of them
+            pass
+
+    return make_response(jsonify(data), http_code)
@@ -0,0 +1,84 @@
+"""Size limits of the list endpoint bodies, answered with a 413 as soon as a request is known to be over them.
+
+The Content-Length is checked before anything is read, bodies without one are counted while they are read, and streamed
+bodies are cut as soon as one item more than allowed is parsed.
+"""
+from typing import Iterator
+
+from flask import request
+from werkzeug.exceptions import RequestEntityTooLarge
+
+
+class _SizeLimitedStream:
+    """Request stream raising RequestEntityTooLarge once more than `limit` bytes are read"""
+
+    def __init__(self, stream, limit: int):
+        self.stream = stream
+        self.limit = limit
+        self.read_size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """
+
+        :param size: int:  (Default value = -1)
+
+        """
+        if size is not None and size >= 0:
+            return self._count(self.stream.read(size))
+
+        chunks = []
+        while True:
+            # never more than one byte over the limit, enough to know the body is too large
+            chunk = self._count(self.stream.read(self.limit - self.read_size + 1))
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+
+    def _count(self, data: bytes) -> bytes:
+        """
+
+        :param data: bytes:
+
+        """
+        self.read_size += len(data)
+        if self.read_size > self.limit:
+            raise RequestEntityTooLarge(f"Body too large, max size: {self.limit} bytes")
+        return data
+
+
+class BodyLimits:
+    """ """
+
+    def __init__(self, max_body_size: int = None, max_items: int = None):
+        self.max_body_size = max_body_size
+        self.max_items = max_items
+
+    def check_request(self):
+        """Rejects the request by its Content-Length, and limits what is read of bodies sent without one"""
+        if self.max_body_size is None:
+            return
+        if request.content_length is not None and request.content_length > self.max_body_size:
+            raise RequestEntityTooLarge(f"Body too large, max size: {self.max_body_size} bytes")
+        request.stream = _SizeLimitedStream(request.stream, self.max_body_size)
+
+    def check_items(self, count: int):
+        """
+
+        :param count: int: items in the body
+
+        """
+        if self.max_items is not None and count > self.max_items:
+            raise RequestEntityTooLarge(f"Body too large, max items: {self.max_items}")
+
+    def limit_items(self, items: Iterator) -> Iterator:
+        """Items of a streamed body, stopped at the first one over `max_items`
+
+        :param items: Iterator:
+
+        """
+        if self.max_items is None:
+            yield from items
+            return
+        for count, item in enumerate(items, 1):
+            self.check_items(count)
+            yield item
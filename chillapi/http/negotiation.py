@@ -0,0 +1,39 @@
+from flask import request
+
+from ..database.serializer import PYARROW_AVAILABLE
+from .binary_encoder import get_binary_mimetypes
+
+MIMETYPE_JSON = "application/json"
+MIMETYPE_COLUMNAR_JSON = "application/vnd.chillapi.columnar+json"
+MIMETYPE_ARROW_STREAM = "application/vnd.apache.arrow.stream"
+MIMETYPE_CSV = "text/csv"
+MIMETYPE_NDJSON = "application/x-ndjson"
+EXPORT_MIMETYPES = [MIMETYPE_CSV, MIMETYPE_NDJSON]
+
+
+def get_list_mimetypes() -> list:
+    """Formats offered by the list endpoints, Arrow only if pyarrow is installed"""
+    mimetypes = [MIMETYPE_JSON, MIMETYPE_COLUMNAR_JSON]
+    if PYARROW_AVAILABLE:
+        mimetypes.append(MIMETYPE_ARROW_STREAM)
+    return mimetypes
+
+
+def negotiate_list_mimetype() -> str:
+    """Best list format for the request Accept header, JSON when nothing offered is accepted"""
+    return request.accept_mimetypes.best_match(get_list_mimetypes(), default=MIMETYPE_JSON)
+
+
+def negotiate_export_mimetype(default: str = MIMETYPE_CSV) -> str:
+    """Export format for the request Accept header
+
+    :param default: str: format when the client accepts anything or nothing offered (Default value = MIMETYPE_CSV)
+
+    """
+    mimetypes = [default] + [mimetype for mimetype in EXPORT_MIMETYPES if mimetype != default]
+    return request.accept_mimetypes.best_match(mimetypes, default=default)
+
+
+def negotiate_body_mimetype() -> str:
+    """Encoding of the JSON documents for the request Accept header, MessagePack or CBOR if preferred and installed"""
+    return request.accept_mimetypes.best_match([MIMETYPE_JSON] + get_binary_mimetypes(), default=MIMETYPE_JSON)
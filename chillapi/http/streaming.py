@@ -0,0 +1,66 @@
+"""JSON array bodies read item by item with `ijson`, for the list endpoints writing big bodies in chunks.
+
+The body is never parsed as a whole: items are built while the request stream is read and handed over in lists of
+`chunk_size`, so the memory used is bound to the chunk and not to the body.
+"""
+import itertools
+from typing import Iterator, List
+
+from flask import request
+from werkzeug.exceptions import BadRequest
+
+from .limits import BodyLimits
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+
+def can_stream_request() -> bool:
+    """The request body is JSON and ijson is installed, MessagePack and CBOR bodies are always decoded at once"""
+    return ijson is not None and request.is_json
+
+
+def _iter_items(stream) -> Iterator:
+    """
+
+    :param stream: binary file like object with a JSON array
+
+    """
+    events = ijson.parse(stream, use_float=True)
+    try:
+        first = next(events, None)
+        if first is None or first[1] != "start_array":
+            raise BadRequest("Failed to decode JSON object: a JSON array is expected")
+        yield from ijson.items(itertools.chain([first], events), "item")
+    except ijson.JSONError as e:
+        raise BadRequest(f"Failed to decode JSON object: {e}")
+
+
+def iter_chunks(items: Iterator, chunk_size: int) -> Iterator[List]:
+    """
+
+    :param items: Iterator:
+    :param chunk_size: int:
+
+    """
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_request_chunks(chunk_size: int, body_limits: BodyLimits = None) -> Iterator[List]:
+    """Items of the JSON array in the request body, in lists of `chunk_size` read as the body arrives
+
+    :param chunk_size: int:
+    :param body_limits: BodyLimits: stops the body at the first item over its max items  (Default value = None)
+
+    """
+    items = _iter_items(request.stream)
+    if body_limits is not None:
+        items = body_limits.limit_items(items)
+    return iter_chunks(items, chunk_size)
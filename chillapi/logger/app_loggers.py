@@ -1,6 +1,13 @@
+import atexit
 import logging
+import os
+import queue
 import sys
+import threading
+from contextlib import suppress
+from logging.handlers import QueueHandler, QueueListener
 
+from ..http.utils import get_request_id
 from ..logger.formatter import GelfFormatter
 
 allowed_reserved_attrs = [
@@ -27,6 +34,186 @@ error_handler_logger.addHandler(stout_handler)
 audit_logger.addHandler(stout_handler)
 logging.getLogger("sqlalchemy.engine").addHandler(stout_handler)
 
+LOG_QUEUE_DROP_NEWEST = "newest"
+LOG_QUEUE_DROP_OLDEST = "oldest"
+LOG_QUEUE_BLOCK = "block"
+
+log_queue_listener = None
+
+
+class LogQueue(queue.Queue):
+    """Bounded queue of `(handler, record)`, what happens to a record when it is full depends on `drop`"""
+
+    def __init__(self, max_size: int, drop: str = LOG_QUEUE_DROP_NEWEST):
+        super().__init__(max_size)
+        self.drop = drop
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def offer(self, item):
+        """Enqueues the item, dropping it or the oldest one when the queue is full, or waiting with `block`
+
+        :param item:
+
+        """
+        if self.drop == LOG_QUEUE_BLOCK:
+            self.put(item)
+            return
+        with suppress(queue.Full):
+            self.put_nowait(item)
+            return
+        if self.drop == LOG_QUEUE_DROP_OLDEST:
+            with suppress(queue.Empty):
+                self.get_nowait()
+                self._count_dropped()
+            with suppress(queue.Full):
+                self.put_nowait(item)
+                return
+        self._count_dropped()
+
+    def _count_dropped(self):
+        """ """
+        with self._dropped_lock:
+            self.dropped += 1
+
+
+class LogQueueHandler(QueueHandler):
+    """Enqueues the records for `handler`, which formats and writes them in the listener thread"""
+
+    def __init__(self, log_queue: LogQueue, handler: logging.Handler):
+        super().__init__(log_queue)
+        self.handler = handler
+
+    def prepare(self, record):
+        """
+
+        :param record:
+
+        """
+        # the message is merged now, the caller may change its args before the listener formats it, and the request
+        # id is taken from the request context, there is none in the listener thread
+        record.msg = record.getMessage()
+        record.args = None
+        if "_request_uuid" not in record.__dict__:
+            record._request_uuid = get_request_id()
+        return self.handler, record
+
+    def enqueue(self, item):
+        """
+
+        :param item:
+
+        """
+        self.queue.offer(item)
+
+
+class LogQueueListener(QueueListener):
+    """Writes the enqueued records with their handler, reporting the records dropped once the queue is drained"""
+
+    def __init__(self, log_queue: LogQueue, loggers: list, flush_timeout: float = None):
+        super().__init__(log_queue)
+        self.loggers = loggers
+        self.flush_timeout = flush_timeout
+        self.reported_dropped = 0
+
+    def handle(self, item):
+        """
+
+        :param item:
+
+        """
+        handler, record = item
+        if record.levelno >= handler.level:
+            handler.handle(record)
+
+        dropped = self.queue.dropped
+        if dropped != self.reported_dropped and self.queue.empty():
+            report = logging.LogRecord("app", logging.WARNING, __file__, 0, "Log records dropped", None, None)
+            report.dropped = dropped - self.reported_dropped
+            self.reported_dropped = dropped
+            handler.handle(report)
+
+    def enqueue_sentinel(self):
+        """ """
+        with suppress(queue.Full):
+            self.queue.put(self._sentinel, timeout=self.flush_timeout)
+
+    def stop(self):
+        """Writes the records still enqueued, waiting for them `flush_timeout` seconds at most"""
+        if self._thread is None:
+            return
+        self.enqueue_sentinel()
+        self._thread.join(self.flush_timeout)
+        self._thread = None
+
+
+def start_log_queue(queue_config: dict, loggers: list):
+    """Replaces the handlers of the loggers by queue handlers, records are formatted and written in a background thread
+
+    :param queue_config: dict:
+    :param loggers: list:
+
+    """
+    global log_queue_listener
+    stop_log_queue()
+
+    log_queue = LogQueue(queue_config["max_size"], queue_config["drop"])
+    queue_handlers = {}
+    for queued_logger in loggers:
+        for handler in list(queued_logger.handlers):
+            if isinstance(handler, logging.NullHandler):
+                continue
+            if handler not in queue_handlers:
+                queue_handlers[handler] = LogQueueHandler(log_queue, handler)
+            queued_logger.removeHandler(handler)
+            queued_logger.addHandler(queue_handlers[handler])
+
+    log_queue_listener = LogQueueListener(log_queue, loggers, queue_config["flush_timeout"])
+    log_queue_listener.start()
+
+
+def stop_log_queue():
+    """Writes the records still enqueued and gives the loggers their handlers back"""
+    global log_queue_listener
+    if log_queue_listener is None:
+        return
+
+    listener, log_queue_listener = log_queue_listener, None
+    handlers = set()
+    for queued_logger in listener.loggers:
+        for handler in list(queued_logger.handlers):
+            if isinstance(handler, LogQueueHandler):
+                queued_logger.removeHandler(handler)
+                queued_logger.addHandler(handler.handler)
+                handlers.add(handler.handler)
+    listener.stop()
+    for handler in handlers:
+        handler.flush()
+
+
+def _restart_log_queue_in_child():
+    """Threads do not survive a fork: processes forked with the queue running (gunicorn --preload workers) get their own
+    queue and listener. The records enqueued before the fork are left to the parent
+    """
+    global log_queue_listener
+    if log_queue_listener is None:
+        return
+
+    listener = log_queue_listener
+    log_queue = LogQueue(listener.queue.maxsize, listener.queue.drop)
+    for queued_logger in listener.loggers:
+        for handler in queued_logger.handlers:
+            if isinstance(handler, LogQueueHandler):
+                handler.queue = log_queue
+
+    log_queue_listener = LogQueueListener(log_queue, listener.loggers, listener.flush_timeout)
+    log_queue_listener.start()
+
+
+atexit.register(stop_log_queue)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_log_queue_in_child)
+
 
 def set_logger_config(logger_config: dict):
     """
@@ -34,10 +221,16 @@ def set_logger_config(logger_config: dict):
     :param logger_config: dict:
 
     """
+    stop_log_queue()
+
     log_file_handler = None
+    logger_names = []
     for logger_name, config in logger_config.items():
+        if logger_name == "queue":
+            continue
         if logger_name == "sqlalchemy":
             logger_name = "sqlalchemy.engine"
+        logger_names.append(logger_name)
 
         if "output" in config and config["output"] == "null":
             log_null_handler = logging.NullHandler()
@@ -53,3 +246,7 @@ def set_logger_config(logger_config: dict):
             continue
         if "level" in config:
             logging.getLogger(logger_name).setLevel(int(config["level"]))
+
+    queue_config = logger_config.get("queue", {})
+    if queue_config.get("enable", False):
+        start_log_queue(queue_config, [logging.getLogger(logger_name) for logger_name in logger_names])
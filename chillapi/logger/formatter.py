@@ -128,6 +128,7 @@ class GelfFormatter(logging.Formatter):
         super().__init__()
         self.allowed_reserved_attrs = allowed_reserved_attrs
         self.ignored_attrs = ignored_attrs
+        self._excluded_attrs = frozenset([x for x in RESERVED_ATTRS if x not in allowed_reserved_attrs] + list(ignored_attrs) + GELF_IGNORED_ATTRS)
         self._hostname = socket.gethostname()
 
     def format(self, record):
@@ -145,7 +146,8 @@ class GelfFormatter(logging.Formatter):
 
         """
         # Base GELF message structure
-        request_uuid = get_request_id()
+        # records written by the log queue listener carry the id of their request
+        request_uuid = record.__dict__.get("_request_uuid") or get_request_id()
         log_record = dict(
             version=GELF_VERSION,
             short_message=record.getMessage(),
@@ -163,15 +165,11 @@ class GelfFormatter(logging.Formatter):
         if "asctime" in self.allowed_reserved_attrs:
             record.asctime = self.formatTime(record)
 
-        # Compute excluded attributes
-        excluded_attrs = [x for x in RESERVED_ATTRS if x not in self.allowed_reserved_attrs]
-        excluded_attrs += self.ignored_attrs
-
         # Everything else is considered an additional attribute
         for key, value in record.__dict__.items():
             # if key in self.allowed_reserved_attrs:
             #     log_record[_prefix_reserved(key)] = value
-            if key not in GELF_IGNORED_ATTRS and key not in excluded_attrs:
+            if key not in self._excluded_attrs:
                 if type(value) is datetime:
                     value = value.isoformat()
                 log_record[_prefix(key)] = value
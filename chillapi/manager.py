@@ -1,34 +1,45 @@
+import functools
 import os
+import threading
 from typing import List
 
-import inflect
-
 from . import ApiManager
+from .abc import CacheBackend
 from .app.config import ApiConfig
+from .cache.backends import DiskCacheBackend
+from .cache.response import ResponseCacheRegistry
+from .cache.single_flight import SingleFlight
 from .endpoints.sql import create_sql_endpoint_class
 from .endpoints.tables import (
     create_delete_list_endpoint_class,
     create_delete_single_endpoint_class,
+    create_export_list_endpoint_class,
     create_get_list_endpoint_class,
     create_get_single_endpoint_class,
     create_post_list_endpoint_class,
     create_post_single_endpoint_class,
     create_put_list_endpoint_class,
     create_put_single_endpoint_class,
+    get_table_endpoint_name,
+    get_table_endpoint_route,
 )
 from .exceptions.api_manager import ConfigError
+from .logger.app_loggers import logger
 from .swagger.http import AutomaticResource
 from .swagger.schemas import create_swagger_type_from_dict
 
-inflector = inflect.engine()
 created_endpoint_used_names = []
 
 
 class FlaskSqlApiManager(ApiManager):
     """ """
 
-    def __init__(self, config: ApiConfig):
+    def __init__(self, config: ApiConfig, response_cache: ResponseCacheRegistry = None, cache_path: str = None, single_flight: SingleFlight = None):
         self.config = config
+        self.response_cache = ResponseCacheRegistry() if response_cache is None else response_cache
+        self.single_flight = single_flight
+        self.cache_path = cache_path
+        self._disk_cache = None
 
     def create_api(self, api):
         """
@@ -102,16 +113,52 @@ class FlaskSqlApiManager(ApiManager):
             request_schema,
             response_schema,
             description,
+            cached=sql_endpoint["cache"]["enable"],
+            invalidates=sql_endpoint["invalidates"],
+        )
+
+        if sql_endpoint_class.cache_name is not None:
+            self.register_cache(sql_endpoint_class.cache_name, sql_endpoint["cache"])
+
+        api.add_resource(
+            sql_endpoint_class,
+            sql_endpoint_class.route,
+            endpoint=sql_endpoint_class.endpoint,
+            resource_class_kwargs={
+                "response_cache": self.response_cache,
+                "single_flight": self.single_flight,
+                "debug_sample_rate": sql_endpoint["debug_sample_rate"],
+            },
         )
 
-        api.add_resource(sql_endpoint_class, sql_endpoint_class.route, endpoint=sql_endpoint_class.endpoint)
+    def register_cache(self, cache_name: str, cache_config: dict):
+        """
+
+        :param cache_name: str:
+        :param cache_config: dict:
+
+        """
+        persistence = None
+        if cache_config["persist"]:
+            if self.cache_path is None:
+                raise ConfigError(f"SQL Endpoint {cache_name} cache can not be persisted, there is not cache path")
+            if self._disk_cache is None:
+                self._disk_cache = DiskCacheBackend(self.cache_path)
+            persistence = self._disk_cache
+
+        table_cache = self.response_cache.register(
+            cache_name, cache_config["ttl"], cache_config["max_entries"], invalidated_by=cache_config["invalidated_by"], persistence=persistence
+        )
+        table_cache.warm_up()
 
 
 class FlaskTableApiManager(ApiManager):
     """ """
 
-    def __init__(self, config: ApiConfig):
+    def __init__(self, config: ApiConfig, response_cache: ResponseCacheRegistry = None, single_flight: SingleFlight = None):
         self.config = config
+        self.response_cache = ResponseCacheRegistry() if response_cache is None else response_cache
+        self.single_flight = single_flight
 
     def create_get_single_endpoint(
         self,
@@ -242,6 +289,36 @@ class FlaskTableApiManager(ApiManager):
             self.config.repository[source_key],
         )
 
+    def create_export_list_endpoint(
+        self,
+        table: dict,
+        endpoint: str,
+        source_key: str,
+        action: str,
+        allowed_columns: List,
+        excluded_columns: List,
+        allowed_columns_map: dict,
+        extensions: dict,
+    ):
+        """
+
+        :param table: dict:
+        :param endpoint: str:
+        :param action: str:
+        :param allowed_columns: List:
+        :param excluded_columns: List:
+        :param allowed_columns_map: dict:
+        :param extensions: dict:
+
+        """
+        return create_export_list_endpoint_class(
+            table,
+            allowed_columns,
+            allowed_columns_map,
+            extensions,
+            self.config.repository[source_key],
+        )
+
     def create_put_list_endpoint(
         self,
         table: dict,
@@ -338,9 +415,17 @@ class FlaskTableApiManager(ApiManager):
         :param api:
 
         """
+        lazy_endpoints = self.config.app["lazy_endpoints"]
         for source_key in self.config.database:
             for table in self.config.database[source_key]["tables"]:
-                for endpoint, actions in table["api_endpoints"].items():
+                if table["cache"]["enable"]:
+                    self.response_cache.register(table["name"], table["cache"]["ttl"], table["cache"]["max_entries"])
+
+                api_endpoints = dict(table["api_endpoints"])
+                if table["export"]["enable"]:
+                    api_endpoints["EXPORT"] = ["LIST"]
+
+                for endpoint, actions in api_endpoints.items():
                     for action in actions:
                         _create_method = f"create_{endpoint.lower()}_{action.lower()}_endpoint"
                         _create = getattr(self, _create_method, None)
@@ -350,42 +435,82 @@ class FlaskTableApiManager(ApiManager):
                         model_name = table["model_name"]
                         table_columns = table["columns"]
 
-                        table_columns_excluded = table["fields_excluded"][endpoint][action] if endpoint != "DELETE" else {}
+                        # the export hides the same columns than GET LIST
+                        fields_excluded_endpoint = "GET" if endpoint == "EXPORT" else endpoint
+                        table_columns_excluded = table["fields_excluded"][fields_excluded_endpoint][action] if endpoint != "DELETE" else {}
                         table_extensions = self.config.extensions.tables[source_key][model_name]
                         allowed_columns = [x for x in table_columns.keys() if x not in table_columns_excluded]
 
                         allowed_columns_map = {x: table["columns"][x] for x in table["columns"].keys() if x in allowed_columns}
-                        _endpoint: AutomaticResource = _create(
-                            **{
-                                "table": table,
-                                "endpoint": endpoint,
-                                "action": action,
-                                "allowed_columns": allowed_columns,
-                                "excluded_columns": table_columns_excluded,
-                                "allowed_columns_map": allowed_columns_map,
-                                "extensions": table_extensions,
-                                "source_key": source_key,
-                            }
-                        )
+                        create_kwargs = {
+                            "table": table,
+                            "endpoint": endpoint,
+                            "action": action,
+                            "allowed_columns": allowed_columns,
+                            "excluded_columns": table_columns_excluded,
+                            "allowed_columns_map": allowed_columns_map,
+                            "extensions": table_extensions,
+                            "source_key": source_key,
+                        }
+                        resource_class_kwargs = {
+                            "before_request": self.config.extensions.tables[source_key][model_name]["before_request"],
+                            "before_response": self.config.extensions.tables[source_key][model_name]["before_response"],
+                            "after_response": self.config.extensions.tables[source_key][model_name]["after_response"],
+                            "response_cache": self.response_cache,
+                            "single_flight": self.single_flight,
+                            "debug_sample_rate": table["debug_sample_rate"],
+                        }
+
+                        if lazy_endpoints["enable"]:
+                            # the route is all flask needs, the class with its form and schemas is created on the first request
+                            api.add_lazy_resource(
+                                functools.partial(_create, **create_kwargs),
+                                ["GET" if endpoint == "EXPORT" else endpoint],
+                                get_table_endpoint_route(table, endpoint, action),
+                                endpoint=get_table_endpoint_name(table, endpoint, action),
+                                resource_class_kwargs=resource_class_kwargs,
+                            )
+                            continue
+
+                        _endpoint: AutomaticResource = _create(**create_kwargs)
 
                         api.add_resource(
                             _endpoint,
                             _endpoint.route,
                             endpoint=_endpoint.endpoint,
-                            resource_class_kwargs={
-                                "before_request": self.config.extensions.tables[source_key][model_name]["before_request"],
-                                "before_response": self.config.extensions.tables[source_key][model_name]["before_response"],
-                                "after_response": self.config.extensions.tables[source_key][model_name]["after_response"],
-                            },
+                            resource_class_kwargs=resource_class_kwargs,
                         )
 
+        if lazy_endpoints["enable"] and lazy_endpoints["warm_up"]:
+            threading.Thread(target=_warm_up, args=(api,), name="chillapi-warm-up", daemon=True).start()
+
+
+def _warm_up(api):
+    """Loads the lazy endpoints in the background
+
+    :param api:
+
+    """
+    try:
+        api.load_lazy_resources()
+    except Exception as e:
+        logger.exception("Endpoints warm up failed", extra={"error": str(e)})
+
 
 class FlaskApiManager(ApiManager):
     """ """
 
-    def __init__(self, config: ApiConfig):
-        self.sql_manager = FlaskSqlApiManager(config)
-        self.table_manager = FlaskTableApiManager(config)
+    def __init__(self, config: ApiConfig, cache_backend: CacheBackend = None, cache_path: str = None):
+        self.response_cache = ResponseCacheRegistry(cache_backend)
+        self.single_flight = None
+        if config.app["single_flight"]["enable"]:
+            self.single_flight = SingleFlight(
+                config.app["single_flight"]["timeout"],
+                copy=lambda response: response.copy(),
+                shareable=lambda response: response.is_shareable(),
+            )
+        self.sql_manager = FlaskSqlApiManager(config, self.response_cache, cache_path, self.single_flight)
+        self.table_manager = FlaskTableApiManager(config, self.response_cache, self.single_flight)
 
     def create_api(self, api):
         """
@@ -1,10 +1,24 @@
 import abc
+import copy
+import hashlib
+import logging
+import random
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import List
 
 import flask
-from flask import jsonify, make_response
+from flask import make_response
+from werkzeug.http import is_resource_modified
 
 from ..app.swagger_schema import Resource, Schema
+from ..cache.response import ResponseCache, ResponseCacheRegistry
+from ..cache.single_flight import SingleFlight
 from ..extensions.audit import AuditLog
+from ..http import binary_encoder
+from ..http.binary_encoder import get_binary_mimetypes
+from ..http.json_encoder import make_json_response
+from ..http.negotiation import MIMETYPE_JSON, negotiate_body_mimetype
 from ..logger.app_loggers import logger
 from ..swagger import AfterResponseEventType, BeforeRequestEventType, BeforeResponseEventType
 
@@ -16,6 +30,11 @@ class ResourceResponse:
     headers: dict = {}
     http_code = 200
     audit = None
+    etag: str = None
+    weak_etag: bool = False
+    body_etag: bool = False
+    last_modified: datetime = None
+    mimetype: str = None
 
     def make_audit_log(self, **args):
         """
@@ -31,16 +50,155 @@ class ResourceResponse:
         :param as_json: bool:  (Default value = True)
 
         """
-        data = jsonify(self.response) if as_json else self.response
-        response = make_response(data, self.http_code)
+        body_mimetype = self.get_body_mimetype(as_json)
+        etag = self.get_negotiated_etag(as_json)
+
+        if isinstance(self.response, Iterator):
+            response = flask.current_app.response_class(flask.stream_with_context(self.response), status=self.http_code)
+        elif self.http_code == 304 or (not self.body_etag and self.http_code == 200 and self.is_not_modified(etag)):
+            response = make_response("", 304)
+        else:
+            response = self.encode_body(body_mimetype, as_json)
+            if self.body_etag and self.http_code == 200:
+                # the strong ETag is the hash of the bytes sent, encoded once
+                etag = _hash_etag(response.get_data())
+                if self.is_not_modified(etag):
+                    response = make_response("", 304)
+        if self.mimetype is not None:
+            response.mimetype = self.mimetype
         if self.headers:
             for key, value in self.headers.items():
                 response.headers[key] = value
+        if as_json and get_binary_mimetypes():
+            response.vary.add("Accept")
+        if etag is not None:
+            response.set_etag(etag, weak=self.weak_etag)
+        if self.last_modified is not None:
+            response.last_modified = self.last_modified
 
         response.audit = self.audit
 
         return response
 
+    def get_body_mimetype(self, as_json: bool = True) -> str:
+        """Mimetype `make_response` encodes the body in, negotiated when the endpoint does not set one
+
+        :param as_json: bool:  (Default value = True)
+
+        """
+        if as_json and self.mimetype is None and not isinstance(self.response, (bytes, Iterator)):
+            return negotiate_body_mimetype()
+        return MIMETYPE_JSON
+
+    def get_negotiated_etag(self, as_json: bool = True) -> str:
+        """ETag `make_response` sends, the endpoint ETag hashed with the mimetype of the binary bodies
+
+        :param as_json: bool:  (Default value = True)
+
+        """
+        body_mimetype = self.get_body_mimetype(as_json)
+        if self.etag is not None and body_mimetype != MIMETYPE_JSON:
+            return _hash_etag(self.etag, body_mimetype)
+        return self.etag
+
+    def encode_body(self, body_mimetype: str, as_json: bool = True):
+        """
+
+        :param body_mimetype: str:
+        :param as_json: bool:  (Default value = True)
+
+        """
+        if body_mimetype != MIMETYPE_JSON:
+            return flask.current_app.response_class(binary_encoder.dumps(body_mimetype, self.response), status=self.http_code, mimetype=body_mimetype)
+        if as_json and not isinstance(self.response, bytes):
+            return make_json_response(self.response, self.http_code)
+        return make_response(self.response, self.http_code)
+
+    def is_shareable(self) -> bool:
+        """Whether the response can be served to other requests: a 200 with its whole body, `make_response` checks the
+        conditional headers of each request
+        """
+        return self.http_code == 200 and not isinstance(self.response, Iterator)
+
+    def freeze(self, as_json: bool = True) -> "ResourceResponse":
+        """Copy with the body encoded in the negotiated mimetype, its bytes shared by every response made from it
+
+        :param as_json: bool:  (Default value = True)
+
+        """
+        if isinstance(self.response, bytes):
+            return self.copy()
+
+        encoded = self.encode_body(self.get_body_mimetype(as_json), as_json)
+        frozen = self.copy(encoded.get_data())
+        frozen.mimetype = self.mimetype or encoded.mimetype
+        frozen.etag = self.get_negotiated_etag(as_json)
+        return frozen
+
+    def copy(self, body=None) -> "ResourceResponse":
+        """
+
+        :param body: the body of the copy, a deep copy of this response body when None (Default value = None)
+
+        """
+        response = ResourceResponse()
+        response.response = copy.deepcopy(self.response) if body is None else body
+        response.headers = dict(self.headers)
+        response.http_code = self.http_code
+        response.audit = self.audit
+        response.etag = self.etag
+        response.weak_etag = self.weak_etag
+        response.body_etag = self.body_etag
+        response.last_modified = self.last_modified
+        response.mimetype = self.mimetype
+
+        return response
+
+    def set_validators(self, last_modified, *etag_parts):
+        """Weak ETag and Last-Modified from the update timestamp of the records, the ETag from the body when there is not timestamp
+
+        :param last_modified: datetime or ISO 8601 str
+        :param *etag_parts: anything else changing the response with the same timestamp (filters, totals...)
+
+        """
+        if isinstance(last_modified, str):
+            try:
+                last_modified = datetime.fromisoformat(last_modified)
+            except ValueError:
+                last_modified = None
+
+        if not isinstance(last_modified, datetime):
+            self.set_body_etag()
+            return
+
+        if last_modified.tzinfo is not None:
+            last_modified = last_modified.astimezone(timezone.utc).replace(tzinfo=None)
+
+        self.last_modified = last_modified
+        self.etag = _hash_etag(last_modified.isoformat(), *etag_parts)
+        self.weak_etag = True
+
+    def set_body_etag(self):
+        """Strong ETag from the body, hashed by `make_response` once encoded"""
+        self.etag = None
+        self.weak_etag = False
+        self.body_etag = True
+
+    def is_not_modified(self, etag: str = None) -> bool:
+        """True if the client copy, as told by If-None-Match or If-Modified-Since, is still valid. Only GET and HEAD
+        requests are answered not modified
+
+        :param etag: str: ETag of the representation sent, when it is not `etag` (Default value = None)
+
+        """
+        etag = etag if etag is not None else self.etag
+        if etag is None and self.last_modified is None:
+            return False
+        # werkzeug tells every other method is not modified
+        if flask.request.method not in ("GET", "HEAD"):
+            return False
+        return not is_resource_modified(flask.request.environ, etag=etag, last_modified=self.last_modified)
+
     def for_json(self) -> dict:
         """ """
         return {
@@ -50,6 +208,15 @@ class ResourceResponse:
         }
 
 
+def _hash_etag(*parts) -> str:
+    """
+
+    :param *parts:
+
+    """
+    return hashlib.sha1(b":".join(part if isinstance(part, bytes) else str(part).encode() for part in parts)).hexdigest()
+
+
 class AutomaticResource(Resource):
     """ """
 
@@ -59,15 +226,23 @@ class AutomaticResource(Resource):
     before_request: BeforeRequestEventType = None
     before_response: BeforeResponseEventType = None
     db_table: dict = None
+    cache_name: str = None
+    invalidates: List[str] = []
 
     def __init__(
         self,
         before_request: BeforeRequestEventType = None,
         before_response: BeforeResponseEventType = None,
         after_response: AfterResponseEventType = None,
+        response_cache: ResponseCacheRegistry = None,
+        single_flight: SingleFlight = None,
+        debug_sample_rate: float = 1.0,
     ):
         self.before_response = before_response
         self.before_request = before_request
+        self.response_cache = response_cache
+        self.single_flight = single_flight
+        self.debug_sample_rate = debug_sample_rate
 
         if after_response:
 
@@ -99,35 +274,67 @@ class AutomaticResource(Resource):
         """
         pass
 
+    def get_table_cache(self) -> ResponseCache:
+        """Cache of the endpoint table (`cache_name` if set), None if it has not the `cache` setting enabled"""
+        if self.response_cache is None:
+            return None
+        if self.cache_name is not None:
+            return self.response_cache.get(self.cache_name)
+        if self.db_table is None:
+            return None
+        return self.response_cache.get(self.db_table["name"])
+
+    def cache_key(self, **args) -> str:
+        """Key of the response in the table response cache. Endpoints returning None are never cached
+
+        :param **args:
+
+        """
+        return None
+
+    def is_debug_sampled(self) -> bool:
+        """Whether the request logs its debug records: the app logger logs the debug level and the request is in the
+        endpoint `debug_sample_rate`
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return False
+        return self.debug_sample_rate >= 1 or random.random() < self.debug_sample_rate
+
     def process_request(self, **args):
         """
 
         :param **args:
 
         """
-        logger.debug("Request start", extra=args)
+        # checked once, the records and their extra are not even built when the request does not log them
+        debug = self.is_debug_sampled()
+        if debug:
+            logger.debug("Request start", extra=args)
         before_response_event = None
         before_request_event = None
 
         request_args = {**args, **{"before_request_event": before_request_event, "before_response_event": before_response_event}}
 
         if self.before_request:
-            logger.debug("Before request event trigger", extra=request_args)
+            if debug:
+                logger.debug("Before request event trigger", extra=request_args)
 
             before_request_event = self.before_request.on_event(**{"resource": self}, **request_args)
 
             request_args["before_request_event"] = before_request_event
 
-        logger.debug("Validate request event trigger", extra={**request_args})
+        if debug:
+            logger.debug("Validate request event trigger", extra=request_args)
 
         validation_output = self.validate_request(**request_args)
 
         request_args["validation_output"] = validation_output
 
-        response = self.request(**request_args)
+        response, cache_status = self.cached_request(**request_args)
 
         if self.before_response:
-            logger.debug("Before response event trigger", extra=request_args)
+            if debug:
+                logger.debug("Before response event trigger", extra=request_args)
 
             before_response_event = self.before_response.on_event(
                 **{
@@ -139,7 +346,64 @@ class AutomaticResource(Resource):
 
             request_args["before_response_event"] = before_response_event
 
-        request_args["response"] = response
-        logger.debug("Response finish", extra=request_args)
+        if debug:
+            request_args["response"] = response
+            logger.debug("Response finish", extra=request_args)
 
-        return response.make_response()
+        flask_response = response.make_response()
+        if cache_status is not None:
+            flask_response.headers["X-Cache"] = cache_status
+
+        return flask_response
+
+    def cached_request(self, **args):
+        """Serves GET requests from the table response cache when possible, identical GET requests running at the same time
+        share a single execution through the single flight. Endpoints writing into tables invalidate their caches, even if the write fails halfway
+
+        :param **args:
+
+        """
+        cache_key = None
+        table_cache = None
+        single_flight = None
+        if flask.request.method in ("GET", "HEAD"):
+            table_cache = self.get_table_cache()
+            single_flight = self.single_flight
+        if table_cache is not None or single_flight is not None:
+            cache_key = self.cache_key(**args)
+        if cache_key is not None and get_binary_mimetypes():
+            # the cached body is encoded in the negotiated mimetype
+            cache_key = f"{cache_key}:{negotiate_body_mimetype()}"
+
+        if cache_key is None:
+            try:
+                return self.request(**args), None
+            finally:
+                if self.response_cache is not None and self.invalidates:
+                    self.response_cache.invalidate(self.invalidates)
+
+        cache_key = f"{self.endpoint}:{cache_key}"
+        # a before response event changing the response gets its own copy of the payload, otherwise the encoded body is shared
+        changes_response = self.before_response is not None and getattr(self.before_response, "changes_response", True)
+        if table_cache is not None:
+            cached = table_cache.get(cache_key)
+            if cached is not None:
+                return (cached.copy() if changes_response else cached), "HIT"
+
+        def load_response():
+            """ """
+            response = self.request(**args)
+            if not response.is_shareable():
+                return response
+            if not changes_response:
+                response = response.freeze()
+            if table_cache is not None:
+                table_cache.set(cache_key, response.copy() if changes_response else response)
+            return response
+
+        if single_flight is None:
+            response = load_response()
+        else:
+            response, _shared = single_flight.do(cache_key, load_response)
+
+        return response, "MISS" if table_cache is not None else None
@@ -1,6 +1,8 @@
 from typing import List
 
 from ..app.swagger_schema import Schema
+from ..http.binary_encoder import get_binary_mimetypes
+from ..http.negotiation import get_list_mimetypes, MIMETYPE_ARROW_STREAM, MIMETYPE_COLUMNAR_JSON, MIMETYPE_CSV, MIMETYPE_JSON, MIMETYPE_NDJSON
 from ..swagger.utils import get_error_swagger_schema, get_not_found_swagger_schema, get_revisable_response_swagger_schema
 
 revisable_response_swagger_schema = get_revisable_response_swagger_schema()
@@ -8,6 +10,15 @@ error_swagger_schema = get_error_swagger_schema()
 not_found_swagger_schema = get_not_found_swagger_schema()
 
 
+def get_document_content(schema) -> dict:
+    """OpenAPI content of a JSON document, also offered as MessagePack or CBOR when installed
+
+    :param schema:
+
+    """
+    return {mimetype: {"schema": schema} for mimetype in [MIMETYPE_JSON] + get_binary_mimetypes()}
+
+
 def create_swagger_type_from_dict(name, swagger_dict_definition):
     """
 
@@ -39,6 +50,7 @@ def get_get_single_endpoint_schema(class_name, id_field_where_type, response_sch
         ],
         "responses": {
             "200": {"description": f"{class_name} response model", "content": {"application/json": {"schema": response_schema}}},
+            "304": {"description": "Not modified since the ETag in If-None-Match or the date in If-Modified-Since"},
             "404": {"description": "Not found response model", "content": {"application/json": {"schema": not_found_swagger_schema}}},
             "500": {"description": "Operation fail", "content": {"application/json": {"schema": error_swagger_schema}}},
         },
@@ -128,26 +140,56 @@ def get_delete_single_endpoint_schema(class_name, id_field_where_type):
     }
 
 
-def get_get_list_endpoint_schema(class_name, response_schema, request_schema):
+def get_get_list_endpoint_schema(class_name, response_schema, request_schema, columnar_response_schema=None):
     """
 
     :param class_name:
     :param response_schema:
     :param request_schema:
+    :param columnar_response_schema:  (Default value = None)
 
     """
+    content = get_document_content(response_schema)
+    if columnar_response_schema is not None:
+        content[MIMETYPE_COLUMNAR_JSON] = {"schema": columnar_response_schema}
+        if MIMETYPE_ARROW_STREAM in get_list_mimetypes():
+            content[MIMETYPE_ARROW_STREAM] = {"schema": {"type": "string", "format": "binary"}}
+
     return {
         "tags": [class_name],
         "description": f"Get {class_name} model list",
         "parameters": request_schema,
         "responses": {
-            "200": {"description": f"{class_name} list response model", "content": {"application/json": {"schema": response_schema}}},
+            "200": {"description": f"{class_name} list response model, negotiated with the Accept header", "content": content},
+            "304": {"description": "Not modified since the ETag in If-None-Match or the date in If-Modified-Since"},
             "404": {"description": "Not found response model", "content": {"application/json": {"schema": not_found_swagger_schema}}},
             "500": {"description": "Operation fail", "content": {"application/json": {"schema": error_swagger_schema}}},
         },
     }
 
 
+def get_export_list_endpoint_schema(class_name, request_schema):
+    """
+
+    :param class_name:
+    :param request_schema:
+
+    """
+    return {
+        "tags": [class_name],
+        "description": f"Export the {class_name} model records matching the filters, streamed. Without `size` the whole table",
+        "parameters": request_schema,
+        "responses": {
+            "200": {
+                "description": f"{class_name} records as CSV with a header row or as newline delimited JSON, negotiated with the Accept header",
+                "content": {MIMETYPE_CSV: {"schema": {"type": "string"}}, MIMETYPE_NDJSON: {"schema": {"type": "string"}}},
+            },
+            "400": {"description": "Operation fail", "content": {"application/json": {"schema": error_swagger_schema}}},
+            "500": {"description": "Operation fail", "content": {"application/json": {"schema": error_swagger_schema}}},
+        },
+    }
+
+
 def get_put_list_endpoint_schema(class_name, form_schema_model):
     """
 
@@ -161,7 +203,7 @@ def get_put_list_endpoint_schema(class_name, form_schema_model):
         "requestBody": {
             "description": f"{class_name} request model",
             "required": True,
-            "content": {"application/json": {"schema": form_schema_model}},
+            "content": get_document_content(form_schema_model),
         },
         "responses": {
             "200": {"description": f"{class_name} response model", "content": {"application/json": {"schema": revisable_response_swagger_schema}}},
@@ -184,7 +226,7 @@ def get_post_list_endpoint_schema(class_name, form_schema_model):
         "requestBody": {
             "description": f"{class_name} request model",
             "required": True,
-            "content": {"application/json": {"schema": form_schema_model}},
+            "content": get_document_content(form_schema_model),
         },
         "responses": {
             "200": {"description": f"{class_name} response model", "content": {"application/json": {"schema": form_schema_model}}},
@@ -241,7 +283,7 @@ def get_delete_list_endpoint_schema(class_name, request_body_schema):
         "requestBody": {
             "description": f"Delete {class_name} list request model",
             "required": True,
-            "content": {"application/json": {"schema": request_body_schema}},
+            "content": get_document_content(request_body_schema),
         },
         "responses": {
             "200": {"description": f"{class_name} response model", "content": {"application/json": {"schema": {"type": "string", "example": "ok"}}}},
@@ -0,0 +1,109 @@
+"""Validation of the generated OpenAPI document against the OpenAPI 3.0 meta-schema bundled with openapi_spec_validator.
+
+No network is needed. The verdict is stored next to the document with its hash, so the following starts only validate again
+when the document, or the validator, changed.
+"""
+import hashlib
+import os
+import threading
+from importlib import metadata
+from typing import List
+
+import simplejson
+
+from ..logger.formatter import CustomEncoder
+
+SPEC_VALIDATION_ALWAYS = "always"
+SPEC_VALIDATION_CACHED = "cached"
+SPEC_VALIDATION_NEVER = "never"
+
+
+def dumps_spec(swagger_doc: dict) -> str:
+    """OpenAPI document as it is written to `var/<app>_swagger.json`
+
+    :param swagger_doc: dict:
+
+    """
+    return simplejson.dumps(swagger_doc, indent=2, cls=CustomEncoder, for_json=True)
+
+
+def get_spec_errors(spec_json: str) -> List[str]:
+    """
+
+    :param spec_json: str: OpenAPI document
+
+    """
+    # openapi_spec_validator takes longer to import than the rest of the api, it is only imported to validate
+    from openapi_spec_validator import openapi_v3_spec_validator
+
+    return [str(error) for error in openapi_v3_spec_validator.iter_errors(simplejson.loads(spec_json))]
+
+
+def _get_validator_version() -> str:
+    """Version of openapi_spec_validator, read from its package metadata so it does not have to be imported"""
+    try:
+        return metadata.version("openapi-spec-validator")
+    except metadata.PackageNotFoundError:  # pragma: no cover
+        import openapi_spec_validator
+
+        return openapi_spec_validator.__version__
+
+
+def _get_spec_hash(spec_json: str) -> str:
+    """
+
+    :param spec_json: str:
+
+    """
+    return hashlib.sha256(f"{_get_validator_version()}\n{spec_json}".encode()).hexdigest()
+
+
+def _read_verdict(verdict_path: str):
+    """Stored {"hash", "errors"} or None if there is none or it can not be read
+
+    :param verdict_path: str:
+
+    """
+    try:
+        with open(verdict_path) as verdict_file:
+            verdict = simplejson.load(verdict_file)
+        return verdict if {"hash", "errors"} <= verdict.keys() else None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _write_verdict(verdict_path: str, verdict: dict):
+    """
+
+    :param verdict_path: str:
+    :param verdict: dict:
+
+    """
+    # written aside and renamed, workers starting at the same time never read half written verdicts
+    tmp_path = f"{verdict_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as verdict_file:
+        simplejson.dump(verdict, verdict_file)
+    os.replace(tmp_path, verdict_path)
+
+
+def validate_spec(spec_json: str, verdict_path: str, mode: str = SPEC_VALIDATION_CACHED) -> List[str]:
+    """Errors of the OpenAPI document. With SPEC_VALIDATION_CACHED the errors stored for the same document hash are
+    returned without validating it again
+
+    :param spec_json: str: OpenAPI document
+    :param verdict_path: str: file keeping the hash and errors of the last validated document
+    :param mode: str: SPEC_VALIDATION_ALWAYS, SPEC_VALIDATION_CACHED or SPEC_VALIDATION_NEVER  (Default value = SPEC_VALIDATION_CACHED)
+
+    """
+    if mode == SPEC_VALIDATION_NEVER:
+        return []
+
+    spec_hash = _get_spec_hash(spec_json)
+    if mode == SPEC_VALIDATION_CACHED:
+        verdict = _read_verdict(verdict_path)
+        if verdict is not None and verdict["hash"] == spec_hash:
+            return verdict["errors"]
+
+    errors = get_spec_errors(spec_json)
+    _write_verdict(verdict_path, {"hash": spec_hash, "errors": errors})
+    return errors
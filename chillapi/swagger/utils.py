@@ -189,6 +189,33 @@ def get_list_filtered_response_swagger_schema(columns_map: dict, request_schema:
     return ResponseModel
 
 
+def get_list_columnar_response_swagger_schema(columns_map: dict, request_schema: dict, class_name: str):
+    """
+
+    :param columns_map: dict:
+    :param request_schema: dict:
+    :param class_name: str:
+
+    """
+    meta = {v["name"]: {"type": "object", "schema": v["schema"]} for v in request_schema}
+
+    meta["total_records"] = {"type": "integer"}
+
+    class ColumnarResponseModel(Schema):
+        """ """
+
+        type = "object"
+        properties = {
+            "columns": {"type": "array", "items": {"type": "string", "enum": list(columns_map.keys())}},
+            "rows": {"type": "array", "items": {"type": "array", "items": {}}},
+            "_meta": {"type": "object", "properties": meta},
+        }
+
+    ColumnarResponseModel.__name__ = f"{class_name}ListColumnarResponseModel"
+
+    return ColumnarResponseModel
+
+
 def get_list_filtered_request_swagger_schema(class_name: str, columns_map: dict):
     """
 
@@ -0,0 +1,75 @@
+"""OpenAPI schema validators built once, when the endpoint classes are created.
+
+`openapi_schema_validator.validate` checks the schema and builds a validator on every call. The validators here do
+that once and, when `fastjsonschema` is installed, accept the valid values through a function generated from the
+schema. Invalid values are validated again by the OpenAPI validator, so the errors are the same as always.
+"""
+from jsonschema.exceptions import best_match
+from openapi_schema_validator import OAS30Validator
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover
+    fastjsonschema = None
+
+# OpenAPI 3.0 schemas are an extended subset of draft 4
+_DRAFT_4 = "http://json-schema.org/draft-04/schema#"
+
+
+def _compile_fast_validator(schema: dict):
+    """Function validating against the schema, None if fastjsonschema is not installed or does not understand the schema
+
+    :param schema: dict:
+
+    """
+    if fastjsonschema is None:
+        return None
+    try:
+        return fastjsonschema.compile({**schema, **{"$schema": _DRAFT_4}}, use_default=False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+class SchemaValidator:
+    """ """
+
+    def __init__(self, schema: dict):
+        OAS30Validator.check_schema(schema)
+        self.schema = schema
+        self.validator = OAS30Validator(schema)
+        self.fast_validator = _compile_fast_validator(schema)
+
+    def is_valid(self, instance) -> bool:
+        """
+
+        :param instance:
+
+        """
+        if self.fast_validator is None:
+            return self.validator.is_valid(instance)
+        try:
+            self.fast_validator(instance)
+        except fastjsonschema.JsonSchemaValueException:
+            return False
+        return True
+
+    def validate(self, instance):
+        """Raises the same `jsonschema.exceptions.ValidationError` as `openapi_schema_validator.validate`
+
+        :param instance:
+
+        """
+        if self.is_valid(instance):
+            return
+        error = best_match(self.validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    def validated(self, instance):
+        """The instance, once validated. For the values validated when the endpoint is created, as defaults
+
+        :param instance:
+
+        """
+        self.validate(instance)
+        return instance
@@ -0,0 +1,89 @@
+"""Per request overhead of the `swagger.doc` decorator and of the `auth_required` path lookup, as they were (argument
+introspection and path conversion on every call) against what is precomputed now.
+
+    python -m performance.benchmark_dispatch [calls]
+"""
+import copy
+import inspect
+import re
+import sys
+import timeit
+from functools import wraps
+
+from chillapi.app.swagger_schema import swagger
+
+OPERATION = {"tags": ["book"], "parameters": [{"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}}]}
+RULE = "/read/book/<int:id>"
+
+
+def introspecting_doc(operation_object):
+    """`swagger.doc` as it was, looking at the arguments of the method on every call
+
+    :param operation_object:
+
+    """
+
+    def decorated(f):
+        """
+
+        :param f:
+
+        """
+        f.__swagger_operation_object = copy.deepcopy(operation_object)
+
+        @wraps(f)
+        def inner(self, *args, **kwargs):
+            """
+
+            :param *args:
+            :param **kwargs:
+
+            """
+            func_args = inspect.getfullargspec(f).args
+            if "parameters" in f.__swagger_operation_object and "_parser" in func_args:
+                kwargs.update({"_parser": swagger.get_parser(f.__swagger_operation_object["parameters"])})
+            return f(self, *args, **kwargs)
+
+        return inner
+
+    return decorated
+
+
+class BookEndpoint:
+    """ """
+
+    @introspecting_doc(OPERATION)
+    def get_introspecting(self, id):
+        """ """
+        return id
+
+    @swagger.doc(OPERATION)
+    def get(self, id):
+        """ """
+        return id
+
+
+def main(calls: int = 100_000):
+    """
+
+    :param calls: int:  (Default value = 100_000)
+
+    """
+    endpoint = BookEndpoint()
+    cases = [
+        ("doc, introspecting", lambda: endpoint.get_introspecting(1)),
+        ("doc, precomputed", lambda: endpoint.get(1)),
+        ("path, converted", lambda: re.sub("<(?:[^:]+:)?([^>]+)>", "{\\1}", RULE)),
+        ("path, cached", lambda: swagger.extract_swagger_path(RULE)),
+    ]
+
+    baseline = None
+    for name, run in cases:
+        seconds = min(timeit.repeat(run, number=calls, repeat=3)) / calls
+        if name.endswith(("introspecting", "converted")):
+            baseline = seconds
+        print(f"{name:>20}: {seconds * 1_000_000:8.3f} us per request, {baseline / seconds:5.1f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,58 @@
+"""Validation time of a list body: a WTForms form per item, as the PUT and POST list endpoints did, against the
+`BatchFormValidator` of the endpoint validating it column by column.
+
+    python -m performance.benchmark_forms [items] [repeat]
+"""
+import sys
+import timeit
+
+from sqlalchemy import Boolean, DateTime, Integer, String
+
+from chillapi.app.forms import BatchFormValidator, create_form_class
+
+COLUMNS = {
+    "id": {"nullable": False, "type": Integer()},
+    "name": {"nullable": False, "type": String(255)},
+    "asin": {"nullable": False, "type": String(255)},
+    "book_category_id": {"nullable": False, "type": Integer()},
+    "pages": {"nullable": True, "type": Integer()},
+    "published": {"nullable": True, "type": DateTime()},
+    "available": {"nullable": True, "type": Boolean()},
+}
+
+
+def main(items: int = 1000, repeat: int = 20):
+    """
+
+    :param items: int: items of the body  (Default value = 1000)
+    :param repeat: int:  (Default value = 20)
+
+    """
+    form_class = create_form_class("Book", "putList", COLUMNS, {})
+    batch_validator = BatchFormValidator(form_class)
+    body = [
+        {"id": i, "name": f"Book {i}", "asin": f"{i:010}", "book_category_id": 1, "pages": 300, "published": "2021-01-01 00:00:00", "available": True}
+        for i in range(items)
+    ]
+
+    def per_item():
+        """ """
+        for item in body:
+            form = form_class(data=item)
+            form.validate()
+            form.data
+
+    cases = [
+        ("form per item", per_item),
+        ("batch validator", lambda: batch_validator.validate(body)),
+    ]
+
+    baseline = None
+    for name, run in cases:
+        seconds = min(timeit.repeat(run, number=repeat, repeat=3)) / repeat
+        baseline = baseline or seconds
+        print(f"{name:>16}: {seconds * 1_000:8.2f} ms per body of {items} items, {baseline / seconds:5.1f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,45 @@
+"""Import time of `chillapi.api`, in a fresh interpreter every run as a forked worker or a serverless cold start would
+pay it, with the modules taking longer and whether the optional heavy ones were imported.
+
+    python -m performance.benchmark_import [runs] [top]
+"""
+import subprocess
+import sys
+
+MODULE = "chillapi.api"
+OPTIONAL_MODULES = ["openapi_spec_validator", "flask_restplus", "pyarrow", "psycopg2", "inflect"]
+
+
+def import_times() -> dict:
+    """Cumulative microseconds per module, as `python -X importtime` reports them"""
+    check = f"import sys; print([m for m in {OPTIONAL_MODULES!r} if m in sys.modules])"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {MODULE}; {check}"], capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.replace("import time:", "", 1).split("|")
+        times[name.strip()] = int(cumulative_us)
+    times["__loaded__"] = result.stdout.strip()
+    return times
+
+
+def main(runs: int = 5, top: int = 10):
+    """
+
+    :param runs: int:  (Default value = 5)
+    :param top: int: modules listed  (Default value = 10)
+
+    """
+    runs_times = [import_times() for _ in range(runs)]
+    best = min(runs_times, key=lambda times: times[MODULE])
+    print(f"{MODULE}: {best[MODULE] / 1_000:8.1f} ms, best of {runs}")
+    print(f"optional modules imported: {best['__loaded__']}")
+
+    packages = {name: us for name, us in best.items() if not name.startswith(("__", "chillapi")) and "." not in name}
+    for name, us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"{name:>30}: {us / 1_000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
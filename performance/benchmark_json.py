@@ -0,0 +1,94 @@
+"""Serialization time of a GET list page with the Flask jsonify and the orjson encoders, from SQLAlchemy rows
+and from the rows converted by the table RowSerializer.
+
+    python -m performance.benchmark_json [rows] [repeat]
+"""
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from flask import Flask, json
+from sqlalchemy import DateTime, Integer, JSON, Numeric, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.engine.result import result_tuple
+
+from chillapi.database.serializer import RowSerializer
+from chillapi.http import json_encoder
+
+COLUMNS_MAP = {
+    "id": {"name": "id", "type": Integer()},
+    "uuid": {"name": "uuid", "type": UUID(as_uuid=True)},
+    "name": {"name": "name", "type": String()},
+    "price": {"name": "price", "type": Numeric()},
+    "attributes": {"name": "attributes", "type": JSON()},
+    "created_at": {"name": "created_at", "type": DateTime()},
+    "updated_at": {"name": "updated_at", "type": DateTime()},
+}
+
+
+def make_page(rows: int) -> dict:
+    """
+
+    :param rows: int:
+
+    """
+    make_row = result_tuple(list(COLUMNS_MAP.keys()))
+    now = datetime(2021, 5, 1, 10, 30, 15)
+    data = [
+        make_row(
+            (
+                i,
+                uuid.uuid4(),
+                f"Book {i}",
+                Decimal(f"{i}.99"),
+                {"en-US": f"Book {i}", "tags": ["novel", "paperback"]},
+                now - timedelta(days=i),
+                now,
+            )
+        )
+        for i in range(rows)
+    ]
+    return {"data": data, "_meta": {"order": {"field": ["id"], "direction": "asc"}, "size": {"limit": rows, "offset": 0}, "total_records": rows}}
+
+
+def main(rows: int = 1000, repeat: int = 50):
+    """
+
+    :param rows: int:  (Default value = 1000)
+    :param repeat: int:  (Default value = 50)
+
+    """
+    app = Flask(__name__)
+    page = make_page(rows)
+    serializer = RowSerializer(COLUMNS_MAP)
+
+    def rows_page():
+        """ """
+        return page
+
+    def serialized_page():
+        """ """
+        return {**page, **{"data": serializer.dicts(page["data"])}}
+
+    with app.test_request_context("/"):
+        results = []
+        for encoder in [json_encoder.JSON_ENCODER_FLASK, json_encoder.JSON_ENCODER_ORJSON]:
+            json_encoder.set_json_encoder(encoder)
+            for source, get_page in [("rows", rows_page), ("RowSerializer", serialized_page)]:
+                body = json_encoder.make_json_response(get_page()).get_data()
+                seconds = min(timeit.repeat(lambda: json_encoder.make_json_response(get_page()), number=1, repeat=repeat))
+                results.append((f"{encoder} + {source}", seconds, body))
+
+        baseline_seconds, baseline_body = results[0][1:]
+        for name, seconds, body in results:
+            same_document = json.loads(body) == json.loads(baseline_body)
+            print(
+                f"{name:>22}: {seconds * 1000:8.2f} ms per {rows} rows page, {baseline_seconds / seconds:4.1f}x, "
+                f"same document: {same_document}, same bytes: {body == baseline_body}"
+            )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
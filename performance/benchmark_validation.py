@@ -0,0 +1,67 @@
+"""Validation time of the GET list query parameters of a table: `openapi_schema_validator.validate` per parameter as
+it was done on every request, against the validators built once by the endpoint, with and without fastjsonschema.
+
+    python -m performance.benchmark_validation [columns] [repeat]
+"""
+import sys
+import timeit
+
+from openapi_schema_validator import validate
+
+from chillapi.swagger.utils import get_filter_schema, get_order_schema, get_size_schema
+from chillapi.swagger.validators import SchemaValidator
+
+
+def main(columns: int = 10, repeat: int = 2000):
+    """
+
+    :param columns: int: filtered columns of the request  (Default value = 10)
+    :param repeat: int:  (Default value = 2000)
+
+    """
+    filter_schema = get_filter_schema("Book").definitions()
+    order_schema = get_order_schema("Book").definitions()
+    size_schema = get_size_schema("Book").definitions()
+    parameters = [(filter_schema, {"op": "=", "value": f"{i}"}) for i in range(columns)]
+    parameters += [(order_schema, {"field": ["id"], "direction": "asc"}), (size_schema, {"limit": 100, "offset": 0})]
+
+    validators = {id(schema): SchemaValidator(schema) for schema in [filter_schema, order_schema, size_schema]}
+    jsonschema_validators = {id(schema): SchemaValidator(schema) for schema in [filter_schema, order_schema, size_schema]}
+    for validator in jsonschema_validators.values():
+        validator.fast_validator = None
+
+    def per_request():
+        """ """
+        for schema, value in parameters:
+            validate(value, schema)
+
+    def prebuilt(validators_by_schema):
+        """
+
+        :param validators_by_schema:
+
+        """
+
+        def run():
+            """ """
+            for schema, value in parameters:
+                validators_by_schema[id(schema)].validate(value)
+
+        return run
+
+    cases = [
+        ("validate per request", per_request),
+        ("prebuilt jsonschema", prebuilt(jsonschema_validators)),
+    ]
+    if validators[id(filter_schema)].fast_validator is not None:
+        cases.append(("prebuilt fastjsonschema", prebuilt(validators)))
+
+    baseline = None
+    for name, run in cases:
+        seconds = min(timeit.repeat(run, number=repeat, repeat=3)) / repeat
+        baseline = baseline or seconds
+        print(f"{name:>24}: {seconds * 1_000_000:8.1f} us per request with {columns} filters, {baseline / seconds:5.1f}x")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
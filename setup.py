@@ -27,7 +27,13 @@ setup(
         license = 'MIT',
         install_requires = reqs,
         extras_require = {
-                'testing': _test_reqs
+                'testing': _test_reqs,
+                'orjson': ['orjson>=3.9'],
+                'arrow': ['pyarrow>=3.0'],
+                'compression': ['brotli>=1.0', 'zstandard>=0.15'],
+                'binary': ['msgpack>=1.0', 'cbor2>=5.2'],
+                'fastjsonschema': ['fastjsonschema>=2.15'],
+                'streaming': ['ijson>=3.1'],
                 },
         tests_require = _test_reqs,
         test_suite = 'setup_tests',
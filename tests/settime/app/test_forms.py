@@ -0,0 +1,78 @@
+import unittest
+
+import simplejson
+from sqlalchemy import Boolean, DateTime, Float, Integer, JSON, String
+from wtforms.validators import Length, ValidationError
+
+from chillapi.app.forms import BatchFormValidator, create_form_class
+
+COLUMNS = {
+        'id':   {'nullable': False, 'type': Integer()},
+        'name': {'nullable': False, 'type': String(10)},
+        'note': {'nullable': True, 'type': String()},
+        'n':    {'nullable': True, 'type': Integer()},
+        'f':    {'nullable': True, 'type': Float()},
+        'j':    {'nullable': True, 'type': JSON()},
+        'd':    {'nullable': True, 'type': DateTime()},
+        'b':    {'nullable': False, 'type': Boolean()},
+        }
+ITEMS = [
+        {'id': 1, 'name': 'a', 'b': True},
+        {'id': 0, 'name': '', 'b': False},
+        {'id': 'x', 'name': 5, 'n': 'abc', 'f': 'zz', 'j': 'notjson', 'd': 'yesterday', 'b': 'no'},
+        {'id': None, 'name': None, 'j': '{"a":1}', 'd': '2020-01-01 10:00:00', 'b': 1},
+        {'name': 'x' * 20, 'j': {'a': 1}, 'n': 1.5, 'extra': 3, 'b': True, 'id': '7'},
+        {'id': 2, 'name': '   ', 'note': 0, 'b': True},
+        {},
+        ]
+
+
+def validate_forms(form_class, items):
+    rows = []
+    errors = {}
+    for i, item in enumerate(items):
+        form = form_class(data = item)
+        if not form.validate():
+            errors[i] = form.errors
+        rows.append(form.data)
+    return rows, errors
+
+
+def not_x(form, field):
+    if field.data == 'x':
+        raise ValidationError('x is not allowed')
+
+
+class BatchFormValidatorTest(unittest.TestCase):
+
+    def assertSameAsForms(self, form_class):
+        batch_validator = BatchFormValidator(form_class)
+        rows, errors = batch_validator.validate(ITEMS)
+        expected_rows, expected_errors = validate_forms(form_class, ITEMS)
+        self.assertEqual(rows, expected_rows)
+        self.assertEqual(simplejson.dumps(errors), simplejson.dumps(expected_errors))
+        return batch_validator
+
+
+    def testSameAsFormPerItem(self):
+        batch_validator = self.assertSameAsForms(create_form_class('Book', 'putList', COLUMNS, {}))
+        self.assertFalse(batch_validator.fallback)
+
+
+    def testCustomValidatorFallsBack(self):
+        form_class = create_form_class('Book', 'postList', COLUMNS, {'validators': {'name': [not_x]}})
+        batch_validator = self.assertSameAsForms(form_class)
+        self.assertTrue(batch_validator.fallback)
+
+
+    def testLengthValidator(self):
+        form_class = create_form_class('Book', 'putList', COLUMNS, {'validators': {'name': [Length(max = 10)]}})
+        batch_validator = self.assertSameAsForms(form_class)
+        self.assertFalse(batch_validator.fallback)
+
+
+    def testValidItems(self):
+        rows, errors = BatchFormValidator(create_form_class('Book', 'putList', COLUMNS, {})).validate(ITEMS[:1])
+        self.assertEqual(errors, {})
+        self.assertEqual(rows[0]['id'], 1)
+        self.assertEqual(rows[0]['name'], 'a')
@@ -0,0 +1,43 @@
+import os
+import pstats
+import tempfile
+import time
+import unittest
+
+import simplejson
+
+from chillapi.app.startup import StartupReport
+
+
+class StartupReportTest(unittest.TestCase):
+
+    def testNestedPhases(self):
+        report = StartupReport()
+        with report.phase('config'):
+            time.sleep(0.02)
+            with report.phase('reflection'):
+                time.sleep(0.05)
+        with report.phase('reflection'):
+            time.sleep(0.01)
+        report.count('tables', 3)
+        report.finish()
+
+        startup = report.to_dict()
+        self.assertGreaterEqual(startup['phases']['reflection'], 0.06)
+        self.assertLess(startup['phases']['config'], 0.05)
+        self.assertAlmostEqual(sum(startup['phases'].values()), startup['total'], places = 3)
+        self.assertEqual(startup['counts'], {'tables': 3})
+
+
+    def testWrite(self):
+        report = StartupReport(profile = True)
+        with report.phase('read_config'):
+            sorted(range(1000))
+        report.finish()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'api_startup')
+            report.write(path)
+            with open(f'{path}.json') as report_file:
+                self.assertEqual(simplejson.load(report_file)['phases'].keys(), {'read_config', 'other'})
+            self.assertGreater(pstats.Stats(f'{path}.prof').total_calls, 0)
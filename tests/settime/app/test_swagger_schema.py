@@ -0,0 +1,149 @@
+import gzip
+import unittest
+from unittest import mock
+
+from flask import Flask
+
+from chillapi.app.swagger_schema import Api, Resource, swagger
+from chillapi.http.compression import ResponseCompression
+
+
+class BookEndpoint(Resource):
+
+    def __init__(self, title: str):
+        self.title = title
+
+
+    @swagger.doc({'tags': ['book'], 'responses': {'200': {'description': 'A book'}}})
+    def get(self, id):
+        return {'id': id, 'title': self.title}
+
+
+class LazyResourceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.api = Api(self.app, api_spec_url = '/swagger')
+        self.load = mock.Mock(return_value = BookEndpoint)
+        self.api.add_lazy_resource(
+            self.load, ['GET'], '/read/book/<int:id>', endpoint = 'BookGetSingleEndpoint', resource_class_kwargs = {'title': 'Suspense'}
+        )
+        self.client = self.app.test_client()
+
+
+    def testLoadedOnFirstRequest(self):
+        self.load.assert_not_called()
+        self.assertNotIn('/read/book/{id}', self.api._swagger_object['paths'])
+
+        for _ in range(2):
+            response = self.client.get('/read/book/1')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json(), {'id': 1, 'title': 'Suspense'})
+        self.load.assert_called_once()
+        self.assertIn('get', self.api._swagger_object['paths']['/read/book/{id}'])
+
+        self.assertEqual(self.client.put('/read/book/1').status_code, 405)
+
+
+    def testLoadedForSwaggerDoc(self):
+        response = self.client.get('/swagger.json')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('/read/book/{id}', response.get_json()['paths'])
+        self.load.assert_called_once()
+
+        self.assertEqual(self.client.get('/read/book/1').status_code, 200)
+        self.load.assert_called_once()
+
+
+class SwaggerDocTest(unittest.TestCase):
+
+    def create_api(self, **kwargs):
+        app = Flask(__name__)
+        api = Api(app, api_spec_url = '/swagger', **kwargs)
+        api.add_resource(BookEndpoint, '/read/book/<int:id>', endpoint = 'BookGetSingleEndpoint', resource_class_kwargs = {'title': 'Suspense'})
+        return api, app.test_client()
+
+
+    def testSerializedOnce(self):
+        api, client = self.create_api()
+        with mock.patch.object(swagger, 'filter_swagger_doc', wraps = swagger.filter_swagger_doc) as filter_swagger_doc:
+            first = client.get('/swagger.json')
+            second = client.get('/swagger.json')
+            filter_swagger_doc.assert_called_once()
+        self.assertEqual(first.data, second.data)
+        self.assertIn('/read/book/{id}', first.get_json()['paths'])
+        self.assertFalse(first.headers['ETag'].startswith('W/'))
+
+        not_modified = client.get('/swagger.json', headers = {'If-None-Match': first.headers['ETag']})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.data, b'')
+
+        api.add_resource(BookEndpoint, '/read/novel/<int:id>', endpoint = 'NovelGetSingleEndpoint', resource_class_kwargs = {'title': 'Suspense'})
+        changed = client.get('/swagger.json', headers = {'If-None-Match': first.headers['ETag']})
+        self.assertEqual(changed.status_code, 200)
+        self.assertIn('/read/novel/{id}', changed.get_json()['paths'])
+
+
+    def testPrecompressed(self):
+        api, client = self.create_api(swagger_compression = ResponseCompression(['gzip']))
+        plain = client.get('/swagger.json')
+        self.assertNotIn('Content-Encoding', plain.headers)
+
+        compressed = client.get('/swagger.json', headers = {'Accept-Encoding': 'gzip'})
+        self.assertEqual(compressed.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(compressed.data), plain.data)
+        self.assertNotEqual(compressed.headers['ETag'], plain.headers['ETag'])
+        self.assertIn('Accept-Encoding', compressed.headers['Vary'])
+
+        not_modified = client.get('/swagger.json', headers = {'Accept-Encoding': 'gzip', 'If-None-Match': compressed.headers['ETag']})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(client.get('/swagger.json', headers = {'If-None-Match': compressed.headers['ETag']}).status_code, 200)
+
+
+    def testStrictDocPerAllowedOperations(self):
+        api, client = self.create_api(security_level = 'STRICT')
+        with mock.patch.object(swagger, 'auth', side_effect = lambda request_obj, endpoint, method: 'authorization' in request_obj.headers):
+            hidden = client.get('/swagger.json')
+            shown = client.get('/swagger.json', headers = {'authorization': 'Bearer aaa'})
+        self.assertEqual(hidden.get_json()['paths'], {})
+        self.assertIn('/read/book/{id}', shown.get_json()['paths'])
+        self.assertNotEqual(hidden.headers['ETag'], shown.headers['ETag'])
+        self.assertEqual(len(api.swagger_doc_cache._docs), 2)
+
+
+class DocDecoratorTest(unittest.TestCase):
+
+    def testMethodKeptWithoutParser(self):
+        def get(self, id):
+            return id
+
+        self.assertIs(swagger.doc({'tags': ['book']})(get), get)
+        self.assertEqual(get.__dict__['__swagger_operation_object'], {'tags': ['book']})
+
+
+    def testParserBuiltOnce(self):
+        @swagger.doc({'parameters': [{'name': 'limit', 'in': 'query', 'schema': {'type': 'integer'}}]})
+        def get(self, _parser):
+            return _parser.parse_args()
+
+        app = Flask(__name__)
+        with mock.patch.object(swagger, 'get_parser', wraps = swagger.get_parser) as get_parser:
+            for limit in (1, 2):
+                with app.test_request_context(f'/?limit={limit}'):
+                    self.assertEqual(get(None), {'limit': limit})
+            get_parser.assert_called_once()
+
+
+class SwaggerPathTest(unittest.TestCase):
+
+    def testConvertedOnRegistration(self):
+        swagger.extract_swagger_path.cache_clear()
+        app = Flask(__name__)
+        api = Api(app, api_spec_url = '/swagger')
+        api.add_resource(BookEndpoint, '/read/book/<int:id>', endpoint = 'BookGetSingleEndpoint', resource_class_kwargs = {'title': 'Suspense'})
+        misses = swagger.extract_swagger_path.cache_info().misses
+
+        with mock.patch.object(swagger, 'auth', return_value = True) as auth:
+            self.assertEqual(app.test_client().get('/read/book/1').status_code, 200)
+        self.assertEqual(auth.call_args.args[1], '/read/book/{id}')
+        self.assertEqual(swagger.extract_swagger_path.cache_info().misses, misses)
@@ -0,0 +1,199 @@
+import socketserver
+import tempfile
+import threading
+import time
+import unittest
+
+from unittest import mock
+
+from chillapi.cache.backends import DiskCacheBackend, RedisCacheBackend
+from chillapi.cache.resp import parse_redis_url
+
+
+class _FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Stand-in of a Redis server: plain strings, sets and pub/sub"""
+
+    def write(self, reply):
+        if reply is None:
+            self.wfile.write(b'$-1\r\n')
+        elif isinstance(reply, int):
+            self.wfile.write(b':%d\r\n' % reply)
+        elif isinstance(reply, str):
+            self.wfile.write(b'+%s\r\n' % reply.encode())
+        elif isinstance(reply, bytes):
+            self.wfile.write(b'$%d\r\n%s\r\n' % (len(reply), reply))
+        else:
+            self.wfile.write(b'*%d\r\n' % len(reply))
+            for item in reply:
+                self.write(item)
+
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def handle(self):
+        server = self.server
+        while True:
+            args = self.read_command()
+            if args is None:
+                return
+            name, args = args[0].decode().upper(), args[1:]
+            with server.lock:
+                if name == 'GET':
+                    self.write(server.data.get(args[0]))
+                elif name == 'SET':
+                    server.data[args[0]] = args[1]
+                    self.write('OK')
+                elif name == 'SADD':
+                    server.data.setdefault(args[0], set()).update(args[1:])
+                    self.write(1)
+                elif name == 'SMEMBERS':
+                    self.write(list(server.data.get(args[0], set())))
+                elif name == 'SCARD':
+                    self.write(len(server.data.get(args[0], set())))
+                elif name == 'DEL':
+                    self.write(sum(1 for key in args if server.data.pop(key, None) is not None))
+                elif name == 'EVAL':
+                    # the invalidation script: the keys in the index and the index
+                    keys = server.data.pop(args[2], set())
+                    for key in keys:
+                        server.data.pop(key, None)
+                    self.write(len(keys))
+                elif name == 'PEXPIRE':
+                    self.write(1)
+                elif name == 'PUBLISH':
+                    for subscriber in server.subscribers.get(args[0], []):
+                        subscriber.write([b'message', args[0], args[1]])
+                    self.write(len(server.subscribers.get(args[0], [])))
+                elif name == 'SUBSCRIBE':
+                    server.subscribers.setdefault(args[0], []).append(self)
+                    self.write([b'subscribe', args[0], 1])
+                else:
+                    self.wfile.write(b'-ERR unknown command\r\n')
+
+
+class _FakeRedisServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _FakeRedisHandler)
+        self.data = {}
+        self.subscribers = {}
+        self.lock = threading.Lock()
+
+
+class RedisCacheBackendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = _FakeRedisServer()
+        threading.Thread(target = self.server.serve_forever, daemon = True).start()
+        self.url = f'redis://127.0.0.1:{self.server.server_address[1]}/0'
+
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+    def testParseUrl(self):
+        self.assertEqual(
+                parse_redis_url('redis://:se%40cret@cache:6380/2'),
+                {'host': 'cache', 'port': 6380, 'password': 'se@cret', 'db': 2}
+                )
+
+
+    def testSharedStorage(self):
+        node_a = RedisCacheBackend(url = self.url, near_cache_ttl = 0)
+        node_b = RedisCacheBackend(url = self.url, near_cache_ttl = 0)
+        node_a.set('book', '1', {'id': 1}, 60)
+        self.assertEqual(node_b.get('book', '1'), {'id': 1})
+        self.assertEqual(node_b.stats('book')['entries'], 1)
+
+        node_b.invalidate('book')
+        self.assertIsNone(node_a.get('book', '1'))
+
+
+    def testInvalidationsArePublished(self):
+        node_a = RedisCacheBackend(url = self.url, near_cache_ttl = 60)
+        node_b = RedisCacheBackend(url = self.url, near_cache_ttl = 60)
+        node_a.set('book', '1', {'id': 1}, 60)
+        self.assertEqual(node_b.get('book', '1'), {'id': 1})
+        self.assertEqual(node_b.near_cache.stats('book')['entries'], 1)
+
+        time.sleep(0.2)  # wait for the listeners subscription
+        node_a.invalidate('book')
+        for _ in range(50):
+            if node_b.near_cache.stats('book')['entries'] == 0:
+                break
+            time.sleep(0.02)
+        self.assertIsNone(node_b.get('book', '1'))
+
+
+    def testSignedValues(self):
+        node_a = RedisCacheBackend(url = self.url, near_cache_ttl = 0, secret_key = 'secret')
+        node_a.set('book', '1', {'id': 1}, 60)
+        self.assertIsNone(RedisCacheBackend(url = self.url, near_cache_ttl = 0, secret_key = 'other').get('book', '1'))
+
+        key = b'chillapi:book:1'
+        self.server.data[key] = self.server.data[key].replace(b'id', b'ix')
+        self.assertIsNone(node_a.get('book', '1'))
+
+
+    def testFailOpen(self):
+        self.server.shutdown()
+        self.server.server_close()
+        backend = RedisCacheBackend(url = self.url, near_cache_ttl = 0)
+        backend.set('book', '1', {'id': 1}, 60)
+        self.assertIsNone(backend.get('book', '1'))
+
+
+class DiskCacheBackendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.backend = DiskCacheBackend(self.directory.name)
+
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+    def testSurvivesRestart(self):
+        with mock.patch('chillapi.cache.backends.time.time', return_value = 100):
+            self.backend.set('/reportQueryEndpoint', '{"year": 2021}', [{'total': 1}], 60)
+        with mock.patch('chillapi.cache.backends.time.time', return_value = 130):
+            restarted = DiskCacheBackend(self.directory.name)
+            self.assertEqual(restarted.get('/reportQueryEndpoint', '{"year": 2021}'), [{'total': 1}])
+            self.assertEqual(list(restarted.items('/reportQueryEndpoint')), [('{"year": 2021}', [{'total': 1}], 30)])
+        with mock.patch('chillapi.cache.backends.time.time', return_value = 161):
+            self.assertIsNone(restarted.get('/reportQueryEndpoint', '{"year": 2021}'))
+        self.assertEqual(restarted.stats('/reportQueryEndpoint')['entries'], 0)
+
+
+    def testMaxEntriesAndInvalidation(self):
+        for i in range(5):
+            self.backend.set('report', str(i), i, 60, max_entries = 3)
+        self.assertEqual(self.backend.stats('report')['entries'], 3)
+
+        self.backend.invalidate('report')
+        self.assertEqual(self.backend.stats('report')['entries'], 0)
+
+
+    def testPrunedOnlyOverTheLimit(self):
+        with mock.patch.object(self.backend, '_entry_files', wraps = self.backend._entry_files) as entry_files:
+            for i in range(110):
+                self.backend.set('report', str(i), i, 60, max_entries = 100)
+            self.backend.set('report', '0', 0, 60, max_entries = 100)
+            self.assertEqual(entry_files.call_count, 1)
+
+            self.backend.set('report', '110', 110, 60, max_entries = 100)
+            self.assertEqual(entry_files.call_count, 2)
+        self.assertEqual(self.backend.stats('report')['entries'], 100)
+        self.assertEqual(self.backend.get('report', '110'), 110)
@@ -0,0 +1,59 @@
+import unittest
+
+from unittest import mock
+
+from chillapi.cache.response import ResponseCache, ResponseCacheRegistry
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def testHitMiss(self):
+        cache = ResponseCache('book', ttl = 60, max_entries = 10)
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', {'id': 1})
+        self.assertEqual(cache.get('a'), {'id': 1})
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+
+    def testExpiration(self):
+        cache = ResponseCache('book', ttl = 10, max_entries = 10)
+        with mock.patch('chillapi.cache.backends.time.monotonic', return_value = 100):
+            cache.set('a', 1)
+        with mock.patch('chillapi.cache.backends.time.monotonic', return_value = 111):
+            self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['entries'], 0)
+
+
+    def testLeastRecentlyUsedEviction(self):
+        cache = ResponseCache('book', ttl = 60, max_entries = 2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+
+    def testRegistryInvalidation(self):
+        registry = ResponseCacheRegistry()
+        book = registry.register('book', 60, 10)
+        author = registry.register('author', 60, 10)
+        book.set('1', 1)
+        author.set('1', 1)
+        registry.invalidate(['book', 'not_cached_table'])
+        self.assertIsNone(book.get('1'))
+        self.assertEqual(author.get('1'), 1)
+        self.assertEqual(registry.stats()['book']['invalidations'], 1)
+        self.assertIsNone(registry.get('not_cached_table'))
+
+
+    def testInvalidatedByTables(self):
+        registry = ResponseCacheRegistry()
+        report = registry.register('/reportQueryEndpoint', 60, 10, invalidated_by = ['book', 'author'])
+        report.set('{}', [1])
+        registry.invalidate(['book_category'])
+        self.assertEqual(report.get('{}'), [1])
+        registry.invalidate(['author'])
+        self.assertIsNone(report.get('{}'))
@@ -0,0 +1,96 @@
+import threading
+import time
+import unittest
+
+from chillapi.cache.single_flight import SingleFlight
+
+
+class SingleFlightTest(unittest.TestCase):
+
+    def run_concurrently(self, single_flight: SingleFlight, fn, callers: int = 5):
+        results = []
+        threads = [threading.Thread(target = lambda: results.append(single_flight.do('key', fn))) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+
+    def testIdenticalCallsShareOneExecution(self):
+        calls = []
+        single_flight = SingleFlight(timeout = 5, copy = list)
+
+        def query():
+            calls.append(1)
+            time.sleep(0.2)
+            return ['row']
+
+        results = self.run_concurrently(single_flight, query)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([result for result, _shared in results], [['row']] * 5)
+        self.assertTrue(all(shared for _result, shared in results))
+        self.assertEqual(len({id(result) for result, _shared in results}), 5)
+        self.assertEqual(single_flight.stats(), {'in_flight': 0, 'leaders': 1, 'shared': 4, 'fallbacks': 0})
+
+
+    def testTimeoutFallsBackToOwnExecution(self):
+        calls = []
+        single_flight = SingleFlight(timeout = 0.05)
+
+        def query():
+            calls.append(1)
+            time.sleep(0.3)
+            return 'row'
+
+        results = self.run_concurrently(single_flight, query, callers = 3)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(single_flight.stats()['fallbacks'], 2)
+        self.assertEqual([result for result, _shared in results], ['row'] * 3)
+
+
+    def testLeaderFailure(self):
+        calls = []
+        single_flight = SingleFlight(timeout = 5)
+
+        def query():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.2)
+                raise RuntimeError('database gone')
+            return 'row'
+
+        results = []
+
+        def call():
+            try:
+                results.append(single_flight.do('key', query)[0])
+            except RuntimeError as e:
+                results.append(str(e))
+
+        threads = [threading.Thread(target = call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(results), ['database gone', 'row', 'row'])
+        self.assertEqual(single_flight.stats()['in_flight'], 0)
+
+
+    def testNotShareableResult(self):
+        calls = []
+        single_flight = SingleFlight(timeout = 5, shareable = lambda result: result == 200)
+
+        def query():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.2)
+                return 304
+            return 200
+
+        results = self.run_concurrently(single_flight, query, callers = 3)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(sorted(result for result, _shared in results), [200, 200, 304])
+        self.assertFalse(any(shared for _result, shared in results))
+        self.assertEqual(single_flight.stats()['fallbacks'], 2)
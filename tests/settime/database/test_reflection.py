@@ -0,0 +1,92 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from sqlalchemy import create_engine, inspect
+
+from chillapi.database.reflection import map_in_order, SnapshotInspector
+from chillapi.exceptions.api_manager import ConfigError, TableNotExist
+
+
+class SnapshotInspectorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dsn = f'sqlite:///{self.tmp.name}/test.db'
+        self.engine = create_engine(self.dsn)
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql('CREATE TABLE book (id INTEGER PRIMARY KEY, name VARCHAR(10) NOT NULL)')
+        self.path = os.path.join(self.tmp.name, 'reflection')
+
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmp.cleanup()
+
+
+    def snapshot_inspector(self, fingerprint = 'auto'):
+        return SnapshotInspector(inspect(self.engine), self.dsn, 'main', self.path, fingerprint)
+
+
+    def testWarmStartSkipsTheInspector(self):
+        cold = self.snapshot_inspector()
+        columns = cold.get_columns('book')
+        self.assertEqual(cold.get_table_names(), ['book'])
+        self.assertFalse(cold.has_table('author'))
+        cold.save()
+
+        warm = self.snapshot_inspector()
+        with mock.patch.object(warm, 'inspector', wraps = warm.inspector) as inspector:
+            self.assertEqual(warm.get_table_names(), ['book'])
+            self.assertEqual([c['name'] for c in warm.get_columns('book')], [c['name'] for c in columns])
+            self.assertEqual(warm.get_columns('book')[1]['type'].length, 10)
+            self.assertFalse(warm.has_table('author'))
+            inspector.get_columns.assert_not_called()
+            inspector.get_table_names.assert_not_called()
+            inspector.has_table.assert_not_called()
+        self.assertFalse(warm.changed)
+
+
+    def testSchemaChangeRefreshes(self):
+        cold = self.snapshot_inspector()
+        cold.get_columns('book')
+        cold.save()
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql('ALTER TABLE book ADD COLUMN asin VARCHAR(10)')
+
+        refreshed = self.snapshot_inspector()
+        self.assertNotEqual(refreshed.fingerprint, cold.fingerprint)
+        self.assertEqual([c['name'] for c in refreshed.get_columns('book')], ['id', 'name', 'asin'])
+
+
+    def testAlembicFingerprint(self):
+        with self.assertRaises(ConfigError):
+            self.snapshot_inspector('alembic')
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql('CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)')
+            connection.exec_driver_sql("INSERT INTO alembic_version VALUES ('ae1027a6acf')")
+        self.assertEqual(self.snapshot_inspector().fingerprint, 'alembic:ae1027a6acf')
+        self.assertTrue(self.snapshot_inspector('catalog').fingerprint.startswith('catalog:'))
+
+
+class MapInOrderTest(unittest.TestCase):
+
+    def testResultsInOrder(self):
+        def slow_square(i):
+            time.sleep((5 - i) * 0.01)
+            return i * i
+
+        self.assertEqual(map_in_order(slow_square, range(6), 4), [0, 1, 4, 9, 16, 25])
+        self.assertEqual(map_in_order(slow_square, range(6)), [0, 1, 4, 9, 16, 25])
+
+
+    def testFirstErrorInOrder(self):
+        def check(name):
+            # the later table fails first
+            time.sleep(0.05 if name == 'author' else 0)
+            raise TableNotExist(f'Table {name} do not exist!')
+
+        with self.assertRaisesRegex(TableNotExist, 'author'):
+            map_in_order(check, ['author', 'book'], 2)
@@ -0,0 +1,83 @@
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask import Flask, json
+from sqlalchemy import Date, DateTime, Integer, JSON, Numeric, String
+from sqlalchemy.engine.result import result_tuple
+from sqlalchemy.types import NullType
+
+from chillapi.database.serializer import PYARROW_AVAILABLE, RowSerializer
+
+COLUMNS_MAP = {
+        'id': {'name': 'id', 'type': Integer()},
+        'name': {'name': 'name', 'type': JSON()},
+        'asin': {'name': 'asin', 'type': String()},
+        'price': {'name': 'price', 'type': Numeric()},
+        'published': {'name': 'published', 'type': Date()},
+        'updated_at': {'name': 'updated_at', 'type': DateTime()},
+        'unknown': {'name': 'unknown', 'type': NullType()},
+        }
+
+app = Flask(__name__)
+
+
+class RowSerializerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.serializer = RowSerializer(COLUMNS_MAP)
+        self.rows = [
+                result_tuple(list(COLUMNS_MAP.keys()))(
+                        (1, {'en-US': 'It'}, 'X23XX', Decimal('9.90'), date(1986, 9, 15), datetime(2021, 5, 1, 10, 30, 15), 'a')
+                        ),
+                result_tuple(list(COLUMNS_MAP.keys()))((2, None, None, None, None, None, None)),
+                ]
+
+
+    def testOnlyDateColumnsAreConverted(self):
+        self.assertEqual(self.serializer.columns, list(COLUMNS_MAP.keys()))
+        self.assertEqual([c is not None for c in self.serializer.converters], [False, False, False, False, True, True, False])
+
+
+    def testSameDocumentAsRows(self):
+        with app.app_context():
+            self.assertEqual(json.dumps(self.serializer.dicts(self.rows)), json.dumps(self.rows))
+
+
+    def testLists(self):
+        self.assertEqual(
+                self.serializer.lists(self.rows[:1]),
+                [[1, {'en-US': 'It'}, 'X23XX', Decimal('9.90'), 'Mon, 15 Sep 1986 00:00:00 GMT', 'Sat, 01 May 2021 10:30:15 GMT', 'a']]
+                )
+        self.assertEqual(self.serializer.lists(self.rows[1:]), [[2, None, None, None, None, None, None]])
+
+
+    @unittest.skipIf(not PYARROW_AVAILABLE, 'pyarrow is not installed')
+    def testArrowIpc(self):
+        import pyarrow.ipc
+
+        table = pyarrow.ipc.open_stream(self.serializer.arrow_ipc(self.rows, {'total_records': 2})).read_all()
+        self.assertEqual(table.column_names, list(COLUMNS_MAP.keys()))
+        self.assertEqual(table.schema.metadata, {b'chillapi': b'{"total_records": 2}'})
+        self.assertEqual(table.column('name').to_pylist(), ['{"en-US": "It"}', None])
+        self.assertEqual(table.column('updated_at').to_pylist(), [datetime(2021, 5, 1, 10, 30, 15), None])
+        self.assertEqual(table.column('price').to_pylist(), [Decimal('9.90'), None])
+
+
+    def testCsvChunks(self):
+        chunks = list(self.serializer.csv([self.rows[:1], self.rows[1:]]))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(
+                b''.join(chunks).decode(),
+                'id,name,asin,price,published,updated_at,unknown\r\n'
+                '1,"{""en-US"": ""It""}",X23XX,9.90,"Mon, 15 Sep 1986 00:00:00 GMT","Sat, 01 May 2021 10:30:15 GMT",a\r\n'
+                '2,,,,,,\r\n'
+                )
+
+
+    def testNdjsonChunks(self):
+        with app.app_context():
+            chunks = list(self.serializer.ndjson([self.rows, []]))
+            self.assertEqual(chunks[1], b'')
+            lines = chunks[0].decode().splitlines()
+            self.assertEqual([json.loads(line) for line in lines], json.loads(json.dumps(self.rows)))
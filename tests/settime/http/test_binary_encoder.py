@@ -0,0 +1,70 @@
+import unittest
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from flask import Flask, json
+from sqlalchemy.engine.result import result_tuple
+from werkzeug.exceptions import BadRequest
+
+from chillapi.http import binary_encoder
+from chillapi.swagger.http import ResourceResponse
+
+app = Flask(__name__)
+
+ROW = result_tuple(['id', 'uuid', 'price', 'name', 'updated_at', 'birthday'])(
+        (1, uuid.UUID('6b3a2d0e-8d4b-4c38-9c5e-5b8f0c2d1a10'), Decimal('10.5'), {'en-US': 'It'}, datetime(2021, 5, 1, 10, 30, 15), date(1947, 9, 21))
+        )
+DATA = {'data': [ROW], '_meta': {'total_records': 1}}
+
+
+@unittest.skipIf(binary_encoder.msgpack is None, 'msgpack is not installed')
+class MessagePackTest(unittest.TestCase):
+
+    def testSameDocumentAsJson(self):
+        with app.app_context():
+            body = binary_encoder.dumps(binary_encoder.MIMETYPE_MSGPACK, DATA)
+            self.assertEqual(binary_encoder.loads(binary_encoder.MIMETYPE_MSGPACK, body), json.loads(json.dumps(DATA)))
+
+
+    def testRequestData(self):
+        body = binary_encoder.msgpack.packb([{'id': 1, 'name': 'It'}])
+        for mimetype in [binary_encoder.MIMETYPE_MSGPACK, binary_encoder.MIMETYPE_X_MSGPACK]:
+            with app.test_request_context('/', method = 'PUT', data = body, content_type = mimetype):
+                self.assertEqual(binary_encoder.get_request_data(), [{'id': 1, 'name': 'It'}])
+        with app.test_request_context('/', method = 'PUT', data = b'\xc1', content_type = binary_encoder.MIMETYPE_MSGPACK):
+            with self.assertRaises(BadRequest):
+                binary_encoder.get_request_data()
+        with app.test_request_context('/', method = 'PUT', json = [{'id': 1}]):
+            self.assertEqual(binary_encoder.get_request_data(), [{'id': 1}])
+
+
+    def testNegotiatedResponse(self):
+        response = ResourceResponse()
+        response.response = DATA
+        response.set_body_etag()
+        with app.test_request_context('/', headers = {'Accept': binary_encoder.MIMETYPE_MSGPACK}):
+            flask_response = response.make_response()
+            self.assertEqual(flask_response.mimetype, binary_encoder.MIMETYPE_MSGPACK)
+            self.assertIn('Accept', flask_response.vary)
+            self.assertNotEqual(flask_response.get_etag()[0], response.etag)
+            self.assertEqual(binary_encoder.msgpack.unpackb(flask_response.get_data())['_meta'], {'total_records': 1})
+            msgpack_etag = flask_response.get_etag()[0]
+        with app.test_request_context('/', headers = {'Accept': binary_encoder.MIMETYPE_MSGPACK, 'If-None-Match': f'"{msgpack_etag}"'}):
+            self.assertEqual(response.make_response().status_code, 304)
+        with app.test_request_context('/', headers = {'Accept': binary_encoder.MIMETYPE_MSGPACK, 'If-None-Match': f'"{response.etag}"'}):
+            self.assertEqual(response.make_response().status_code, 200)
+        with app.test_request_context('/'):
+            self.assertEqual(response.make_response().mimetype, 'application/json')
+
+
+@unittest.skipIf(binary_encoder.cbor2 is None, 'cbor2 is not installed')
+class CborTest(unittest.TestCase):
+
+    def testNativeTypes(self):
+        document = binary_encoder.loads(binary_encoder.MIMETYPE_CBOR, binary_encoder.dumps(binary_encoder.MIMETYPE_CBOR, DATA))
+        row = document['data'][0]
+        self.assertEqual(row['uuid'], ROW.uuid)
+        self.assertEqual(row['price'], Decimal('10.5'))
+        self.assertEqual(row['updated_at'], datetime(2021, 5, 1, 10, 30, 15, tzinfo = timezone.utc))
+        self.assertEqual(row['name'], {'en-US': 'It'})
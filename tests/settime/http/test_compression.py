@@ -0,0 +1,97 @@
+import gzip
+import unittest
+import zlib
+
+from flask import Flask, Response
+
+from chillapi.exceptions.api_manager import ConfigError
+from chillapi.http import compression
+
+BODY = b'{"data": [' + b','.join([b'{"id": %d, "name": "Book %d"}' % (i, i) for i in range(200)]) + b']}'
+
+app = Flask(__name__)
+config = {'enable': True, 'encodings': ['br', 'zstd', 'gzip'], 'min_size': 1024, 'level': {'gzip': 6, 'br': 4, 'zstd': 3}}
+response_compression = compression.register_compression(app, config)
+
+
+@app.route('/buffered')
+def buffered():
+    response = Response(BODY, mimetype = 'application/json')
+    response.set_etag('abc')
+    return response
+
+
+@app.route('/small')
+def small():
+    return Response(b'{}', mimetype = 'application/json')
+
+
+@app.route('/image')
+def image():
+    return Response(BODY, mimetype = 'image/png')
+
+
+@app.route('/streamed')
+def streamed():
+    return Response((BODY[i:i + 500] for i in range(0, len(BODY), 500)), mimetype = 'text/csv')
+
+
+def decompress(encoding, data):
+    if encoding == 'gzip':
+        return gzip.decompress(data)
+    if encoding == 'br':
+        return compression.brotli.decompress(data)
+    return compression.zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+class ResponseCompressionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = app.test_client()
+
+
+    def testBuffered(self):
+        for encoding in compression.get_available_encodings():
+            response = self.client.get('/buffered', headers = {'Accept-Encoding': encoding})
+            self.assertEqual(response.headers['Content-Encoding'], encoding)
+            self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+            self.assertEqual(response.headers['ETag'], 'W/"abc"')
+            self.assertEqual(int(response.headers['Content-Length']), len(response.data))
+            self.assertEqual(decompress(encoding, response.data), BODY)
+
+
+    def testPreference(self):
+        response = self.client.get('/buffered', headers = {'Accept-Encoding': 'gzip, br;q=0.5'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        response = self.client.get('/buffered', headers = {'Accept-Encoding': '*'})
+        self.assertEqual(response.headers['Content-Encoding'], compression.get_available_encodings()[0])
+
+
+    def testNotCompressed(self):
+        response = self.client.get('/buffered')
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(response.data, BODY)
+        self.assertNotIn('Content-Encoding', self.client.get('/small', headers = {'Accept-Encoding': 'gzip'}).headers)
+        response = self.client.get('/image', headers = {'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertNotIn('Vary', response.headers)
+
+
+    def testStreamed(self):
+        response = self.client.get('/streamed', headers = {'Accept-Encoding': 'gzip'}, buffered = False)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertNotIn('Content-Length', response.headers)
+        chunks = list(response.response)
+        response.close()
+        # every chunk is flushed, the first one decodes without the rest
+        self.assertEqual(zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(chunks[0]), BODY[:500])
+        self.assertEqual(gzip.decompress(b''.join(chunks)), BODY)
+
+
+    def testUnknownEncoding(self):
+        with self.assertRaises(ConfigError):
+            compression.ResponseCompression(['deflate'])
+
+
+    def testDisabled(self):
+        self.assertIsNone(compression.register_compression(Flask(__name__), {**config, 'enable': False}))
@@ -0,0 +1,55 @@
+import unittest
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from flask import Flask, jsonify
+from sqlalchemy.engine.result import result_tuple
+
+from chillapi.exceptions.api_manager import ConfigError
+from chillapi.http import json_encoder
+
+app = Flask(__name__)
+
+
+@unittest.skipIf(json_encoder.orjson is None, 'orjson is not installed')
+class JsonEncoderTest(unittest.TestCase):
+
+    def tearDown(self):
+        json_encoder.set_json_encoder(json_encoder.JSON_ENCODER_AUTO)
+
+
+    def testSameDocumentAsJsonify(self):
+        row = result_tuple(['id', 'uuid', 'price', 'name', 'created_at', 'updated_at', 'birthday'])
+        data = {
+                'data': [
+                        row((
+                                1,
+                                uuid.UUID('6b3a2d0e-8d4b-4c38-9c5e-5b8f0c2d1a10'),
+                                Decimal('10.10'),
+                                {'en-US': 'Suspense'},
+                                datetime(2021, 5, 1, 10, 30, 15, 123),
+                                datetime(2021, 5, 1, 12, 30, 15, tzinfo = timezone(timedelta(hours = 2))),
+                                date(1947, 9, 21),
+                                ))
+                        ],
+                '_meta': {'total_records': 1},
+                }
+        with app.test_request_context('/'):
+            json_encoder.set_json_encoder(json_encoder.JSON_ENCODER_ORJSON)
+            response = json_encoder.make_json_response(data, 200)
+            self.assertEqual(response.get_data(), jsonify(data).get_data())
+            self.assertEqual(response.mimetype, 'application/json')
+            self.assertIn(b'"price":10.10', response.get_data())
+
+
+    def testFallbackToJsonify(self):
+        with app.test_request_context('/'):
+            response = json_encoder.make_json_response({'big': 2 ** 70}, 404)
+            self.assertEqual(response.status_code, 404)
+            self.assertEqual(response.get_data(), b'{"big":1180591620717411303424}\n')
+
+
+    def testUnknownEncoder(self):
+        with self.assertRaises(ConfigError):
+            json_encoder.set_json_encoder('ujson')
@@ -0,0 +1,43 @@
+import io
+import unittest
+
+from flask import Flask, request
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from chillapi.http.limits import BodyLimits
+
+app = Flask(__name__)
+
+
+class BodyLimitsTest(unittest.TestCase):
+
+    def testContentLength(self):
+        with app.test_request_context('/', method = 'PUT', data = b'[1, 2, 3]', content_type = 'application/json'):
+            with self.assertRaises(RequestEntityTooLarge):
+                BodyLimits(max_body_size = 8).check_request()
+        with app.test_request_context('/', method = 'PUT', data = b'[1, 2, 3]', content_type = 'application/json'):
+            BodyLimits(max_body_size = 9).check_request()
+            self.assertEqual(request.json, [1, 2, 3])
+
+
+    def testBodyWithoutContentLength(self):
+        environ = {'wsgi.input_terminated': True, 'CONTENT_LENGTH': ''}
+        with app.test_request_context('/', method = 'PUT', input_stream = io.BytesIO(b'[1, 2, 3]'), environ_overrides = environ):
+            BodyLimits(max_body_size = 8).check_request()
+            with self.assertRaises(RequestEntityTooLarge):
+                request.get_data()
+        with app.test_request_context('/', method = 'PUT', input_stream = io.BytesIO(b'[1, 2, 3]'), environ_overrides = environ):
+            BodyLimits(max_body_size = 9).check_request()
+            self.assertEqual(request.get_data(), b'[1, 2, 3]')
+
+
+    def testItems(self):
+        limits = BodyLimits(max_items = 2)
+        limits.check_items(2)
+        with self.assertRaises(RequestEntityTooLarge):
+            limits.check_items(3)
+        items = limits.limit_items(iter([1, 2, 3]))
+        self.assertEqual([next(items), next(items)], [1, 2])
+        with self.assertRaises(RequestEntityTooLarge):
+            next(items)
+        self.assertEqual(list(BodyLimits().limit_items(iter([1, 2, 3]))), [1, 2, 3])
@@ -0,0 +1,35 @@
+import unittest
+
+from flask import Flask
+from werkzeug.exceptions import BadRequest
+
+from chillapi.http import streaming
+
+app = Flask(__name__)
+
+
+@unittest.skipIf(streaming.ijson is None, 'ijson is not installed')
+class StreamingBodyTest(unittest.TestCase):
+
+    def testChunks(self):
+        body = b'[{"id": 1, "price": 1.5}, {"id": 2, "tags": ["a"]}, {"id": 3}, 4, null]'
+        with app.test_request_context('/', method = 'PUT', data = body, content_type = 'application/json'):
+            self.assertTrue(streaming.can_stream_request())
+            self.assertEqual(
+                    list(streaming.iter_request_chunks(2)),
+                    [[{'id': 1, 'price': 1.5}, {'id': 2, 'tags': ['a']}], [{'id': 3}, 4], [None]]
+                    )
+        with app.test_request_context('/', method = 'PUT', data = b' [ ] ', content_type = 'application/json'):
+            self.assertEqual(list(streaming.iter_request_chunks(2)), [])
+
+
+    def testInvalidBodies(self):
+        for body in [b'{"id": 1}', b'', b'[{"id": 1},', b'[{"id": }]']:
+            with app.test_request_context('/', method = 'PUT', data = body, content_type = 'application/json'):
+                with self.assertRaises(BadRequest):
+                    list(streaming.iter_request_chunks(2))
+
+
+    def testOnlyJsonBodies(self):
+        with app.test_request_context('/', method = 'PUT', data = b'\x91\x01', content_type = 'application/msgpack'):
+            self.assertFalse(streaming.can_stream_request())
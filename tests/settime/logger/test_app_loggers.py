@@ -0,0 +1,82 @@
+import io
+import logging
+import os
+import unittest
+
+import simplejson
+from flask import Flask
+
+from chillapi.logger import app_loggers
+from chillapi.logger.app_loggers import formatter, LogQueue, LogQueueHandler, set_logger_config, stop_log_queue
+
+
+class LogQueueTest(unittest.TestCase):
+
+    def testDropNewest(self):
+        log_queue = LogQueue(2, 'newest')
+        for item in range(3):
+            log_queue.offer(item)
+        self.assertEqual([log_queue.get_nowait(), log_queue.get_nowait()], [0, 1])
+        self.assertEqual(log_queue.dropped, 1)
+
+
+    def testDropOldest(self):
+        log_queue = LogQueue(2, 'oldest')
+        for item in range(3):
+            log_queue.offer(item)
+        self.assertEqual([log_queue.get_nowait(), log_queue.get_nowait()], [1, 2])
+        self.assertEqual(log_queue.dropped, 1)
+
+
+class QueuedLoggerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.handler = logging.StreamHandler(self.stream)
+        self.handler.setFormatter(formatter)
+        self.logger = logging.getLogger('chillapi_test_queue')
+        self.logger.addHandler(self.handler)
+
+
+    def tearDown(self):
+        stop_log_queue()
+        self.logger.removeHandler(self.handler)
+
+
+    def testWrittenByListener(self):
+        queue_config = {'enable': True, 'max_size': 100, 'drop': 'newest', 'flush_timeout': 5}
+        set_logger_config({'chillapi_test_queue': {'output': 'stdout', 'level': 10}, 'queue': queue_config})
+        self.assertIsInstance(self.logger.handlers[0], LogQueueHandler)
+
+        args = ['Suspense']
+        with Flask(__name__).test_request_context(headers = {'X-Request-Id': 'abc'}):
+            self.logger.info('Book %s', args)
+        args.append('Horror')
+        stop_log_queue()
+
+        self.assertIs(self.logger.handlers[0], self.handler)
+        self.assertIsNone(app_loggers.log_queue_listener)
+        record = simplejson.loads(self.stream.getvalue())
+        self.assertEqual(record['short_message'], "Book ['Suspense']")
+        self.assertEqual(record['_request_uuid'], 'abc')
+
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'fork is not available')
+    def testForkedProcessHasItsListener(self):
+        queue_config = {'enable': True, 'max_size': 100, 'drop': 'newest', 'flush_timeout': 5}
+        set_logger_config({'chillapi_test_queue': {'output': 'stdout', 'level': 10}, 'queue': queue_config})
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            for i in range(3):
+                self.logger.info(f'Book {i}')
+            stop_log_queue()
+            os.write(write_fd, self.stream.getvalue().encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd, 'rb') as child_output:
+            lines = child_output.read().decode().splitlines()
+        os.waitpid(pid, 0)
+        self.assertEqual([simplejson.loads(line)['short_message'] for line in lines], ['Book 0', 'Book 1', 'Book 2'])
@@ -0,0 +1,231 @@
+import hashlib
+import logging
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from flask import Flask, request
+
+from chillapi.app.swagger_schema import Api
+from chillapi.cache.response import ResponseCacheRegistry
+from chillapi.endpoints.sql import create_sql_endpoint_class
+from chillapi.http.binary_encoder import get_binary_mimetypes
+from chillapi.logger.app_loggers import logger
+from chillapi.swagger.http import AutomaticResource, ResourceResponse
+
+app = Flask(__name__)
+
+
+class ResourceResponseTest(unittest.TestCase):
+
+    def make_response(self, headers: dict, last_modified = None, method: str = 'GET'):
+        response = ResourceResponse()
+        response.response = {'id': 1, 'name': 'Suspense'}
+        with app.test_request_context('/', headers = headers, method = method):
+            if last_modified is None:
+                response.set_body_etag()
+            else:
+                response.set_validators(last_modified, 'page-1')
+            return response.make_response()
+
+
+    def testBodyEtag(self):
+        first = self.make_response({})
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers['ETag'], f'"{hashlib.sha1(first.data).hexdigest()}"')
+
+        not_modified = self.make_response({'If-None-Match': first.headers['ETag']})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.data, b'')
+        self.assertEqual(self.make_response({'If-None-Match': first.headers['ETag']}, method = 'POST').status_code, 200)
+
+
+    def testTimestampValidators(self):
+        updated_at = datetime(2021, 5, 1, 10, 30, 15, 123)
+        first = self.make_response({}, updated_at)
+        self.assertTrue(first.headers['ETag'].startswith('W/'))
+        self.assertEqual(first.headers['Last-Modified'], 'Sat, 01 May 2021 10:30:15 GMT')
+
+        self.assertEqual(self.make_response({'If-None-Match': first.headers['ETag']}, updated_at).status_code, 304)
+        self.assertEqual(self.make_response({'If-Modified-Since': first.headers['Last-Modified']}, updated_at).status_code, 304)
+
+        updated_later = updated_at + timedelta(seconds = 1)
+        self.assertEqual(self.make_response({'If-None-Match': first.headers['ETag']}, updated_later).status_code, 200)
+        self.assertEqual(self.make_response({'If-Modified-Since': first.headers['Last-Modified']}, updated_later).status_code, 200)
+
+
+    def testNotModifiedWithoutBody(self):
+        response = ResourceResponse()
+        response.set_validators(datetime(2021, 5, 1, 10, 30, 15), 'page-1')
+        response.http_code = 304
+        with app.test_request_context('/', headers = {'Accept': 'application/msgpack'}):
+            flask_response = response.make_response()
+            self.assertEqual(flask_response.status_code, 304)
+            self.assertEqual(flask_response.data, b'')
+            self.assertEqual(flask_response.headers['ETag'], f'W/"{response.get_negotiated_etag()}"')
+            self.assertEqual(flask_response.headers['Last-Modified'], 'Sat, 01 May 2021 10:30:15 GMT')
+
+
+    def testAwareTimestamp(self):
+        updated_at = datetime(2021, 5, 1, 12, 30, 15, tzinfo = timezone(timedelta(hours = 2)))
+        self.assertEqual(self.make_response({}, updated_at).headers['Last-Modified'], 'Sat, 01 May 2021 10:30:15 GMT')
+        self.assertEqual(self.make_response({}, '2021-05-01T10:30:15').headers['Last-Modified'], 'Sat, 01 May 2021 10:30:15 GMT')
+
+
+class BookEndpoint(AutomaticResource):
+
+    def request(self, **args) -> ResourceResponse:
+        response = ResourceResponse()
+        response.response = {'id': args['id']}
+        return response
+
+
+    def validate_request(self, **args):
+        return None
+
+
+class DebugSamplingTest(unittest.TestCase):
+
+    def process_request(self, level: int, debug_sample_rate: float):
+        is_enabled_for = lambda record_level: record_level >= level
+        with mock.patch.object(logger, 'isEnabledFor', side_effect = is_enabled_for), mock.patch.object(logger, 'debug') as debug:
+            with app.test_request_context('/read/book/1'):
+                response = BookEndpoint(debug_sample_rate = debug_sample_rate).process_request(id = 1)
+        self.assertEqual(response.get_json(), {'id': 1})
+        return debug
+
+
+    def testDebugLevel(self):
+        debug = self.process_request(logging.DEBUG, 1.0)
+        self.assertEqual([call.args[0] for call in debug.call_args_list], ['Request start', 'Validate request event trigger', 'Response finish'])
+        self.assertEqual(debug.call_args.kwargs['extra']['id'], 1)
+
+
+    def testNotBuiltOverDebugLevel(self):
+        self.process_request(logging.ERROR, 1.0).assert_not_called()
+
+
+    def testSampled(self):
+        with mock.patch('chillapi.swagger.http.random.random', return_value = 0.5):
+            self.process_request(logging.DEBUG, 0.1).assert_not_called()
+            self.assertEqual(self.process_request(logging.DEBUG, 0.6).call_count, 3)
+
+
+BOOKS = {}
+
+
+class CachedBookEndpoint(AutomaticResource):
+    db_table = {'name': 'book'}
+
+    def get(self, id):
+        return self.process_request(id = id)
+
+
+    def post(self, id):
+        return self.process_request(id = id)
+
+
+    def cache_key(self, **args) -> str:
+        return str(args['id'])
+
+
+    def request(self, **args) -> ResourceResponse:
+        response = ResourceResponse()
+        response.response = dict(BOOKS[args['id']])
+        response.set_body_etag()
+        return response
+
+
+    def validate_request(self, **args):
+        return None
+
+
+class RenameBookEndpoint(AutomaticResource):
+    db_table = {'name': 'book'}
+    invalidates = ['book']
+
+    def put(self, id):
+        return self.process_request(id = id, data = request.get_json())
+
+
+    def request(self, **args) -> ResourceResponse:
+        BOOKS[args['id']]['name'] = args['data']['name']
+        response = ResourceResponse()
+        response.response = {'message': 'Updated'}
+        return response
+
+
+    def validate_request(self, **args):
+        return None
+
+
+class CachedRequestTest(unittest.TestCase):
+
+    def setUp(self):
+        BOOKS.clear()
+        BOOKS[1] = {'id': 1, 'name': 'Suspense'}
+        self.registry = ResponseCacheRegistry()
+        self.cache = self.registry.register('book', 60, 10)
+        self.app = Flask(__name__)
+        api = Api(self.app, api_spec_url = '/swagger')
+        api.add_resource(CachedBookEndpoint, '/read/book/<int:id>', resource_class_kwargs = {'response_cache': self.registry})
+        api.add_resource(RenameBookEndpoint, '/update/book/<int:id>', resource_class_kwargs = {'response_cache': self.registry})
+        self.client = self.app.test_client()
+
+
+    def testEncodedBodyCached(self):
+        first = self.client.get('/read/book/1')
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        key = 'cachedbookendpoint:1:application/json' if get_binary_mimetypes() else 'cachedbookendpoint:1'
+        self.assertIsInstance(self.cache.get(key).response, bytes)
+
+        BOOKS[1]['name'] = 'Not read from the store'
+        second = self.client.get('/read/book/1')
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(second.get_json(), {'id': 1, 'name': 'Suspense'})
+        self.assertEqual(second.headers['ETag'], first.headers['ETag'])
+        self.assertEqual(second.mimetype, 'application/json')
+
+        self.assertEqual(self.client.get('/read/book/1', headers = {'If-None-Match': first.headers['ETag']}).status_code, 304)
+
+
+    def testWriteInvalidatesCachedRead(self):
+        self.assertEqual(self.client.get('/read/book/1').get_json()['name'], 'Suspense')
+        self.assertEqual(self.client.get('/read/book/1').headers['X-Cache'], 'HIT')
+
+        self.assertEqual(self.client.put('/update/book/1', json = {'name': 'Vertigo'}).status_code, 200)
+
+        read = self.client.get('/read/book/1')
+        self.assertEqual(read.headers['X-Cache'], 'MISS')
+        self.assertEqual(read.get_json(), {'id': 1, 'name': 'Vertigo'})
+
+
+    def testWriteMethodNotCached(self):
+        self.client.get('/read/book/1')
+        BOOKS[1]['name'] = 'Vertigo'
+        posted = self.client.post('/read/book/1')
+        self.assertNotIn('X-Cache', posted.headers)
+        self.assertEqual(posted.get_json()['name'], 'Vertigo')
+
+
+    def testSqlWriteInvalidatesCachedQuery(self):
+        repository = mock.Mock()
+        repository.execute.side_effect = lambda sql, query: mock.Mock(fetchall = lambda: list(BOOKS.values()))
+        read = create_sql_endpoint_class('books', 'GET', '/sql/books', 'select * from book', repository, [], [], description = 'Books', cached = True)
+        rename = create_sql_endpoint_class(
+            'rename', 'POST', '/sql/rename', 'update book set name = :name', repository, [], [], description = 'Rename', invalidates = ['book']
+        )
+        self.registry.register(read.cache_name, 60, 10, invalidated_by = ['book'])
+        api = Api(Flask(__name__), api_spec_url = '/swagger')
+        for resource in (read, rename):
+            api.add_resource(resource, resource.route, endpoint = resource.endpoint, resource_class_kwargs = {'response_cache': self.registry})
+        client = api.app.test_client()
+
+        self.assertEqual(client.get('/sql/books').headers['X-Cache'], 'MISS')
+        self.assertEqual(client.get('/sql/books').headers['X-Cache'], 'HIT')
+        BOOKS[1]['name'] = 'Vertigo'
+        self.assertNotIn('X-Cache', client.post('/sql/rename', json = {'name': 'Vertigo'}).headers)
+
+        books = client.get('/sql/books')
+        self.assertEqual(books.headers['X-Cache'], 'MISS')
+        self.assertEqual(books.get_json(), [{'id': 1, 'name': 'Vertigo'}])
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from chillapi.swagger import spec
+
+VALID = spec.dumps_spec({'openapi': '3.0.0', 'info': {'title': 'api', 'version': '0.1'}, 'paths': {}})
+INVALID = spec.dumps_spec({'openapi': '3.0.0', 'info': {'title': 'api', 'version': '0.1', 'license': {}}, 'paths': {}})
+
+
+class ValidateSpecTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.verdict_path = os.path.join(self.tmp.name, 'api_swagger.validation.json')
+
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+
+    def testBundledMetaSchema(self):
+        self.assertEqual(spec.get_spec_errors(VALID), [])
+        errors = spec.get_spec_errors(INVALID)
+        self.assertEqual(len(errors), 1)
+        self.assertIn("'name' is a required property", errors[0])
+
+
+    def testCachedVerdict(self):
+        errors = spec.validate_spec(INVALID, self.verdict_path)
+        self.assertEqual(len(errors), 1)
+        with mock.patch.object(spec, 'get_spec_errors', wraps = spec.get_spec_errors) as get_spec_errors:
+            self.assertEqual(spec.validate_spec(INVALID, self.verdict_path), errors)
+            get_spec_errors.assert_not_called()
+            self.assertEqual(spec.validate_spec(VALID, self.verdict_path), [])
+            self.assertEqual(spec.validate_spec(VALID, self.verdict_path, spec.SPEC_VALIDATION_ALWAYS), [])
+            self.assertEqual(get_spec_errors.call_count, 2)
+            self.assertEqual(spec.validate_spec(INVALID, self.verdict_path, spec.SPEC_VALIDATION_NEVER), [])
+            self.assertEqual(get_spec_errors.call_count, 2)
+
+
+    def testUnreadableVerdict(self):
+        with open(self.verdict_path, 'w') as verdict_file:
+            verdict_file.write('{"hash"')
+        self.assertEqual(len(spec.validate_spec(INVALID, self.verdict_path)), 1)
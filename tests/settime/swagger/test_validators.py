@@ -0,0 +1,63 @@
+import unittest
+
+from jsonschema.exceptions import ValidationError
+from openapi_schema_validator import validate
+
+from chillapi.swagger.utils import get_filter_schema, get_order_schema, get_size_schema
+from chillapi.swagger.validators import fastjsonschema, SchemaValidator
+
+SCHEMAS = [get_filter_schema('Book').definitions(), get_order_schema('Book').definitions(), get_size_schema('Book').definitions()]
+INSTANCES = [
+        {'op': '=', 'value': 'It'},
+        {'op': 'in', 'value': 'It'},
+        {'op': '='},
+        {'field': ['id'], 'direction': 'asc'},
+        {'field': 'id', 'direction': 'up'},
+        {'limit': 100, 'offset': 0},
+        {'limit': '100', 'offset': 0},
+        {'limit': 1.5, 'offset': True},
+        [],
+        'size',
+        None,
+        ]
+
+
+def error_message(validate_instance, instance):
+    try:
+        validate_instance(instance)
+    except ValidationError as e:
+        return e.message
+    return None
+
+
+class SchemaValidatorTest(unittest.TestCase):
+
+    def assertSameErrors(self, fast: bool):
+        for schema in SCHEMAS:
+            validator = SchemaValidator(schema)
+            if not fast:
+                validator.fast_validator = None
+            for instance in INSTANCES:
+                self.assertEqual(
+                        error_message(validator.validate, instance),
+                        error_message(lambda i: validate(i, schema), instance),
+                        f'{instance} against {schema}'
+                        )
+
+
+    def testSameErrorsAsOpenApiValidate(self):
+        self.assertSameErrors(fast = False)
+
+
+    @unittest.skipIf(fastjsonschema is None, 'fastjsonschema is not installed')
+    def testSameErrorsWithFastValidator(self):
+        self.assertIsNotNone(SchemaValidator(SCHEMAS[0]).fast_validator)
+        self.assertSameErrors(fast = True)
+
+
+    def testValidated(self):
+        validator = SchemaValidator(SCHEMAS[2])
+        default = {'limit': 100, 'offset': 0}
+        self.assertIs(validator.validated(default), default)
+        with self.assertRaises(ValidationError):
+            validator.validated({'limit': 100})
@@ -0,0 +1,13 @@
+import subprocess
+import sys
+import unittest
+
+OPTIONAL_MODULES = ['openapi_spec_validator', 'flask_restplus', 'pyarrow', 'psycopg2', 'inflect']
+
+
+class ImportGraphTest(unittest.TestCase):
+
+    def testOptionalModulesNotImported(self):
+        check = f'import sys, chillapi.api; print(",".join(m for m in {OPTIONAL_MODULES!r} if m in sys.modules))'
+        result = subprocess.run([sys.executable, '-c', check], capture_output = True, text = True, check = True)
+        self.assertEqual(result.stdout.strip(), '')